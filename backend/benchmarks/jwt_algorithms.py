@@ -0,0 +1,54 @@
+"""Sign/verify throughput of the supported JWT algorithms.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.jwt_algorithms [--seconds 2]
+"""
+import argparse
+import time
+
+from security.keys import generate_key_pair
+from src.core import security
+from src.core.config import settings
+
+ALGORITHMS = ["RS256", "PS256", "ES256", "EdDSA"]
+
+
+def _configure(algorithm: str) -> None:
+    private_pem, public_pem = generate_key_pair(algorithm)
+    settings.JWT_ALGORITHM = algorithm
+    settings.SECRET_KEY = private_pem
+    settings.PUBLIC_KEY = public_pem
+    settings.JWT_LEGACY_PUBLIC_KEY = ""
+    security.SECRET_JWK = None
+    security.PUBLIC_JWK = None
+    security._ensure_jwks()
+
+
+def _rate(fn, seconds: float) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="time budget per measurement")
+    args = parser.parse_args()
+
+    claims = {"uid": 42, "name": "Benchmark User", "typ": "access"}
+    print(f"{'algorithm':<10} {'sign/s':>10} {'verify/s':>10} {'token bytes':>12}")
+    for algorithm in ALGORITHMS:
+        _configure(algorithm)
+        token = security.create_access_token("bench@example.com", claims=claims)
+        sign_rate = _rate(lambda: security.create_access_token("bench@example.com", claims=claims), args.seconds)
+        verify_rate = _rate(lambda: security.decode_access_token(token), args.seconds)
+        print(f"{algorithm:<10} {sign_rate:>10.0f} {verify_rate:>10.0f} {len(token):>12}")
+
+
+if __name__ == "__main__":
+    main()
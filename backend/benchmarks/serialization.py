@@ -0,0 +1,117 @@
+"""Time to turn a page of task rows into a JSON response body.
+
+Compares, on rows already loaded from a throwaway SQLite database:
+
+- "jsonable+json": no response_model; FastAPI's `jsonable_encoder` and the
+  stdlib `json` module.
+- "response_model": what `/tasks/` did before, FastAPI validating the rows
+  against `Union[list[TaskPublic], list[TaskSummary]]` and dumping them.
+- "TypeAdapter": what it does now, `src.core.serialization.render` with the
+  view's own adapter.
+- "orjson": `orjson.dumps` of plain column dicts, with no validation at all,
+  for reference; only when orjson happens to be installed.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.serialization [--sizes 100 1000 10000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Union
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.core.serialization import render
+from src.models.task import Priority, Task, TaskPublic, TaskSummary
+from src.models.userinfo import UserInfo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _build(path: Path, rows: int):
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(UserInfo), [{"id": 1, "email": "bench@example.com", "full_name": "Bench",
+                                         "hashed_password": "x", "last_login": now, "created_at": now,
+                                         "updated_at": now}])
+        conn.execute(insert(Task), [
+            {
+                "user_id": 1,
+                "title": f"task {i}",
+                "description": "benchmark " * 8,
+                "priority": list(Priority)[i % 3],
+                "due_date": f"2026-{i % 12 + 1:02}-01",
+                "created_at": now,
+                "updated_at": now - timedelta(seconds=i),
+            }
+            for i in range(rows)
+        ])
+    return engine
+
+
+def _median_ms(fn, repeat: int) -> tuple[float, int]:
+    size = len(fn())  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return 1000 * statistics.median(samples), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    field = create_model_field(
+        name="Response_read_tasks", type_=Union[list[TaskPublic], list[TaskSummary]], mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+    columns = [getattr(Task, name) for name in TaskPublic.model_fields]
+
+    def response_model(rows):
+        return loop.run_until_complete(
+            serialize_response(field=field, response_content=rows, exclude_unset=True, dump_json=True)
+        )
+
+    strategies = {
+        "jsonable+json": lambda rows, _: json.dumps(jsonable_encoder(rows)).encode(),
+        "response_model": lambda rows, _: response_model(rows),
+        "TypeAdapter": lambda rows, _: render(list[TaskPublic], rows),
+    }
+    if orjson is not None:
+        strategies["orjson"] = lambda _, tuples: orjson.dumps([t._asdict() for t in tuples], option=orjson.OPT_UTC_Z)
+
+    print(f"{'rows':>6} {'KiB':>7} " + " ".join(f"{name + ' ms':>17}" for name in strategies))
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            engine = _build(Path(tmp) / f"serialization_{size}.db", size)
+            with Session(engine) as session:
+                rows = session.exec(select(Task)).all()
+                tuples = session.exec(select(*columns)).all()
+                results = [_median_ms(lambda: fn(rows, tuples), args.repeat) for fn in strategies.values()]
+            engine.dispose()
+            kib = results[2][1] / 1024
+            print(f"{size:>6} {kib:>7.0f} " + " ".join(f"{ms:>17.2f}" for ms, _ in results))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
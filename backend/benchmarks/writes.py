@@ -0,0 +1,119 @@
+"""Round trips and latency of task writes, before and after RETURNING.
+
+The old handlers read the row, changed it, committed and refreshed it; the
+new ones run one owner-scoped UPDATE/DELETE ... RETURNING (see
+`src.services.writes`). Each strategy runs on a throwaway SQLite database
+with `--rtt-ms` of sleep added per statement to stand in for the network
+hop to a real database server.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.writes [--rtt-ms 0.5] [--repeat 200]
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import event, insert
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+from src.services.writes import delete_owned, update_owned
+
+USER_ID = 1
+
+
+def _build(path: Path, rows: int):
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(UserInfo), [{"id": USER_ID, "email": "bench@example.com", "full_name": "Bench",
+                                         "hashed_password": "x", "last_login": now, "created_at": now,
+                                         "updated_at": now}])
+        conn.execute(insert(Task), [
+            {"id": i, "user_id": USER_ID, "title": f"task {i}", "created_at": now, "updated_at": now}
+            for i in range(1, rows + 1)
+        ])
+    return engine
+
+
+def _old_update(session: Session, task_id: int) -> None:
+    task = session.get(Task, task_id)
+    assert task is not None and task.user_id == USER_ID
+    task.completed = not task.completed
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+
+def _new_update(session: Session, task_id: int) -> None:
+    assert update_owned(session, Task, task_id, USER_ID, {"completed": task_id % 2 == 0}) is not None
+    session.commit()
+
+
+def _old_delete(session: Session, task_id: int) -> None:
+    task = session.get(Task, task_id)
+    assert task is not None and task.user_id == USER_ID
+    session.delete(task)
+    session.commit()
+
+
+def _new_delete(session: Session, task_id: int) -> None:
+    assert delete_owned(session, Task, task_id, USER_ID)
+    session.commit()
+
+
+def _run(engine, fn, ids: list[int], rtt: float) -> tuple[float, float]:
+    """Median ms per call and statements per call (including COMMIT)."""
+    statements = 0
+
+    def _round_trip(*args):
+        nonlocal statements
+        statements += 1
+        if rtt:
+            time.sleep(rtt)
+
+    event.listen(engine, "before_cursor_execute", _round_trip)
+    event.listen(engine, "commit", _round_trip)
+    samples = []
+    try:
+        for task_id in ids:
+            # A fresh session per call, like a request.
+            with Session(engine) as session:
+                start = time.perf_counter()
+                fn(session, task_id)
+                samples.append(time.perf_counter() - start)
+    finally:
+        event.remove(engine, "before_cursor_execute", _round_trip)
+        event.remove(engine, "commit", _round_trip)
+    return 1000 * statistics.median(samples), statements / len(ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    strategies = {
+        "update: get+commit+refresh": (_old_update, range(1, args.repeat + 1)),
+        "update: UPDATE RETURNING": (_new_update, range(1, args.repeat + 1)),
+        "delete: get+delete": (_old_delete, range(1, args.repeat + 1)),
+        "delete: DELETE RETURNING": (_new_delete, range(args.repeat + 1, 2 * args.repeat + 1)),
+    }
+    print(f"{'strategy':<28} {'round trips':>11} {'ms':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _build(Path(tmp) / "writes.db", 2 * args.repeat)
+        for name, (fn, ids) in strategies.items():
+            ms, round_trips = _run(engine, fn, list(ids), args.rtt_ms / 1000)
+            print(f"{name:<28} {round_trips:>11.1f} {ms:>8.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
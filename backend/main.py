@@ -1,18 +1,51 @@
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.routes import user_router, area_router, task_router, note_router, search_router
+from src.core.config import settings
+from src.core.invalidation import start_listener
+from src.core.pagination import NEXT_CURSOR_HEADER
+from src.core.security import shutdown_hash_executor
+from src.core.response_cache import ResponseCacheMiddleware
+from src.core.serialization import MsgPackMiddleware
+from src.routes import user_router, area_router, task_router, note_router, search_router, metrics_router, bootstrap_router, sync_router, export_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Hear about other workers' writes, so this worker's caches follow them.
+    listener = start_listener()
+    try:
+        yield
+    finally:
+        if listener is not None:
+            listener.stop()
+        # The bcrypt workers are spawned processes; don't leave them behind on reload or exit.
+        shutdown_hash_executor()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 API_PREFIX = "/api/v1"
 
+routers = [user_router, area_router, task_router, note_router, search_router, bootstrap_router, sync_router, export_router]
+if settings.ASYNC_DATABASE_URL:
+    # Serve the same handlers as async endpoints on the async engine.
+    from src.routes.aio import async_router
+
+    routers = [async_router(router) for router in routers]
+
 # Include routers
-app.include_router(user_router, prefix=API_PREFIX)
-app.include_router(area_router, prefix=API_PREFIX)
-app.include_router(task_router, prefix=API_PREFIX)
-app.include_router(note_router, prefix=API_PREFIX)
-app.include_router(search_router, prefix=API_PREFIX)
+for router in routers:
+    app.include_router(router, prefix=API_PREFIX)
+# Not under API_PREFIX, which the ingress exposes; scraped in-cluster with METRICS_TOKEN.
+app.include_router(metrics_router)
+
+# Inside the response cache, which stores each format separately.
+app.add_middleware(MsgPackMiddleware, prefix=API_PREFIX)
+# Inside CORS, so cached responses get CORS headers too.
+app.add_middleware(ResponseCacheMiddleware, prefix=API_PREFIX)
 
 # Configure CORS from environment variable `ALLOWED_ORIGINS` (comma-separated).
 # Do NOT default to wide-open origins in production.
@@ -28,6 +61,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
 
@@ -29,6 +29,18 @@ import os
 config.set_main_option("sqlalchemy.url", os.environ["DATABASE_URL"])
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Full-text search objects are managed by raw DDL (see src.services.search),
+    # not by the SQLModel metadata; keep autogenerate from dropping them.
+    if type_ == "table" and "_fts" in name:
+        return False
+    if type_ == "column" and name == "search_vector":
+        return False
+    if type_ == "index" and name.endswith("_search_vector"):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -47,6 +59,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -68,7 +81,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
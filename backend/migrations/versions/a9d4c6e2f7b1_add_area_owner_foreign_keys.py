@@ -0,0 +1,76 @@
+"""Add area owner foreign keys
+
+Revision ID: a9d4c6e2f7b1
+Revises: f3a7c1e9b5d2
+Create Date: 2026-10-16 22:05:41.318027
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4c6e2f7b1'
+down_revision: Union[str, Sequence[str], None] = 'f3a7c1e9b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['task', 'note']
+
+
+def _sqlite_table_objects(table: str) -> list[str]:
+    """DDL of the table's triggers and indexes.
+
+    SQLite can't add a constraint in place, so batch mode copies the table;
+    the copy loses the full-text triggers and expression indexes.
+    """
+    rows = op.get_bind().execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE tbl_name = :table AND type IN ('index', 'trigger') "
+                "AND sql IS NOT NULL"),
+        {'table': table},
+    )
+    return [sql.replace('CREATE INDEX ', 'CREATE INDEX IF NOT EXISTS ', 1) for (sql,) in rows]
+
+
+def _alter(table: str, change) -> None:
+    sqlite = op.get_bind().dialect.name == 'sqlite'
+    objects = _sqlite_table_objects(table) if sqlite else []
+    with op.batch_alter_table(table) as batch_op:
+        change(batch_op)
+    for sql in objects:
+        op.execute(sql)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgres = op.get_bind().dialect.name == 'postgresql'
+
+    # Rows already pointing at another user's area would violate the new key;
+    # take them out of that area instead.
+    for table in TABLES:
+        op.execute(
+            f"UPDATE {table} SET area_id = NULL "
+            f"WHERE area_id IS NOT NULL AND user_id IS NOT NULL AND NOT EXISTS "
+            f"(SELECT 1 FROM area WHERE area.id = {table}.area_id AND area.user_id = {table}.user_id)"
+        )
+
+    _alter('area', lambda batch_op: batch_op.create_unique_constraint('uq_area_id_user_id', ['id', 'user_id']))
+
+    for table in TABLES:
+        # NOT VALID skips the full-table check under an exclusive lock on
+        # Postgres; VALIDATE then scans while writes continue.
+        _alter(table, lambda batch_op: batch_op.create_foreign_key(
+            f'fk_{table}_area_owner', 'area', ['area_id', 'user_id'], ['id', 'user_id'],
+            postgresql_not_valid=True,
+        ))
+        if postgres:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT fk_{table}_area_owner")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        _alter(table, lambda batch_op: batch_op.drop_constraint(f'fk_{table}_area_owner', type_='foreignkey'))
+    _alter('area', lambda batch_op: batch_op.drop_constraint('uq_area_id_user_id', type_='unique'))
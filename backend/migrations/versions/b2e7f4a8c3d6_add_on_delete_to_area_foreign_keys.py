@@ -0,0 +1,70 @@
+"""Add ON DELETE to area foreign keys
+
+Revision ID: b2e7f4a8c3d6
+Revises: a9d4c6e2f7b1
+Create Date: 2026-10-16 23:12:08.640193
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7f4a8c3d6'
+down_revision: Union[str, Sequence[str], None] = 'a9d4c6e2f7b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['task', 'note']
+# Deleting an area keeps its tasks and notes, without an area.
+ON_DELETE = 'SET NULL'
+# Batch mode reflects SQLite's unnamed foreign keys under these names.
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def _sqlite_table_objects(table: str) -> list[str]:
+    """DDL of the table's triggers and indexes, which batch mode's table copy loses."""
+    rows = op.get_bind().execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE tbl_name = :table AND type IN ('index', 'trigger') "
+                "AND sql IS NOT NULL"),
+        {'table': table},
+    )
+    return [sql.replace('CREATE INDEX ', 'CREATE INDEX IF NOT EXISTS ', 1) for (sql,) in rows]
+
+
+def _replace_area_fk(table: str, old_name: str, new_name: str, ondelete: Union[str, None]) -> None:
+    dialect = op.get_bind().dialect.name
+    objects = _sqlite_table_objects(table) if dialect == 'sqlite' else []
+    with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(old_name, type_='foreignkey')
+        # NOT VALID: existing rows were already checked by the old key.
+        batch_op.create_foreign_key(
+            new_name, 'area', ['area_id'], ['id'], ondelete=ondelete, postgresql_not_valid=True
+        )
+    for sql in objects:
+        op.execute(sql)
+    if dialect == 'postgresql':
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {new_name}")
+
+
+def _current_area_fk(table: str) -> str:
+    # The initial schema left it unnamed: Postgres calls it <table>_area_id_fkey,
+    # batch mode on SQLite names it after NAMING_CONVENTION.
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys(table):
+        if fk['constrained_columns'] == ['area_id']:
+            return fk['name'] or f'fk_{table}_area_id_area'
+    raise RuntimeError(f"No area_id foreign key on {table}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        _replace_area_fk(table, _current_area_fk(table), f'fk_{table}_area_id', ON_DELETE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        _replace_area_fk(table, f'fk_{table}_area_id', f'{table}_area_id_fkey', None)
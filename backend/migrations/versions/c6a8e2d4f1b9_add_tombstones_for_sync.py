@@ -0,0 +1,41 @@
+"""Add tombstone table and area (user_id, updated_at) index for /sync
+
+Revision ID: c6a8e2d4f1b9
+Revises: b2e7f4a8c3d6
+Create Date: 2026-10-17 09:41:27.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6a8e2d4f1b9'
+down_revision: Union[str, Sequence[str], None] = 'b2e7f4a8c3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tombstone',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('entity', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user_info.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstone_user_id_deleted_at', 'tombstone', ['user_id', 'deleted_at'], unique=False)
+    op.create_index('ix_area_user_id_updated_at', 'area', ['user_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_area_user_id_updated_at', table_name='area')
+    op.drop_index('ix_tombstone_user_id_deleted_at', table_name='tombstone')
+    op.drop_table('tombstone')
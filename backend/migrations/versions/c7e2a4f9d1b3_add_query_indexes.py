@@ -0,0 +1,43 @@
+"""Add indexes matching list query shapes
+
+Revision ID: c7e2a4f9d1b3
+Revises: b3f1c9d2e4a7
+Create Date: 2026-10-16 14:37:09.218764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a4f9d1b3'
+down_revision: Union[str, Sequence[str], None] = 'b3f1c9d2e4a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_area_user_id', 'area', ['user_id']),
+    ('ix_task_area_id', 'task', ['area_id']),
+    ('ix_task_user_id_updated_at', 'task', ['user_id', 'updated_at']),
+    ('ix_task_user_id_area_id', 'task', ['user_id', 'area_id']),
+    ('ix_note_area_id', 'note', ['area_id']),
+    ('ix_note_user_id_updated_at', 'note', ['user_id', 'updated_at']),
+    ('ix_note_user_id_area_id', 'note', ['user_id', 'area_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while the indexes build on
+    # Postgres; it can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
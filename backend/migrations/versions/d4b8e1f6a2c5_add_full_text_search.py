@@ -0,0 +1,69 @@
+"""Add full-text search columns/tables for task and note
+
+Revision ID: d4b8e1f6a2c5
+Revises: c7e2a4f9d1b3
+Create Date: 2026-10-16 16:02:51.774310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8e1f6a2c5'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a4f9d1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors src.services.search.SEARCH_FIELDS.
+SEARCH_FIELDS = {
+    'task': ('title', 'description'),
+    'note': ('title', 'content'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table, columns in SEARCH_FIELDS.items():
+        cols = ', '.join(columns)
+        if dialect == 'postgresql':
+            vector = " || ' ' || ".join(f"coalesce({c}, '')" for c in columns)
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector('simple', {vector})) STORED"
+            )
+            op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)")
+        elif dialect == 'sqlite':
+            new_values = ', '.join(f"new.{c}" for c in columns)
+            old_values = ', '.join(f"old.{c}" for c in columns)
+            op.execute(f"CREATE VIRTUAL TABLE {table}_fts USING fts5({cols}, content='{table}', content_rowid='id')")
+            op.execute(
+                f"CREATE TRIGGER {table}_fts_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {table}_fts(rowid, {cols}) VALUES (new.id, {new_values}); END"
+            )
+            op.execute(
+                f"CREATE TRIGGER {table}_fts_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {table}_fts({table}_fts, rowid, {cols}) VALUES ('delete', old.id, {old_values}); END"
+            )
+            op.execute(
+                f"CREATE TRIGGER {table}_fts_au AFTER UPDATE ON {table} BEGIN "
+                f"INSERT INTO {table}_fts({table}_fts, rowid, {cols}) VALUES ('delete', old.id, {old_values}); "
+                f"INSERT INTO {table}_fts(rowid, {cols}) VALUES (new.id, {new_values}); END"
+            )
+            # Index the rows that already exist.
+            op.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table in reversed(list(SEARCH_FIELDS)):
+        if dialect == 'postgresql':
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+        elif dialect == 'sqlite':
+            for suffix in ('au', 'ad', 'ai'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
@@ -0,0 +1,61 @@
+"""Move the area delete action to the owner foreign keys
+
+Revision ID: d8f3b6a1c9e4
+Revises: c6a8e2d4f1b9
+Create Date: 2026-10-16 09:41:26.502174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3b6a1c9e4'
+down_revision: Union[str, Sequence[str], None] = 'c6a8e2d4f1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['task', 'note']
+
+
+def _replace_area_fks(table: str, drop: list[str], create: list[tuple[str, list[str], list[str], Union[str, None]]]) -> None:
+    for name in drop:
+        op.drop_constraint(name, table, type_='foreignkey')
+    for name, local, remote, ondelete in create:
+        # NOT VALID: existing rows were already checked by the old keys.
+        op.create_foreign_key(name, table, 'area', local, remote, ondelete=ondelete, postgresql_not_valid=True)
+    for name, *_ in create:
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        # SQLite can't name the column to null; it keeps the separate area_id key,
+        # which works there since it checks NO ACTION keys at the end of the statement.
+        return
+    # Postgres checks overlapping keys in trigger-name order: a NO ACTION owner
+    # key could reject the delete before the area_id key's SET NULL ran. The
+    # column list (Postgres 15+) keeps user_id.
+    for table in TABLES:
+        _replace_area_fks(
+            table,
+            drop=[f'fk_{table}_area_id', f'fk_{table}_area_owner'],
+            create=[(f'fk_{table}_area_owner', ['area_id', 'user_id'], ['id', 'user_id'], 'SET NULL (area_id)')],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in reversed(TABLES):
+        _replace_area_fks(
+            table,
+            drop=[f'fk_{table}_area_owner'],
+            create=[
+                (f'fk_{table}_area_owner', ['area_id', 'user_id'], ['id', 'user_id'], None),
+                (f'fk_{table}_area_id', ['area_id'], ['id'], 'SET NULL'),
+            ],
+        )
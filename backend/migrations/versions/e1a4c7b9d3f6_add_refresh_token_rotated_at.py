@@ -0,0 +1,29 @@
+"""Add refresh_token.rotated_at
+
+Revision ID: e1a4c7b9d3f6
+Revises: d8f3b6a1c9e4
+Create Date: 2026-10-17 10:05:12.384920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a4c7b9d3f6'
+down_revision: Union[str, Sequence[str], None] = 'd8f3b6a1c9e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('refresh_token', sa.Column('rotated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('refresh_token') as batch_op:
+        batch_op.drop_column('rotated_at')
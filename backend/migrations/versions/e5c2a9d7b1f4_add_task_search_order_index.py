@@ -0,0 +1,45 @@
+"""Add index matching the task search order
+
+Revision ID: e5c2a9d7b1f4
+Revises: d4b8e1f6a2c5
+Create Date: 2026-10-16 17:21:40.093512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c2a9d7b1f4'
+down_revision: Union[str, Sequence[str], None] = 'd4b8e1f6a2c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors src.models.task.TASK_SEARCH_ORDER. The planner matches the ORDER BY
+# to the index keys as parsed expressions, not as text, so the parentheses
+# Postgres needs around an expression key don't get in the way; the constants
+# must be the same literals in both.
+PRIORITY_ORDINAL = (
+    "(CASE WHEN (priority = 'HIGH') THEN 3 WHEN (priority = 'MEDIUM') THEN 2 "
+    "WHEN (priority = 'LOW') THEN 1 ELSE 0 END) DESC"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_task_user_id_search_order',
+            'task',
+            ['user_id', 'completed', sa.text(PRIORITY_ORDINAL), sa.text('(due_date IS NULL)'), 'due_date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_task_user_id_search_order', table_name='task', postgresql_concurrently=True)
@@ -0,0 +1,44 @@
+"""Extend list indexes for keyset paging
+
+Revision ID: f3a7c1e9b5d2
+Revises: e5c2a9d7b1f4
+Create Date: 2026-10-16 18:44:12.506387
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a7c1e9b5d2'
+down_revision: Union[str, Sequence[str], None] = 'e5c2a9d7b1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name, table, old columns, new columns
+INDEXES = [
+    ('ix_task_user_id_updated_at', 'task', ['user_id', 'updated_at'], ['user_id', 'updated_at', 'id']),
+    ('ix_task_user_id_area_id', 'task', ['user_id', 'area_id'], ['user_id', 'area_id', 'updated_at', 'id']),
+    ('ix_note_user_id_updated_at', 'note', ['user_id', 'updated_at'], ['user_id', 'updated_at', 'id']),
+    ('ix_note_user_id_area_id', 'note', ['user_id', 'area_id'], ['user_id', 'area_id', 'updated_at', 'id']),
+]
+
+
+def _recreate(name: str, table: str, columns: list[str]) -> None:
+    op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, columns in INDEXES:
+            _recreate(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, _ in reversed(INDEXES):
+            _recreate(name, table, columns)
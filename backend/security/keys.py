@@ -35,3 +35,32 @@ def get_public_key() -> str:
         return _read_file(path)
 
     raise FileNotFoundError("Public key not provided via PUBLIC_KEY or PUBLIC_KEY_PATH")
+
+
+def generate_key_pair(algorithm: str) -> tuple[str, str]:
+    """
+    Generate a PEM (private, public) pair suitable for `JWT_ALGORITHM`:
+    RS*/PS* -> RSA 2048, ES256 -> EC P-256, EdDSA -> Ed25519.
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    if algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "EdDSA":
+        key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm[:2] in ("RS", "PS"):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+
+    private_pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return private_pem, public_pem
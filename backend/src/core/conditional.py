@@ -0,0 +1,105 @@
+"""Conditional GETs: ETag / Last-Modified and 304 Not Modified.
+
+A listing's validators come from its collection's version, not from the
+rows: one aggregate over the user's rows (latest `updated_at` and a count,
+read off the (user_id, updated_at) index) plus their latest tombstone.
+Any create, update or delete moves it, so a poll whose `If-None-Match`
+still matches is answered without loading or serializing a row. The ETag
+covers the whole collection, so it also changes for edits outside the
+requested page or area; that only costs a full response.
+
+A single row's validators come from its own `updated_at`.
+
+Handlers compute ETags for JSON. Another representation of the same data
+(MessagePack, see src.core.serialization) gets its own tag from
+`representation_etag`, so a validator of one format never revalidates the
+other.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Optional
+
+from fastapi import Response
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, select
+
+from src.models.tombstone import Tombstone
+
+# Responses may be stored by the browser, but only reused after revalidating.
+CACHE_CONTROL = "private, no-cache"
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands timestamps back without tzinfo; they are stored as UTC.
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def _etag(*parts: Any) -> str:
+    digest = hashlib.sha1(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    # Weak: equal versions render the same data, not necessarily the same bytes.
+    return f'W/"{digest}"'
+
+
+def collection_validators(session: Session, model: type[SQLModel], user_id: int, **params: Any) -> tuple[str, Optional[datetime]]:
+    """ETag and Last-Modified of a listing of the user's `model` rows with query `params`."""
+    last_deleted = (
+        select(func.max(Tombstone.deleted_at))
+        .where(Tombstone.user_id == user_id, Tombstone.entity == model.__tablename__)
+        .scalar_subquery()
+    )
+    last_updated, count, last_deleted = session.exec(
+        select(func.max(model.updated_at), func.count(), last_deleted).where(model.user_id == user_id)
+    ).one()
+    last_updated, last_deleted = _utc(last_updated), _utc(last_deleted)
+    last_modified = max((t for t in (last_updated, last_deleted) if t is not None), default=None)
+    etag = _etag(model.__tablename__, user_id, last_updated, count, last_deleted, sorted(params.items()))
+    return etag, last_modified
+
+
+def row_validators(model: type[SQLModel], row_id: int, updated_at: datetime) -> tuple[str, datetime]:
+    """ETag and Last-Modified of one row."""
+    updated_at = _utc(updated_at)
+    return _etag(model.__tablename__, row_id, updated_at), updated_at
+
+
+def is_fresh(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def representation_etag(etag: str, representation: str) -> str:
+    """`etag` of the same data sent as `representation` instead of JSON."""
+    return f'{etag[:-1]}-{representation}"'
+
+
+def representation_if_none_match(if_none_match: str, representation: str) -> Optional[str]:
+    """A `representation` request's If-None-Match, with its tags as the JSON tags handlers compare.
+
+    Tags of any other representation are dropped; None if none are left.
+    """
+    if if_none_match.strip() == "*":
+        return if_none_match
+    suffix = f'-{representation}"'
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return ", ".join(tag[:-len(suffix)] + '"' for tag in tags if tag.endswith(suffix)) or None
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime]) -> None:
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified)
+    return response
@@ -1,14 +1,96 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     # Safe defaults for local development and tests. In production, override via env.
     DATABASE_URL: str = "sqlite:///:memory:"
+    # Optional async driver URL (e.g. postgresql+asyncpg://...). When set, the
+    # API routers are served as async handlers on this engine; DATABASE_URL
+    # stays in use for Alembic and the sync (SQLite/tests) path.
+    ASYNC_DATABASE_URL: str = ""
+    # Optional streaming replica for read-only handlers (sync/async drivers).
+    READ_DATABASE_URL: str = ""
+    ASYNC_READ_DATABASE_URL: str = ""
+    # After a write, that user's reads stay on the primary for this long.
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Log every SQL statement; for local debugging only.
+    DATABASE_ECHO: bool = False
+    # /sync hands out cursors this far behind the time of the read, so writes
+    # that commit late (or reach the replica late) are still picked up by the
+    # next sync. Must exceed the longest write transaction plus replica lag.
+    SYNC_OVERLAP_SECONDS: float = 5.0
+    # Cursors older than this get a full resync instead of a delta; tombstones
+    # older than this are no longer needed and may be deleted.
+    SYNC_TOMBSTONE_DAYS: int = 30
+    # /export fetches rows from a server-side cursor this many at a time, and
+    # sends each batch as one chunk; memory per export is bounded by it.
+    EXPORT_BATCH_ROWS: int = 1000
+
+    # Connection pool. "default" keeps an app-side QueuePool; "pgbouncer" is
+    # for PgBouncer in transaction mode (no app-side pool, no prepared
+    # statements). Per worker: at most DB_POOL_SIZE + DB_MAX_OVERFLOW
+    # connections, so size workers against Postgres max_connections.
+    DB_POOL_PROFILE: str = "default"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
 
     # SECRET_KEY / PUBLIC_KEY may contain raw PEM content or a path to a PEM file.
     # Provide these via env vars in production.
     SECRET_KEY: str = ""
     PUBLIC_KEY: str = ""
+    # RS256/RS384/RS512/PS256/PS384/PS512, ES256 (P-256) or EdDSA (Ed25519).
+    JWT_ALGORITHM: str = "RS256"
+    # Previous public key, still accepted for verification during a key or
+    # algorithm migration. Leave empty once old tokens have expired.
+    JWT_LEGACY_PUBLIC_KEY: str = ""
+    JWT_LEGACY_ALGORITHM: str = "RS256"
+
+    # Access tokens are stateless and short-lived; refresh tokens are stored
+    # server-side so they can be revoked.
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # A token presented again this soon after its rotation is a concurrent
+    # refresh (say, two tabs) that lost the race, not a replay: it is
+    # rejected without revoking the user's other tokens.
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: float = 10.0
+
+    # Cache of rendered list/search responses (src.core.response_cache). In
+    # process by default, bounded to this many bytes per worker; 0 disables.
+    # With several workers, point RESPONSE_CACHE_URL at a Redis-compatible
+    # server (redis://...) to share it instead.
+    RESPONSE_CACHE_BYTES: int = 32 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    RESPONSE_CACHE_URL: str = ""
+
+    # Workers tell each other which users' rows they wrote, so each can drop
+    # what it cached for them (src.core.invalidation). Postgres only: writes
+    # NOTIFY this channel and every worker LISTENs on it; empty disables.
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+    # LISTEN needs a session-level connection; when DATABASE_URL goes
+    # through PgBouncer in transaction mode, set a direct URL here.
+    CACHE_INVALIDATION_URL: str = ""
+    # A worker waits this long after the first event for more, then evicts
+    # for all of them at once.
+    CACHE_INVALIDATION_BATCH_SECONDS: float = 0.05
+
+    # Bearer token for GET /internal/metrics (cache, pool and hashing stats).
+    # Empty disables the endpoint.
+    METRICS_TOKEN: str = ""
+
+    # Verified-token cache used by `get_current_user`. Set size to 0 to disable.
+    TOKEN_CACHE_SIZE: int = 4096
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+
+    # Worker processes for bcrypt hashing/verification. None means one per CPU,
+    # 0 hashes inline on the request thread.
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    # Jobs allowed to wait for a hashing worker before login/register return 503.
+    PASSWORD_HASH_MAX_QUEUE: int = 64
 
     class Config:
         env_file = ".env"
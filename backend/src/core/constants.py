@@ -1,3 +1,6 @@
 AREA_NOT_FOUND = "Area not found"
 NOTE_NOT_FOUND = "Note not found"
 TASK_NOT_FOUND = "Task not found"
+AUTH_BUSY = "Too many authentication requests, try again later"
+INVALID_CURSOR = "Invalid cursor"
+INVALID_MSGPACK = "Invalid MessagePack body"
@@ -1,9 +1,291 @@
+import threading
+import time
+import uuid
+from itertools import chain
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.orm import Session as ORMSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.config import settings
+from src.core.response_cache import response_cache
+from src.models.userinfo import UserInfo
+
+
+class PoolStats:
+    """Checkout counters for one pool; read through `pool_stats`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": 1000 * self.wait_total / attempts if attempts else 0.0,
+                "wait_max_ms": 1000 * self.wait_max,
+            }
+
+
+class _TimedCheckout:
+    """Pool mixin measuring how long `connect()` waits for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class TimedNullPool(_TimedCheckout, NullPool):
+    pass
+
+
+def engine_options(url: str, is_async: bool = False) -> dict[str, Any]:
+    """Keyword arguments for create_engine/create_async_engine from settings.
+
+    Profiles:
+    - "default": app-side QueuePool sized by DB_POOL_* settings.
+    - "pgbouncer": for PgBouncer in transaction mode. No app-side pool (the
+      bouncer pools) and no server-side prepared statements, which do not
+      survive a connection being handed to another client between transactions.
+    """
+    options: dict[str, Any] = {"echo": settings.DATABASE_ECHO}
+    if url.startswith("sqlite"):
+        # SQLite uses its own singleton/static pools; sizing doesn't apply.
+        return options
+
+    if settings.DB_POOL_PROFILE == "pgbouncer":
+        options["poolclass"] = TimedNullPool
+        if is_async:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        return options
+    if settings.DB_POOL_PROFILE != "default":
+        raise ValueError(f"Unknown DB_POOL_PROFILE: {settings.DB_POOL_PROFILE}")
+
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    """Live occupancy and checkout wait times of an engine's pool."""
+    stats: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    timed = getattr(pool, "stats", None)
+    if isinstance(timed, PoolStats):
+        stats.update(timed.snapshot())
+    return stats
+
+
+def _sqlite_foreign_keys_on(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def enforce_foreign_keys(engine) -> None:
+    """Make SQLite check foreign keys, which area ownership relies on; it doesn't by default."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine.dialect.name == "sqlite":
+        event.listen(sync_engine, "connect", _sqlite_foreign_keys_on)
+
+
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+enforce_foreign_keys(engine)
+
+async_engine = None
+if settings.ASYNC_DATABASE_URL:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL, **engine_options(settings.ASYNC_DATABASE_URL, is_async=True)
+    )
+    enforce_foreign_keys(async_engine)
+
+
+# Optional read replica(s) for GET handlers, see `read_session`.
+read_engine = None
+if settings.READ_DATABASE_URL:
+    read_engine = create_engine(settings.READ_DATABASE_URL, **engine_options(settings.READ_DATABASE_URL))
+    enforce_foreign_keys(read_engine)
+
+async_read_engine = None
+if settings.ASYNC_READ_DATABASE_URL:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_read_engine = create_async_engine(
+        settings.ASYNC_READ_DATABASE_URL, **engine_options(settings.ASYNC_READ_DATABASE_URL, is_async=True)
+    )
+    enforce_foreign_keys(async_read_engine)
+
+
+def database_stats() -> dict[str, Any]:
+    stats = {"primary": pool_stats(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.pool)
+    if read_engine is not None:
+        stats["replica"] = pool_stats(read_engine.pool)
+    if async_read_engine is not None:
+        stats["async_replica"] = pool_stats(async_read_engine.pool)
+    return stats
+
+
+# user id -> monotonic deadline until which that user's reads go to the
+# primary, so they see their own writes despite replication lag.
+_recent_writes: dict[int, float] = {}
+_recent_writes_lock = threading.Lock()
+
+
+def mark_user_write(user_id: Optional[int]) -> None:
+    if user_id is None:
+        return
+    now = time.monotonic()
+    with _recent_writes_lock:
+        _recent_writes[user_id] = now + settings.READ_YOUR_WRITES_SECONDS
+        if len(_recent_writes) > 10_000:
+            for uid, deadline in list(_recent_writes.items()):
+                if deadline <= now:
+                    del _recent_writes[uid]
+
+
+def reads_from_primary(user_id: Optional[int]) -> bool:
+    with _recent_writes_lock:
+        deadline = _recent_writes.get(user_id)
+    return deadline is not None and deadline > time.monotonic()
+
+
+def _owner_id(obj) -> Optional[int]:
+    if isinstance(obj, UserInfo):
+        return obj.id
+    return getattr(obj, "user_id", None)
+
+
+@event.listens_for(ORMSession, "after_flush")
+def _collect_writers(session, flush_context) -> None:
+    writers = session.info.setdefault("written_user_ids", set())
+    rows = session.info.setdefault("written_rows", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        writers.add(_owner_id(obj))
+        rows.add((_owner_id(obj), obj.__tablename__, getattr(obj, "id", None)))
+
+
+def record_write(session, user_id: Optional[int], model=None, ids: Iterable[int] = ()) -> None:
+    """Count a write the unit of work doesn't see (bulk UPDATE/DELETE) for read-your-writes.
+
+    `model` and `ids` name the rows written; without them the write is taken
+    to touch any of the user's rows.
+    """
+    session.info.setdefault("written_user_ids", set()).add(user_id)
+    rows = session.info.setdefault("written_rows", set())
+    if model is None:
+        rows.add((user_id, None, None))
+    else:
+        rows.update((user_id, model.__tablename__, row_id) for row_id in ids)
+
+
+@event.listens_for(ORMSession, "after_commit")
+def _stick_writers_to_primary(session) -> None:
+    session.info.pop("written_rows", None)
+    for user_id in session.info.pop("written_user_ids", ()):
+        mark_user_write(user_id)
+        # Their cached responses predate this commit.
+        response_cache.invalidate_user(user_id)
+
+
+@event.listens_for(ORMSession, "after_rollback")
+def _forget_writers(session) -> None:
+    session.info.pop("written_user_ids", None)
+    session.info.pop("written_rows", None)
 
-engine = create_engine(settings.DATABASE_URL, echo=True)
 
 def get_session():
-    with Session(engine) as session:
+    # Handlers return what they wrote; expiring it on commit would cost a
+    # SELECT per object to serialize the response.
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+def read_session(user_id: Optional[int]):
+    """Session for a read-only request: the replica unless `user_id` wrote recently."""
+    bind = engine if read_engine is None or reads_from_primary(user_id) else read_engine
+    with Session(bind) as session:
+        yield session
+
+
+def use_snapshot(session) -> None:
+    """Run the rest of `session`'s transaction as one read-only snapshot.
+
+    Postgres gives each statement of a READ COMMITTED transaction its own
+    snapshot, so reads that must agree with each other ask for REPEATABLE
+    READ. SQLite transactions already read one snapshot. Call before the
+    session's first query.
+    """
+    session = getattr(session, "sync_session", session)
+    if session.get_bind().dialect.name == "postgresql":
+        session.connection(execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True})
+
+
+async def get_async_session():
+    # Objects returned by handlers are serialized after the session work is
+    # done, outside the greenlet that can lazy-load; don't expire them.
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+async def async_read_session(user_id: Optional[int]):
+    bind = async_engine
+    if async_read_engine is not None and not reads_from_primary(user_id):
+        bind = async_read_engine
+    async with AsyncSession(bind, expire_on_commit=False) as session:
         yield session
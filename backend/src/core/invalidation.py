@@ -0,0 +1,231 @@
+"""Cache invalidation across workers over Postgres LISTEN/NOTIFY.
+
+Each worker keeps caches in process (verified tokens, rendered responses)
+and drops a user's entries when it commits a write to their rows. Other
+workers learn of the write here:
+
+- Publishing: before a session commits, the rows it wrote, as
+  (user_id, entity, id) events collected by src.core.database, go out as
+  one `pg_notify` in the same transaction. Postgres delivers it only if the
+  transaction commits, and only after it does.
+- Listening: `InvalidationListener` holds a connection LISTENing on the
+  channel in a background thread of each worker. After the first
+  notification it waits CACHE_INVALIDATION_BATCH_SECONDS for more, then
+  evicts once per user for the whole batch.
+
+Under heavy write load the events coalesce at both ends: a transaction that
+wrote too many rows to fit a notification reports its users instead of its
+rows, and a listener evicts each user once however many events named them.
+If the listener loses its connection, notifications sent meanwhile are lost,
+so on reconnect it drops everything the worker cached.
+"""
+import json
+import logging
+import select
+import threading
+import uuid
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.orm import Session as ORMSession
+from sqlalchemy.pool import NullPool
+from sqlmodel import select as sql_select
+
+from src.core.config import settings
+from src.core.database import mark_user_write
+from src.core.response_cache import response_cache
+from src.core.token_cache import token_cache
+
+logger = logging.getLogger(__name__)
+
+# Tells this worker's own notifications apart; it has already evicted for them.
+WORKER_ID = uuid.uuid4().hex
+
+# Postgres rejects payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7900
+
+# Dialects whose sessions publish; the others have no NOTIFY.
+NOTIFY_DIALECTS = {"postgresql"}
+
+# (user_id, entity, id); entity and id are None for "any of the user's rows".
+Event = tuple[int, Optional[str], Optional[int]]
+
+
+def _payload(events: list, worker_id: str) -> str:
+    return json.dumps({"w": worker_id, "e": events}, separators=(",", ":"))
+
+
+def encode(events: Iterable[Event], worker_id: str = WORKER_ID) -> list[str]:
+    """Notification payloads for `events`, each under MAX_PAYLOAD_BYTES."""
+    events = sorted(e for e in set(events) if e[0] is not None)
+    if not events:
+        return []
+    payload = _payload(events, worker_id)
+    if len(payload) <= MAX_PAYLOAD_BYTES:
+        return [payload]
+    # Too many rows: name only their users, as many per payload as fit.
+    payloads, users = [], [[user_id, None, None] for user_id in sorted({e[0] for e in events})]
+    while users:
+        size = len(users)
+        while len(_payload(users[:size], worker_id)) > MAX_PAYLOAD_BYTES:
+            size //= 2
+        payloads.append(_payload(users[:size], worker_id))
+        users = users[size:]
+    return payloads
+
+
+def decode(payload: str, worker_id: str = WORKER_ID) -> list[Event]:
+    """Events in another worker's payload; none for this worker's own or a malformed one."""
+    try:
+        message = json.loads(payload)
+        if message["w"] == worker_id:
+            return []
+        return [(int(user_id), entity, row_id) for user_id, entity, row_id in message["e"]]
+    except (ValueError, KeyError, TypeError):
+        return []
+
+
+@event.listens_for(ORMSession, "before_commit")
+def _publish_writes(session) -> None:
+    channel = settings.CACHE_INVALIDATION_CHANNEL
+    wrote = session.info.get("written_rows") or session.new or session.dirty or session.deleted
+    if not channel or not wrote or session.get_bind().dialect.name not in NOTIFY_DIALECTS:
+        return
+    # Commit flushes after this hook; flush now so those rows are counted too.
+    session.flush()
+    for payload in encode(session.info.get("written_rows", ())):
+        session.execute(sql_select(func.pg_notify(channel, payload)))
+
+
+def evict_local(events: Optional[set[Event]]) -> None:
+    """Drop what this worker cached for the users in `events`; everything if None."""
+    if events is None:
+        response_cache.invalidate_all()
+        token_cache.clear()
+        return
+    for user_id in {user_id for user_id, _, _ in events}:
+        # Their next request may land here; read it from the primary too.
+        mark_user_write(user_id)
+        response_cache.invalidate_user(user_id)
+    for user_id, entity, _ in events:
+        if entity in (None, "user_info"):
+            token_cache.invalidate_user(user_id)
+
+
+class InvalidationListener:
+    """Background thread applying other workers' invalidations to this one.
+
+    `connect` returns a new DBAPI connection with psycopg2's notification
+    API (`poll()`, `notifies`).
+    """
+
+    def __init__(
+        self,
+        connect: Callable,
+        channel: str,
+        invalidate: Callable[[Optional[set[Event]]], None] = evict_local,
+        worker_id: str = WORKER_ID,
+        batch_seconds: float = 0.05,
+    ):
+        self._connect = connect
+        self.channel = channel
+        self.invalidate = invalidate
+        self.worker_id = worker_id
+        self.batch_seconds = batch_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.batches = 0
+        self.events = 0
+
+    def listen(self):
+        connection = self._connect()
+        connection.autocommit = True
+        cursor = connection.cursor()
+        cursor.execute(f'LISTEN "{self.channel}"')
+        cursor.close()
+        return connection
+
+    def poll(self, connection, timeout: float = 1.0) -> int:
+        """Wait up to `timeout` for notifications and apply them as one batch; returns the events applied."""
+        connection.poll()
+        if not connection.notifies:
+            if select.select([connection], [], [], timeout) == ([], [], []):
+                return 0
+            connection.poll()
+            if not connection.notifies:
+                return 0
+        # More are likely on their way under load; take them in the same batch.
+        self._stop.wait(self.batch_seconds)
+        connection.poll()
+        events: set[Event] = set()
+        while connection.notifies:
+            events.update(decode(connection.notifies.pop(0).payload, self.worker_id))
+        if events:
+            self.invalidate(events)
+            self.batches += 1
+            self.events += len(events)
+        return len(events)
+
+    def run(self) -> None:
+        backoff = 0.5
+        while not self._stop.is_set():
+            try:
+                connection = self.listen()
+            except Exception:
+                logger.exception("cache invalidation: cannot LISTEN, retrying in %.1fs", backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+            # Whatever was published while not listening is lost.
+            self.invalidate(None)
+            backoff = 0.5
+            try:
+                while not self._stop.is_set():
+                    self.poll(connection)
+            except Exception:
+                logger.exception("cache invalidation: lost the LISTEN connection")
+            finally:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> dict[str, int]:
+        return {"batches": self.batches, "events": self.events}
+
+
+# This worker's listener, once started.
+listener: Optional[InvalidationListener] = None
+
+
+def start_listener() -> Optional[InvalidationListener]:
+    """Start this worker's listener, when the database can NOTIFY."""
+    global listener
+    url = settings.CACHE_INVALIDATION_URL or settings.DATABASE_URL
+    channel = settings.CACHE_INVALIDATION_CHANNEL
+    if not channel or not url.startswith("postgresql"):
+        return None
+    # A connection of its own, never returned to a pool: it stays LISTENing.
+    engine = create_engine(url, poolclass=NullPool)
+    listener = InvalidationListener(
+        lambda: engine.raw_connection().driver_connection,
+        channel,
+        batch_seconds=settings.CACHE_INVALIDATION_BATCH_SECONDS,
+    )
+    listener.start()
+    return listener
+
+
+def invalidation_stats() -> dict:
+    if listener is None:
+        return {"listening": False}
+    return {"listening": True, **listener.stats()}
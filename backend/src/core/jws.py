@@ -0,0 +1,133 @@
+"""Compact JWS signing for the algorithms the `jwt` package does not ship.
+
+`jwt` (python-jwt) only implements HMAC and RSA, so ES256 and EdDSA (Ed25519)
+are signed and verified here directly with `cryptography`. Token layout and
+claim checks mirror what `jwt.JWT` does for RSA so both paths are
+interchangeable for `src.core.security`.
+"""
+import base64
+import json
+import time
+from typing import Any
+
+NATIVE_ALGORITHMS = frozenset({"ES256", "EdDSA"})
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _split(token: str) -> tuple[str, str, str]:
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise ValueError("Incorrect JWT")
+    return parts[0], parts[1], parts[2]
+
+
+def peek_algorithm(token: str) -> str:
+    """Return the unverified `alg` header of `token`."""
+    header, _, _ = _split(token)
+    try:
+        alg = json.loads(_b64decode(header))["alg"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Incorrect JWT") from e
+    if not isinstance(alg, str):
+        raise ValueError("Incorrect JWT")
+    return alg
+
+
+def load_key(alg: str, pem: bytes):
+    """Load a private or public PEM key and check it matches `alg`."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    try:
+        key = serialization.load_pem_private_key(pem, password=None)
+    except ValueError:
+        key = serialization.load_pem_public_key(pem)
+
+    if alg == "ES256":
+        if not isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)) or not isinstance(
+            key.curve, ec.SECP256R1
+        ):
+            raise ValueError("ES256 requires a P-256 EC key")
+    elif alg == "EdDSA":
+        if not isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+            raise ValueError("EdDSA requires an Ed25519 key")
+    else:
+        raise ValueError(f"Unsupported algorithm: {alg}")
+    return key
+
+
+def _sign(alg: str, key, message: bytes) -> bytes:
+    if alg == "EdDSA":
+        return key.sign(message)
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+    # JWS wants the raw 64-byte r||s form, not the DER that cryptography emits.
+    r, s = decode_dss_signature(key.sign(message, ec.ECDSA(hashes.SHA256())))
+    return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+
+def _verify(alg: str, key, message: bytes, signature: bytes) -> bool:
+    from cryptography.exceptions import InvalidSignature
+
+    if hasattr(key, "public_key"):
+        key = key.public_key()
+    try:
+        if alg == "EdDSA":
+            key.verify(signature, message)
+            return True
+
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+        if len(signature) != 64:
+            return False
+        r = int.from_bytes(signature[:32], "big")
+        s = int.from_bytes(signature[32:], "big")
+        key.verify(encode_dss_signature(r, s), message, ec.ECDSA(hashes.SHA256()))
+        return True
+    except InvalidSignature:
+        return False
+
+
+def encode(payload: dict[str, Any], key, alg: str) -> str:
+    header = _b64encode(json.dumps({"alg": alg, "typ": "JWT"}).encode())
+    body = _b64encode(json.dumps(payload).encode())
+    signing_input = f"{header}.{body}".encode("ascii")
+    return f"{header}.{body}.{_b64encode(_sign(alg, key, signing_input))}"
+
+
+def decode(token: str, key, alg: str) -> dict[str, Any]:
+    """Verify `token` with `key` and return its claims. Raises ValueError."""
+    header, body, signature = _split(token)
+    if peek_algorithm(token) != alg:
+        raise ValueError("Incorrect JWT")
+    try:
+        sig = _b64decode(signature)
+        payload = json.loads(_b64decode(body))
+    except ValueError as e:
+        raise ValueError("Incorrect JWT") from e
+    if not _verify(alg, key, f"{header}.{body}".encode("ascii"), sig):
+        raise ValueError("Incorrect JWT")
+    if not isinstance(payload, dict):
+        raise ValueError("Incorrect JWT")
+
+    now = time.time()
+    try:
+        if "exp" in payload and now >= float(payload["exp"]):
+            raise ValueError("JWT Expired")
+        if "nbf" in payload and now < float(payload["nbf"]):
+            raise ValueError("JWT Not valid yet")
+    except TypeError as e:
+        raise ValueError("Incorrect JWT") from e
+    return payload
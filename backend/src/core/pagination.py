@@ -0,0 +1,100 @@
+"""Opaque keyset cursors.
+
+A cursor is the sort key of the last row of a page, serialized as
+URL-safe base64 JSON. The next page is the rows strictly after that key in
+the same order (`keyset_after`), which an index on the sort columns can
+seek to directly instead of counting past an offset.
+"""
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and set(value) == {"dt"}:
+        value = datetime.fromisoformat(value["dt"])
+        # SQLite hands timestamps back without tzinfo; they are stored as UTC.
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def encode_cursor(kind: str, key: Sequence[Any]) -> str:
+    payload = {"kind": kind, "key": [_encode_value(v) for v in key]}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, list[Any]]:
+    """Return `(kind, key)` from a cursor. Raises ValueError if malformed."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        kind, key = payload["kind"], payload["key"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(kind, str) or not isinstance(key, list):
+        raise ValueError("Invalid cursor")
+    return kind, [_decode_value(v) for v in key]
+
+
+def keyset_after(keys: Sequence[tuple[ColumnElement, bool]], values: Sequence[Any]) -> ColumnElement:
+    """Rows strictly after `values` in the order of `keys` ((expression, descending) pairs)."""
+    if len(keys) != len(values):
+        raise ValueError("Invalid cursor")
+    # Bind with each key's type, so booleans and datetimes compare as stored.
+    bound = [literal(v, expr.type) for (expr, _), v in zip(keys, values)]
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        # Same direction on every key: a row-value comparison, which both
+        # Postgres and SQLite can turn into an index range.
+        row = tuple_(*(expr for expr, _ in keys))
+        return row < tuple_(*bound) if directions.pop() else row > tuple_(*bound)
+    clauses = []
+    for i, (expr, descending) in enumerate(keys):
+        equal = [k == v for (k, _), v in zip(keys[:i], bound[:i])]
+        clauses.append(and_(*equal, expr < bound[i] if descending else expr > bound[i]))
+    return or_(*clauses)
+
+
+def keyset_page(
+    session,
+    statement,
+    keys: Sequence[tuple[Any, bool]],
+    kind: str,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> tuple[list, Optional[str]]:
+    """One page of rows in `keys` order, and the cursor of the page after it.
+
+    `keys` are (model attribute, descending) pairs ending in a unique column,
+    and must be selected by `statement` (as an entity or as columns).
+    With a cursor the page starts right after the row it was taken from; without
+    one, `offset` still works for older clients. Raises ValueError for a cursor
+    from another listing.
+    """
+    if cursor:
+        cursor_kind, values = decode_cursor(cursor)
+        if cursor_kind != kind:
+            raise ValueError("Invalid cursor")
+        statement = statement.where(keyset_after(keys, values))
+    elif offset:
+        statement = statement.offset(offset)
+
+    statement = statement.order_by(*(expr.desc() if descending else expr for expr, descending in keys))
+    # One extra row tells whether there is a next page.
+    rows = list(session.exec(statement.limit(limit + 1)).all())
+    if limit <= 0 or len(rows) <= limit:
+        return rows[:max(limit, 0)], None
+    rows = rows[:limit]
+    return rows, encode_cursor(kind, [getattr(rows[-1], expr.key) for expr, _ in keys])
@@ -0,0 +1,355 @@
+"""Per-user cache of rendered list and search responses.
+
+Entries are keyed by (user, path, query, format, user data version). Every commit
+that writes a user's rows bumps their version (`_stick_writers_to_primary`
+in src.core.database runs for the create/update/delete handlers), so
+responses from before a write are never served again. A hit skips the
+auth lookup, the database and serialization: the stored bytes go straight
+back out, or a 304 if the client's ETag still matches.
+
+Backends:
+- `MemoryBackend` (default): an LRU bounded by RESPONSE_CACHE_BYTES in each
+  worker process. Other workers' writes reach it through the invalidation
+  bus (src.core.invalidation), which needs Postgres.
+- `RedisBackend`: a Redis-compatible server (Redis, Valkey, KeyDB, ...) at
+  RESPONSE_CACHE_URL, shared by all workers. Bound its memory with the
+  server's `maxmemory` and `maxmemory-policy allkeys-lru`. Needs the
+  `redis` extra; without it the app refuses to start.
+
+Entries also expire after RESPONSE_CACHE_TTL_SECONDS, which bounds how long
+a response read from a lagging replica can outlive the write it missed.
+"""
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import anyio
+from pydantic import ValidationError
+
+from src.core.conditional import is_fresh
+from src.core.config import settings
+from src.core.security import decode_access_token
+from src.core.serialization import MSGPACK_MEDIA_TYPE, wants_msgpack
+from src.core.token_cache import token_cache
+
+# GET endpoints whose responses are cached, relative to the API prefix.
+CACHED_PATHS = ("/areas/", "/tasks/", "/notes/", "/search/")
+
+# Response headers kept with an entry; the rest are per-response.
+_KEPT_HEADERS = {b"content-type", b"content-length", b"etag", b"last-modified", b"cache-control", b"x-next-cursor", b"vary"}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(name) + len(value) for name, value in self.headers)
+
+    def header(self, name: bytes) -> Optional[str]:
+        for key, value in self.headers:
+            if key == name:
+                return value.decode("latin-1")
+        return None
+
+    def dumps(self) -> bytes:
+        head = json.dumps([[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers])
+        return head.encode("latin-1") + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CachedResponse":
+        head, _, body = data.partition(b"\n")
+        headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in json.loads(head)]
+        return cls(headers=headers, body=body)
+
+
+class MemoryBackend:
+    """In-process LRU of responses, bounded by their total size in bytes."""
+
+    blocking = False
+    shared = False
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[int, CachedResponse, float]]" = OrderedDict()
+        self._by_user: dict[int, set[str]] = {}
+        self._versions: dict[int, int] = {}
+        # Moved by `bump_all`, so no key from before it matches again.
+        self._epoch = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def version(self, user_id: int) -> str:
+        with self._lock:
+            return f"{self._epoch}.{self._versions.get(user_id, 0)}"
+
+    def bump(self, user_id: int) -> None:
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            # Unreachable now; free their memory instead of waiting for the LRU.
+            for key in self._by_user.pop(user_id, set()):
+                self._remove(key)
+
+    def bump_all(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._by_user.clear()
+            self._bytes = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[2] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def set(self, user_id: int, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes or self.ttl <= 0:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (user_id, entry, time.monotonic() + self.ttl)
+            self._by_user.setdefault(user_id, set()).add(key)
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self._versions.clear()
+            self._bytes = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        user_id, entry, _ = item
+        self._bytes -= entry.size
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+
+class RedisBackend:
+    """Responses in a Redis-compatible server, shared by every worker.
+
+    `client` is a redis-py client or anything with its get/set/delete.
+    """
+
+    blocking = True
+    shared = True
+
+    def __init__(self, client, ttl: float):
+        self._client = client
+        self.ttl = ttl
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_URL is set but the redis package is missing; install the `redis` extra "
+                "(uv sync --extra redis)."
+            ) from e
+        return cls(redis.Redis.from_url(url), ttl)
+
+    def version(self, user_id: int) -> str:
+        key = f"rc:version:{user_id}"
+        value = self._client.get(key)
+        if value is None:
+            # Never written, or evicted by the server: start from a value no
+            # earlier entry can carry.
+            self._client.set(key, uuid.uuid4().hex, nx=True)
+            value = self._client.get(key)
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    def bump(self, user_id: int) -> None:
+        self._client.set(f"rc:version:{user_id}", uuid.uuid4().hex)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        data = self._client.get(key)
+        return CachedResponse.loads(data) if data is not None else None
+
+    def set(self, user_id: int, key: str, entry: CachedResponse) -> None:
+        if self.ttl > 0:
+            self._client.set(key, entry.dumps(), px=int(self.ttl * 1000))
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": "redis"}
+
+
+class ResponseCache:
+    """Cache keys and hit/miss counters over a backend."""
+
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def key(self, user_id: int, path: str, query: str, variant: str = "") -> str:
+        """Key of this response, in format `variant`, at the user's current data version."""
+        # Parameter order doesn't change the response; don't let it split entries.
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+        version = self.backend.version(user_id)
+        digest = hashlib.sha1(f"{user_id}\0{version}\0{path}\0{query}\0{variant}".encode(), usedforsecurity=False).hexdigest()
+        return f"rc:{digest}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self.backend.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, user_id: int, key: str, entry: CachedResponse) -> None:
+        self.backend.set(user_id, key, entry)
+        with self._lock:
+            self.stores += 1
+
+    def invalidate_user(self, user_id: Optional[int]) -> None:
+        if self.enabled and user_id is not None:
+            self.backend.bump(user_id)
+
+    def invalidate_all(self) -> None:
+        """Drop every entry of a per-process backend; a shared one is kept current by its writers."""
+        if self.enabled and not self.backend.shared:
+            self.backend.bump_all()
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.stores = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            counters = {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+        return {**counters, **self.backend.stats()}
+
+
+def _build() -> ResponseCache:
+    if settings.RESPONSE_CACHE_URL:
+        return ResponseCache(RedisBackend.from_url(settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_TTL_SECONDS))
+    backend = MemoryBackend(settings.RESPONSE_CACHE_BYTES, settings.RESPONSE_CACHE_TTL_SECONDS)
+    return ResponseCache(backend, enabled=settings.RESPONSE_CACHE_BYTES > 0)
+
+
+response_cache = _build()
+
+
+def _user_id(token: str) -> Optional[int]:
+    """The caller's id from a valid access token, or None to leave the request alone."""
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached.user.id
+    try:
+        return decode_access_token(token).get("uid")
+    except (ValueError, ValidationError, RuntimeError):
+        return None
+
+
+class ResponseCacheMiddleware:
+    """Serve CACHED_PATHS from `response_cache` for callers with a bearer token."""
+
+    def __init__(self, app, prefix: str = "", cache: Optional[ResponseCache] = None):
+        self.app = app
+        self.paths = {prefix + path for path in CACHED_PATHS}
+        self.cache = cache or response_cache
+
+    async def _call(self, fn, *args):
+        if self.cache.backend.blocking:
+            return await anyio.to_thread.run_sync(fn, *args)
+        return fn(*args)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http" or scope["method"] != "GET"
+            or scope["path"] not in self.paths or not self.cache.enabled
+        ):
+            return await self.app(scope, receive, send)
+        headers = dict(scope["headers"])
+        scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+        user_id = _user_id(token) if scheme.lower() == "bearer" and token else None
+        if user_id is None:
+            return await self.app(scope, receive, send)
+
+        # Read the version before the handler reads the database: a write that
+        # lands in between moves the version, so what's stored is never stale.
+        variant = MSGPACK_MEDIA_TYPE if wants_msgpack(headers.get(b"accept", b"").decode("latin-1")) else ""
+        key = await self._call(
+            self.cache.key, user_id, scope["path"], scope["query_string"].decode("latin-1"), variant
+        )
+        entry = await self._call(self.cache.get, key)
+        if entry is not None:
+            return await self._send_hit(entry, headers.get(b"if-none-match"), send)
+
+        start, body = {}, []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+                message = {**message, "headers": [*message["headers"], (b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body" and start.get("status") == 200:
+                body.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, capture)
+        if start.get("status") == 200:
+            kept = [(k, v) for k, v in start["headers"] if k.lower() in _KEPT_HEADERS]
+            await self._call(self.cache.put, user_id, key, CachedResponse(headers=kept, body=b"".join(body)))
+
+    async def _send_hit(self, entry: CachedResponse, if_none_match: Optional[bytes], send) -> None:
+        etag = entry.header(b"etag")
+        if etag and is_fresh(if_none_match.decode("latin-1") if if_none_match else None, etag):
+            validators = [(k, v) for k, v in entry.headers if k in (b"etag", b"last-modified", b"cache-control", b"vary")]
+            await send({"type": "http.response.start", "status": 304, "headers": [*validators, (b"x-cache", b"HIT")]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({"type": "http.response.start", "status": 200, "headers": [*entry.headers, (b"x-cache", b"HIT")]})
+        await send({"type": "http.response.body", "body": entry.body})
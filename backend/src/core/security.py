@@ -1,11 +1,19 @@
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union
+from typing import Any, Optional, Union
+import asyncio
+import multiprocessing
+import os
+import threading
 import uuid
 
 from passlib.context import CryptContext
 from pathlib import Path
+from sqlalchemy.util.concurrency import await_only, in_greenlet
 
+from src.core import jws
 from src.core.config import settings
+from src.core.jws import NATIVE_ALGORITHMS
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # JWT client and JWKs are created lazily to avoid importing cryptography at
@@ -13,8 +21,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # during test collection).
 _jwt_client = None
 
-ALGORITHM = "RS256"
-ACCESS_TOKEN_EXPIRE_HOURS = 168
+# Signed through the `jwt` package; ES256/EdDSA go through `src.core.jws`.
+RSA_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", "PS256", "PS384", "PS512"})
+SUPPORTED_ALGORITHMS = RSA_ALGORITHMS | NATIVE_ALGORITHMS
 
 
 def _load_pem(value: str) -> bytes:
@@ -29,8 +38,22 @@ def _load_pem(value: str) -> bytes:
     raise FileNotFoundError(f"Key not found at {value}")
 
 
+def _load_key(alg: str, value: str):
+    if alg not in SUPPORTED_ALGORITHMS:
+        raise ValueError(f"Unsupported JWT algorithm: {alg}")
+    pem = _load_pem(value)
+    if alg in RSA_ALGORITHMS:
+        from jwt import jwk_from_pem as _jwk_from_pem
+
+        return _jwk_from_pem(pem)
+    return jws.load_key(alg, pem)
+
+
 SECRET_JWK = None
 PUBLIC_JWK = None
+# Public key of the previous signing setup, accepted for verification only
+# while clients migrate to tokens signed with `JWT_ALGORITHM`.
+LEGACY_PUBLIC_JWK = None
 
 
 def _ensure_jwks() -> None:
@@ -39,7 +62,7 @@ def _ensure_jwks() -> None:
     Loading is deferred so test collection/import-time doesn't require configured
     secrets or the `cryptography` Rust extension being initialized.
     """
-    global SECRET_JWK, PUBLIC_JWK, _jwt_client
+    global SECRET_JWK, PUBLIC_JWK, LEGACY_PUBLIC_JWK, _jwt_client
     if SECRET_JWK is not None and PUBLIC_JWK is not None and _jwt_client is not None:
         return
 
@@ -48,16 +71,51 @@ def _ensure_jwks() -> None:
         raise RuntimeError("JWT keys are not configured. Set SECRET_KEY and PUBLIC_KEY environment variables.")
 
     # Import jwt and the jwk loader only when keys are required.
-    from jwt import JWT, jwk_from_pem as _jwk_from_pem
+    from jwt import JWT
 
     _jwt_client = JWT()
-    SECRET_JWK = _jwk_from_pem(_load_pem(settings.SECRET_KEY))
-    PUBLIC_JWK = _jwk_from_pem(_load_pem(settings.PUBLIC_KEY))
+    SECRET_JWK = _load_key(settings.JWT_ALGORITHM, settings.SECRET_KEY)
+    PUBLIC_JWK = _load_key(settings.JWT_ALGORITHM, settings.PUBLIC_KEY)
+    LEGACY_PUBLIC_JWK = None
+    if settings.JWT_LEGACY_PUBLIC_KEY:
+        LEGACY_PUBLIC_JWK = _load_key(settings.JWT_LEGACY_ALGORITHM, settings.JWT_LEGACY_PUBLIC_KEY)
+
+
+def _verification_keys(alg: str) -> list:
+    keys = []
+    if alg == settings.JWT_ALGORITHM:
+        keys.append(PUBLIC_JWK)
+    if LEGACY_PUBLIC_JWK is not None and alg == settings.JWT_LEGACY_ALGORITHM:
+        keys.append(LEGACY_PUBLIC_JWK)
+    return keys
+
+
+def _encode(payload: dict, key, alg: str) -> str:
+    if alg in RSA_ALGORITHMS:
+        return _jwt_client.encode(payload, key, alg=alg)
+    return jws.encode(payload, key, alg)
+
+
+def _decode(token: str, key, alg: str) -> dict:
+    if alg in NATIVE_ALGORITHMS:
+        return jws.decode(token, key, alg)
+    # Import jwt exceptions lazily as well (jwt package is loaded by _ensure_jwks)
+    from jwt.exceptions import JWTDecodeError
+
+    try:
+        return _jwt_client.decode(token, key, algorithms={alg}, do_time_check=True)
+    except JWTDecodeError as e:
+        raise ValueError("Incorrect JWT") from e
 
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: timedelta = None
+    subject: Union[str, Any], expires_delta: timedelta = None, claims: Optional[dict] = None
 ) -> str:
+    """Sign an access token for `subject` (the user's email).
+
+    `claims` are merged into the payload so routes can read e.g. the user id
+    straight from the token instead of looking the user up.
+    """
     try:
         _ensure_jwks()
     except RuntimeError:
@@ -70,9 +128,10 @@ def create_access_token(
     if expires_delta:
         expire = now + expires_delta
     else:
-        expire = now + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-    to_encode = {"exp": int(expire.timestamp()), "sub": str(subject)}
-    encoded_jwt = _jwt_client.encode(to_encode, SECRET_JWK, alg=ALGORITHM)
+        expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode = dict(claims or {})
+    to_encode.update({"exp": int(expire.timestamp()), "iat": int(now.timestamp()), "sub": str(subject)})
+    encoded_jwt = _encode(to_encode, SECRET_JWK, settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -80,21 +139,134 @@ def decode_access_token(access_token: str) -> Any:
     # _ensure_jwks will raise RuntimeError if keys are missing; let that propagate
     # so callers/tests can handle or mock accordingly.
     _ensure_jwks()
+    alg = jws.peek_algorithm(access_token)
+    keys = _verification_keys(alg)
+    if not keys:
+        raise ValueError("Incorrect JWT")
+
+    error = None
+    for key in keys:
+        try:
+            return _decode(access_token, key, alg)
+        except ValueError as e:
+            error = e
+    raise error
+
+
+class PasswordHashQueueFull(RuntimeError):
+    """Raised when too many hash/verify jobs are already waiting for a worker."""
+
+
+# bcrypt is deliberately slow (~250ms per call). Running it in worker
+# processes keeps it off the request threadpool and out from under the GIL.
+_hash_executor: Optional[ProcessPoolExecutor] = None
+_hash_lock = threading.Lock()
+_hash_pending = 0
+_hash_rejected = 0
+
+
+def _hash_pool_size() -> int:
+    size = settings.PASSWORD_HASH_WORKERS
+    if size is None:
+        size = os.cpu_count() or 1
+    return max(size, 0)
+
+
+def _get_hash_executor() -> Optional[ProcessPoolExecutor]:
+    global _hash_executor
+    if _hash_executor is None and _hash_pool_size() > 0:
+        with _hash_lock:
+            if _hash_executor is None:
+                # "spawn" avoids forking a process that already runs threads
+                # (uvicorn, anyio threadpool), which can deadlock the child.
+                _hash_executor = ProcessPoolExecutor(
+                    max_workers=_hash_pool_size(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    with _hash_lock:
+        executor, _hash_executor = _hash_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def _hash_job_done(_future: Future) -> None:
+    global _hash_pending
+    with _hash_lock:
+        _hash_pending -= 1
+
+
+def _submit_hash_job(fn, *args) -> Optional[Future]:
+    """Queue `fn` on the hashing pool, or return None when the pool is disabled."""
+    global _hash_pending, _hash_rejected
+    executor = _get_hash_executor()
+    if executor is None:
+        return None
+    with _hash_lock:
+        if _hash_pending >= settings.PASSWORD_HASH_MAX_QUEUE:
+            _hash_rejected += 1
+            raise PasswordHashQueueFull("Password hashing queue is full")
+        _hash_pending += 1
     try:
-        message_received = _jwt_client.decode(access_token, PUBLIC_JWK, do_time_check=True)
-        return message_received
-    except Exception as e:
-        # Import jwt exceptions lazily as well (jwt package is loaded by _ensure_jwks)
-        from jwt.exceptions import JWTDecodeError
-
-        if isinstance(e, JWTDecodeError):
-            raise ValueError("Incorrect JWT") from e
+        future = executor.submit(fn, *args)
+    except Exception:
+        _hash_job_done(None)
         raise
+    future.add_done_callback(_hash_job_done)
+    return future
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def hash_pool_stats() -> dict[str, int]:
+    with _hash_lock:
+        return {
+            "workers": _hash_pool_size(),
+            "pending": _hash_pending,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+            "rejected": _hash_rejected,
+        }
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if in_greenlet():
+        # Sync handler bridged onto the event loop by AsyncSession.run_sync:
+        # don't block the loop while the hash runs.
+        return await_only(averify_password(plain_password, hashed_password))
+    future = _submit_hash_job(_verify, plain_password, hashed_password)
+    if future is None:
+        return _verify(plain_password, hashed_password)
+    return future.result()
+
+
+def get_password_hash(password: str) -> str:
+    if in_greenlet():
+        return await_only(aget_password_hash(password))
+    future = _submit_hash_job(_hash, password)
+    if future is None:
+        return _hash(password)
+    return future.result()
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    future = _submit_hash_job(_verify, plain_password, hashed_password)
+    if future is None:
+        return await asyncio.to_thread(_verify, plain_password, hashed_password)
+    return await asyncio.wrap_future(future)
+
+
+async def aget_password_hash(password: str) -> str:
+    future = _submit_hash_job(_hash, password)
+    if future is None:
+        return await asyncio.to_thread(_hash, password)
+    return await asyncio.wrap_future(future)
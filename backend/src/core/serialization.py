@@ -0,0 +1,263 @@
+"""Rendering responses: one validation per row, JSON or MessagePack.
+
+A handler returning ORM rows leaves FastAPI to validate them against its
+`response_model` and then dump the result. For the list endpoints that model
+is `Union[list[XPublic], list[XSummary]]`, and pydantic's smart union mode
+validates every row against both members to pick the better one: each row
+is converted twice. The handler knows which view it selected, so it renders
+the rows itself through that view's `TypeAdapter` (`respond`): one
+validation from attributes, then straight to bytes. A returned `Response`
+is sent as is, without FastAPI validating it again.
+
+`response_model` stays on the route for the OpenAPI schema.
+
+MessagePack: clients that prefer `application/msgpack` in `Accept` get it
+instead of JSON, and may send request bodies in it too. Values are encoded
+by the same response models; datetimes become the standard timestamp
+extension (-1) and `Priority` the one-byte extension PRIORITY_EXT. The list
+handlers pack their validated rows directly; `MsgPackMiddleware` converts
+everything else from the route's JSON by its response model, and request
+bodies to JSON before FastAPI reads them.
+"""
+import json
+from datetime import date, datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter, ValidationError
+
+from src.core.conditional import representation_etag, representation_if_none_match
+from src.core.constants import INVALID_MSGPACK
+from src.models.task import PRIORITY_ORDINAL, Priority
+
+try:
+    import msgpack
+except ImportError:
+    # Without it every response is JSON and MessagePack bodies are refused.
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Suffix of the ETags of MessagePack responses (see representation_etag).
+MSGPACK_REPRESENTATION = "msgpack"
+# Accepted for requests and in Accept; responses use MSGPACK_MEDIA_TYPE.
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# MessagePack extension type of a Priority: one byte, its PRIORITY_ORDINAL.
+PRIORITY_EXT = 1
+_PRIORITY_BY_ORDINAL = {ordinal: priority for priority, ordinal in PRIORITY_ORDINAL.items()}
+
+
+@lru_cache(maxsize=None)
+def adapter(type_: Any) -> TypeAdapter:
+    """The TypeAdapter for `type_`, built once; building one compiles its schema."""
+    return TypeAdapter(type_)
+
+
+def header_qualities(header: str) -> dict[str, float]:
+    """Lowercased values of an Accept-style header and their q-values."""
+    qualities = {}
+    for part in header.split(","):
+        token, *params = (piece.strip() for piece in part.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if token:
+            qualities[token.lower()] = quality
+    return qualities
+
+
+def wants_msgpack(accept: Optional[str]) -> bool:
+    """Whether an Accept header prefers MessagePack to JSON (JSON wins without one)."""
+    if msgpack is None or not accept:
+        return False
+    qualities = header_qualities(accept)
+    packed = max(qualities.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES)
+    plain = qualities.get(JSON_MEDIA_TYPE, qualities.get("application/*", qualities.get("*/*", 0.0)))
+    return packed > 0 and packed >= plain
+
+
+def _pack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # SQLite hands timestamps back without tzinfo; they are stored as UTC.
+        return msgpack.Timestamp.from_datetime(value if value.tzinfo else value.replace(tzinfo=timezone.utc))
+    if isinstance(value, Priority):
+        return msgpack.ExtType(PRIORITY_EXT, bytes([PRIORITY_ORDINAL[value]]))
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, (str, int, float)):
+        # Subclasses, which strict_types hands here.
+        return type(value).__mro__[-2](value)
+    raise TypeError(f"Cannot pack {type(value).__name__}")
+
+
+def packb(value: Any) -> bytes:
+    # strict_types: without it Priority, a str subclass, would be packed as a string.
+    return msgpack.packb(value, default=_pack_default, strict_types=True)
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    if code == PRIORITY_EXT and len(data) == 1 and data[0] in _PRIORITY_BY_ORDINAL:
+        return _PRIORITY_BY_ORDINAL[data[0]].value
+    raise ValueError(f"Unknown MessagePack extension type {code}")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot send {type(value).__name__} as JSON")
+
+
+def msgpack_to_json(body: bytes) -> bytes:
+    """A MessagePack request body as the JSON FastAPI parses; ValueError if it isn't valid."""
+    try:
+        value = msgpack.unpackb(body, ext_hook=_unpack_ext, timestamp=3)
+        return json.dumps(value, default=_json_default).encode()
+    except (ValueError, TypeError, msgpack.UnpackException) as exc:
+        raise ValueError(INVALID_MSGPACK) from exc
+
+
+def json_to_msgpack(body: bytes, model: Any = None) -> bytes:
+    """A JSON response body as MessagePack, typed by `model` (a response model) where it fits."""
+    if model is not None:
+        type_adapter = adapter(model)
+        try:
+            return packb(type_adapter.dump_python(type_adapter.validate_json(body), exclude_unset=True))
+        except ValidationError:
+            pass
+    return packb(json.loads(body))
+
+
+def render(type_: Any, value: Any, packed: bool = False) -> bytes:
+    """`value` (ORM rows, result rows or model instances) as JSON, or MessagePack, of `type_`."""
+    type_adapter = adapter(type_)
+    validated = type_adapter.validate_python(value, from_attributes=True)
+    if packed:
+        return packb(type_adapter.dump_python(validated))
+    return type_adapter.dump_json(validated)
+
+
+def respond(type_: Any, value: Any, response: Optional[Response] = None, accept: Optional[str] = None) -> Response:
+    """`value` rendered as `type_` in the format `accept` prefers.
+
+    Keeps the headers a handler set on its injected `response`.
+    """
+    packed = wants_msgpack(accept)
+    return Response(
+        render(type_, value, packed),
+        media_type=MSGPACK_MEDIA_TYPE if packed else JSON_MEDIA_TYPE,
+        headers=response.headers if response is not None else None,
+    )
+
+
+def _msgpack_etag(etag: bytes) -> bytes:
+    return representation_etag(etag.decode("latin-1"), MSGPACK_REPRESENTATION).encode("latin-1")
+
+
+class MsgPackMiddleware:
+    """MessagePack request bodies and responses under `prefix`, for clients that ask for them."""
+
+    def __init__(self, app, prefix: str = ""):
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefix):
+            return await self.app(scope, receive, send)
+        headers = dict(scope["headers"])
+        packed = wants_msgpack(headers.get(b"accept", b"").decode("latin-1"))
+        send = self._negotiating(scope, send, packed)
+        if packed and b"if-none-match" in headers:
+            # Handlers compare JSON ETags; only MessagePack ones may revalidate this response.
+            if_none_match = representation_if_none_match(
+                headers[b"if-none-match"].decode("latin-1"), MSGPACK_REPRESENTATION
+            )
+            kept = [(k, v) for k, v in scope["headers"] if k != b"if-none-match"]
+            if if_none_match is not None:
+                kept.append((b"if-none-match", if_none_match.encode("latin-1")))
+            scope.update(headers=kept)
+
+        content_type = headers.get(b"content-type", b"").partition(b";")[0].strip().lower().decode("latin-1")
+        if content_type in MSGPACK_MEDIA_TYPES:
+            if msgpack is None:
+                return await self._error(send, 415, f"{content_type} is not supported")
+            try:
+                body = msgpack_to_json(await _read_body(receive))
+            except ValueError:
+                return await self._error(send, 400, INVALID_MSGPACK)
+            kept = [(k, v) for k, v in scope["headers"] if k not in (b"content-type", b"content-length")]
+            # The route reads JSON; `_negotiating` still sees the scope the router fills in.
+            scope.update(headers=[*kept, (b"content-type", JSON_MEDIA_TYPE.encode()), (b"content-length", str(len(body)).encode())])
+            receive = _replay(body)
+        await self.app(scope, receive, send)
+
+    def _negotiating(self, scope, send, packed: bool):
+        start, chunks = {}, []
+
+        async def negotiating_send(message):
+            if message["type"] == "http.response.start":
+                headers = [*message["headers"], (b"vary", b"Accept")]
+                if packed:
+                    headers = [(k, _msgpack_etag(v) if k == b"etag" else v) for k, v in headers]
+                content_type = dict(headers).get(b"content-type", b"")
+                if packed and content_type.startswith(JSON_MEDIA_TYPE.encode()):
+                    start.update(message, headers=headers)
+                    return
+                return await send({**message, "headers": headers})
+            if not start or message["type"] != "http.response.body":
+                return await send(message)
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            if body:
+                model = getattr(scope.get("route"), "response_model", None)
+                body = json_to_msgpack(body, model if 200 <= start["status"] < 300 else None)
+            headers = [(k, v) for k, v in start["headers"] if k not in (b"content-type", b"content-length")]
+            headers += [(b"content-type", MSGPACK_MEDIA_TYPE.encode()), (b"content-length", str(len(body)).encode())]
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        return negotiating_send
+
+    async def _error(self, send, status: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        headers = [(b"content-type", JSON_MEDIA_TYPE.encode()), (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay(body: bytes):
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return receive
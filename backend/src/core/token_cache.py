@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+
+from src.core.config import settings
+from src.models.userinfo import UserInfo
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    claims: dict
+    user: UserInfo
+    expires_at: float
+
+
+def _digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _principal(user: UserInfo) -> UserInfo:
+    """Detached copy of the user row without the password hash.
+
+    The cached principal must not be bound to the session that loaded it,
+    otherwise it would be expired/refreshed by that session after commit.
+    """
+    return UserInfo(
+        id=user.id,
+        email=user.email,
+        full_name=user.full_name,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+class TokenCache:
+    """Bounded LRU of verified access tokens, keyed by token digest.
+
+    Entries live for at most `ttl` seconds and never past the token's `exp`.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CachedToken]" = OrderedDict()
+        self._by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Optional[CachedToken]:
+        key = _digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, token: str, claims: dict, user: UserInfo) -> None:
+        exp = claims.get("exp")
+        if self.maxsize <= 0 or self.ttl <= 0 or exp is None:
+            # Tokens without an expiry are never issued by us; don't pin them.
+            return
+        expires_at = min(time.time() + self.ttl, float(exp))
+        if expires_at <= time.time():
+            return
+
+        key = _digest(token)
+        entry = CachedToken(claims=dict(claims), user=_principal(user), expires_at=expires_at)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._by_user.setdefault(user.id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: Optional[int]) -> None:
+        with self._lock:
+            for key in self._by_user.pop(user_id, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_user.get(entry.user.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry.user.id]
+
+
+token_cache = TokenCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+
+
+@event.listens_for(UserInfo, "after_update")
+@event.listens_for(UserInfo, "after_delete")
+def _invalidate_on_user_change(mapper, connection, target: UserInfo) -> None:
+    token_cache.invalidate_user(target.id)
@@ -2,3 +2,5 @@ from .area import Area
 from .note import Note
 from .task import Task
 from .userinfo import UserInfo
+from .refresh_token import RefreshToken
+from .tombstone import Tombstone
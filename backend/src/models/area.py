@@ -1,22 +1,54 @@
 from typing import List, Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 
+from sqlalchemy import ForeignKeyConstraint, Index, UniqueConstraint
+from sqlalchemy.engine import make_url
 from sqlmodel import Field, Relationship, SQLModel
 
+from src.core.config import settings
+
 if TYPE_CHECKING:
     from src.models.task import Task
     from src.models.note import Note
     from src.models.userinfo import UserInfo
 
 
+def area_foreign_keys(table: str, dialect: Optional[str] = None) -> tuple[ForeignKeyConstraint, ...]:
+    """`table`'s keys to its area; deleting the area takes the rows out of it.
+
+    The (area_id, user_id) owner key nulls area_id itself. Postgres runs the
+    checks of overlapping keys in trigger-name order, so a NO ACTION owner key
+    next to a separate area_id key with SET NULL would reject the delete. SET
+    NULL names area_id (Postgres 15+) so user_id stays. SQLite can't name a
+    column there; it checks NO ACTION keys at the end of the statement, so a
+    separate area_id key can do the SET NULL instead. `dialect` defaults to
+    that of DATABASE_URL.
+    """
+    dialect = dialect or make_url(settings.DATABASE_URL).get_backend_name()
+    owner_columns = (["area_id", "user_id"], ["area.id", "area.user_id"])
+    if dialect == "postgresql":
+        return (ForeignKeyConstraint(*owner_columns, name=f"fk_{table}_area_owner", ondelete="SET NULL (area_id)"),)
+    return (
+        ForeignKeyConstraint(*owner_columns, name=f"fk_{table}_area_owner"),
+        ForeignKeyConstraint(["area_id"], ["area.id"], name=f"fk_{table}_area_id", ondelete="SET NULL"),
+    )
+
+
 class AreaBase(SQLModel):
     name: str
     color: str
 
 
 class Area(AreaBase, table=True):
+    __table_args__ = (
+        # Target of the (area_id, user_id) foreign keys on task and note.
+        UniqueConstraint("id", "user_id", name="uq_area_id_user_id"),
+        # /sync reads a user's areas changed since its cursor.
+        Index("ix_area_user_id_updated_at", "user_id", "updated_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: Optional[int] = Field(default=None, foreign_key="user_info.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="user_info.id", index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
@@ -24,8 +56,13 @@ class Area(AreaBase, table=True):
         nullable=False,
     )
 
-    tasks: List["Task"] = Relationship(back_populates="area")
-    notes: List["Note"] = Relationship(back_populates="area")
+    # The database nulls their area_id (area_foreign_keys); don't load them to do it.
+    tasks: List["Task"] = Relationship(
+        back_populates="area", sa_relationship_kwargs={"foreign_keys": "Task.area_id", "passive_deletes": True}
+    )
+    notes: List["Note"] = Relationship(
+        back_populates="area", sa_relationship_kwargs={"foreign_keys": "Note.area_id", "passive_deletes": True}
+    )
     user_info: Optional["UserInfo"] = Relationship(back_populates="areas")
 
 
@@ -0,0 +1,20 @@
+from typing import Union
+
+from sqlmodel import SQLModel
+
+from src.models.area import AreaPublic
+from src.models.note import NotePublic, NoteSummary
+from src.models.task import TaskPublic, TaskSummary
+from src.models.userinfo import UserPublic
+
+
+class Bootstrap(SQLModel):
+    """Everything the app shows on load, read from one snapshot."""
+    user: UserPublic
+    areas: list[AreaPublic]
+    tasks: Union[list[TaskPublic], list[TaskSummary]]
+    notes: Union[list[NotePublic], list[NoteSummary]]
+    # Collection name -> cursor for its list endpoint, for collections cut off by `limit`.
+    cursors: dict[str, str]
+    # `since` for /sync, to fetch only what changes from here on.
+    sync_cursor: str
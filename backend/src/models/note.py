@@ -1,8 +1,12 @@
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 
+from pydantic import field_validator
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
+from src.models.area import area_foreign_keys
+
 if TYPE_CHECKING:
     from src.models.area import Area
 
@@ -13,8 +17,18 @@ class NoteBase(SQLModel):
 
 
 class Note(NoteBase, table=True):
+    __table_args__ = (
+        # List endpoints always filter by owner, then by area, and page by
+        # (updated_at, id); see LIST_ORDER in src.routes.note.
+        Index("ix_note_user_id_updated_at", "user_id", "updated_at", "id"),
+        Index("ix_note_user_id_area_id", "user_id", "area_id", "updated_at", "id"),
+        # A note can only be in an area of its own owner; the database rejects
+        # anything else, so handlers don't look the area up first.
+        *area_foreign_keys("note"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    area_id: Optional[int] = Field(default=None, foreign_key="area.id")
+    area_id: Optional[int] = Field(default=None, index=True)
     user_id: Optional[int] = Field(default=None, foreign_key="user_info.id")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at: datetime = Field(
@@ -23,11 +37,13 @@ class Note(NoteBase, table=True):
         nullable=False,
     )
 
-    area: Optional["Area"] = Relationship(back_populates="notes")
+    area: Optional["Area"] = Relationship(
+        back_populates="notes", sa_relationship_kwargs={"foreign_keys": "Note.area_id"}
+    )
 
 
 class NoteCreate(NoteBase):
-    area_id: Optional[int] = None
+    area_id: Optional[int] = Field(default=None, description="One of the caller's areas; leave out for no area")
 
 
 class NotePublic(NoteBase):
@@ -37,11 +53,28 @@ class NotePublic(NoteBase):
     updated_at: datetime
 
 
+class NoteSummary(SQLModel):
+    """A note as list views render it: everything but the content."""
+    id: int
+    title: str
+    area_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+
+
 class NoteUpdate(SQLModel):
     title: Optional[str] = None
     content: Optional[str] = None
     area_id: Optional[int] = None
 
+    @field_validator("title")
+    @classmethod
+    def _not_null(cls, value):
+        # Optional only so it can be left out; the column is NOT NULL.
+        if value is None:
+            raise ValueError("May not be null")
+        return value
+
 
 class NoteSearchResult(NoteBase):
     id: int
@@ -0,0 +1,23 @@
+from typing import Optional
+from datetime import datetime, timezone
+
+from sqlmodel import Field, SQLModel
+
+
+class RefreshToken(SQLModel, table=True):
+    __tablename__ = "refresh_token"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user_info.id", index=True)
+    # Only a SHA-256 digest of the opaque token is stored.
+    token_hash: str = Field(unique=True, index=True)
+    expires_at: datetime
+    revoked: bool = False
+    # When rotation revoked it, i.e. when its successor was issued; None if
+    # revoked by logout or a replay.
+    rotated_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
+
+
+class RefreshRequest(SQLModel):
+    refresh_token: str
@@ -0,0 +1,23 @@
+from sqlmodel import SQLModel
+
+from src.models.area import AreaPublic
+from src.models.note import NotePublic
+from src.models.task import TaskPublic
+
+
+class SyncDeleted(SQLModel):
+    areas: list[int]
+    tasks: list[int]
+    notes: list[int]
+
+
+class SyncChanges(SQLModel):
+    """Rows created or updated since a /sync cursor, and ids deleted since then."""
+    areas: list[AreaPublic]
+    tasks: list[TaskPublic]
+    notes: list[NotePublic]
+    deleted: SyncDeleted
+    # True when this is everything the user has: replace local state rather than merge.
+    full: bool
+    # `since` for the next sync.
+    cursor: str
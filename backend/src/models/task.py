@@ -2,8 +2,13 @@ from typing import Optional, TYPE_CHECKING
 from datetime import datetime, timezone
 from enum import Enum
 
+from pydantic import field_validator, model_validator
+from sqlalchemy import Index, case, literal_column
+from sqlalchemy.sql.expression import Grouping
 from sqlmodel import Field, SQLModel, Relationship
 
+from src.models.area import area_foreign_keys
+
 if TYPE_CHECKING:
     from src.models.area import Area
 
@@ -23,8 +28,18 @@ class TaskBase(SQLModel):
 
 
 class Task(TaskBase, table=True):
+    __table_args__ = (
+        # List endpoints always filter by owner, then by area, and page by
+        # (updated_at, id); see LIST_ORDER in src.routes.task.
+        Index("ix_task_user_id_updated_at", "user_id", "updated_at", "id"),
+        Index("ix_task_user_id_area_id", "user_id", "area_id", "updated_at", "id"),
+        # A task can only be in an area of its own owner; the database rejects
+        # anything else, so handlers don't look the area up first.
+        *area_foreign_keys("task"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    area_id: Optional[int] = Field(default=None, foreign_key="area.id")
+    area_id: Optional[int] = Field(default=None, index=True)
     user_id: Optional[int] = Field(default=None, foreign_key="user_info.id")
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at: datetime = Field(
@@ -33,11 +48,31 @@ class Task(TaskBase, table=True):
         nullable=False,
     )
 
-    area: Optional["Area"] = Relationship(back_populates="tasks")
+    area: Optional["Area"] = Relationship(
+        back_populates="tasks", sa_relationship_kwargs={"foreign_keys": "Task.area_id"}
+    )
+
+
+# Search result order: active tasks first, then HIGH > MEDIUM > LOW > no
+# priority, then the earliest due date with undated tasks last. The index
+# walks a user's tasks in exactly this order so `LIMIT` can stop early.
+# The CASE uses literal SQL rather than bound parameters because the planner
+# only matches an expression index to the same expression, constants included.
+PRIORITY_ORDINAL = {Priority.HIGH: 3, Priority.MEDIUM: 2, Priority.LOW: 1}
+priority_ordinal = case(
+    *(
+        (Task.priority == literal_column(f"'{p.name}'"), literal_column(str(n)))
+        for p, n in PRIORITY_ORDINAL.items()
+    ),
+    else_=literal_column("0"),
+)
+# Postgres only takes a CASE in an index key in parentheses.
+TASK_SEARCH_ORDER = (Task.completed, Grouping(priority_ordinal).desc(), Task.due_date.is_(None), Task.due_date)
+Index("ix_task_user_id_search_order", Task.user_id, *TASK_SEARCH_ORDER)
 
 
 class TaskCreate(TaskBase):
-    area_id: Optional[int] = None
+    area_id: Optional[int] = Field(default=None, description="One of the caller's areas; leave out for no area")
 
 
 class TaskPublic(TaskBase):
@@ -47,6 +82,18 @@ class TaskPublic(TaskBase):
     updated_at: datetime
 
 
+class TaskSummary(SQLModel):
+    """A task as list views render it: everything but the description."""
+    id: int
+    title: str
+    area_id: Optional[int]
+    due_date: Optional[str] = None
+    completed: bool
+    priority: Optional[Priority] = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class TaskUpdate(SQLModel):
     title: Optional[str] = None
     description: Optional[str] = None
@@ -55,6 +102,60 @@ class TaskUpdate(SQLModel):
     area_id: Optional[int] = None
     priority: Optional[Priority] = None
 
+    @field_validator("title", "completed")
+    @classmethod
+    def _not_null(cls, value):
+        # Optional only so they can be left out; the columns are NOT NULL.
+        if value is None:
+            raise ValueError("May not be null")
+        return value
+
+
+# Upper bound on `TaskSelection.ids`, which becomes one IN (...) list.
+BULK_MAX_IDS = 1000
+
+
+class TaskSelection(SQLModel):
+    """The caller's tasks a bulk operation applies to: those matching every set field."""
+    ids: Optional[list[int]] = Field(default=None, max_length=BULK_MAX_IDS)
+    area_id: Optional[int] = None
+    completed: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def _not_everything(self):
+        if self.ids is None and self.area_id is None and self.completed is None:
+            raise ValueError("Select tasks by ids, area_id or completed")
+        return self
+
+
+class TaskBulkChanges(SQLModel):
+    completed: Optional[bool] = None
+    area_id: Optional[int] = None
+    priority: Optional[Priority] = None
+    due_date: Optional[str] = None
+
+    @field_validator("completed")
+    @classmethod
+    def _not_null(cls, value):
+        if value is None:
+            raise ValueError("May not be null")
+        return value
+
+    @model_validator(mode="after")
+    def _not_empty(self):
+        if not self.model_fields_set:
+            raise ValueError("No changes given")
+        return self
+
+
+class TaskBulkUpdate(SQLModel):
+    where: TaskSelection
+    changes: TaskBulkChanges
+
+
+class TaskBulkResult(SQLModel):
+    ids: list[int]
+
 
 class TaskSearchResult(TaskBase):
     id: int
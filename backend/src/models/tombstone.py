@@ -0,0 +1,20 @@
+from typing import Optional
+from datetime import datetime, timezone
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class Tombstone(SQLModel, table=True):
+    """A deleted area, task or note, kept so /sync can tell clients it is gone."""
+    __table_args__ = (
+        # Read per user in deletion order by /sync.
+        Index("ix_tombstone_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user_info.id")
+    # Table name of the deleted row: "area", "task" or "note".
+    entity: str
+    entity_id: int
+    deleted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
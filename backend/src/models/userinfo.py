@@ -40,4 +40,5 @@ class UserPublic(UserBase):
 
 class UserToken(SQLModel):
     access_token: str
+    refresh_token: Optional[str] = None
     token_type: str = "Bearer"
@@ -3,3 +3,7 @@ from .note import router as note_router
 from .task import router as task_router
 from .user import router as user_router
 from .search import router as search_router
+from .metrics import router as metrics_router
+from .bootstrap import router as bootstrap_router
+from .sync import router as sync_router
+from .export import router as export_router
@@ -0,0 +1,100 @@
+"""Serve the API routers as async handlers on the async engine.
+
+Route logic is written once, as sync functions taking a `Session`. For the
+async engine each of those endpoints is wrapped in an `async def` that runs
+it through `AsyncSession.run_sync`: SQLAlchemy executes the sync code in a
+greenlet on the event loop and suspends it on every database round trip, so
+a waiting request holds a pooled connection but no threadpool slot.
+"""
+import inspect
+from typing import Annotated, Callable, get_args, get_origin
+
+from fastapi import APIRouter, Depends
+from fastapi.params import Depends as DependsParam
+from fastapi.routing import APIRoute
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.database import async_read_session, get_async_session, get_session
+from src.models.userinfo import UserInfo
+from src.routes.user import get_current_user, get_read_session
+
+# Sync dependency -> async replacement, filled in below.
+_ASYNC_DEPENDENCIES: dict[Callable, Callable] = {get_session: get_async_session}
+_SESSION_DEPENDENCIES = {get_session, get_read_session}
+
+
+def _swap_dependency(param: inspect.Parameter) -> inspect.Parameter:
+    if get_origin(param.annotation) is not Annotated:
+        return param
+    base, *metadata = get_args(param.annotation)
+    swapped = []
+    for item in metadata:
+        if isinstance(item, DependsParam) and item.dependency in _ASYNC_DEPENDENCIES:
+            if item.dependency in _SESSION_DEPENDENCIES:
+                base = AsyncSession
+            item = Depends(_ASYNC_DEPENDENCIES[item.dependency], use_cache=item.use_cache)
+        swapped.append(item)
+    return param.replace(annotation=Annotated[(base, *swapped)])
+
+
+def to_async(fn: Callable) -> Callable:
+    """Async version of a sync endpoint/dependency that takes `session`."""
+    signature = inspect.signature(fn)
+    if "session" not in signature.parameters:
+        return fn
+
+    async def endpoint(**kwargs):
+        session: AsyncSession = kwargs.pop("session")
+        return await session.run_sync(lambda sync_session: fn(session=sync_session, **kwargs))
+
+    endpoint.__name__ = fn.__name__
+    endpoint.__qualname__ = fn.__qualname__
+    endpoint.__doc__ = fn.__doc__
+    endpoint.__module__ = fn.__module__
+    endpoint.__signature__ = signature.replace(
+        parameters=[_swap_dependency(p) for p in signature.parameters.values()],
+        return_annotation=inspect.Signature.empty,
+    )
+    return endpoint
+
+
+async_get_current_user = to_async(get_current_user)
+_ASYNC_DEPENDENCIES[get_current_user] = async_get_current_user
+
+
+async def async_get_read_session(current_user: Annotated[UserInfo, Depends(async_get_current_user)]):
+    async for session in async_read_session(current_user.id):
+        yield session
+
+
+_ASYNC_DEPENDENCIES[get_read_session] = async_get_read_session
+
+
+def async_router(router: APIRouter) -> APIRouter:
+    """Copy of `router` whose session-backed endpoints are async."""
+    converted = APIRouter()
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            converted.routes.append(route)
+            continue
+        converted.add_api_route(
+            route.path,
+            to_async(route.endpoint),
+            response_model=route.response_model,
+            response_model_exclude_unset=route.response_model_exclude_unset,
+            status_code=route.status_code,
+            tags=route.tags,
+            dependencies=route.dependencies,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            deprecated=route.deprecated,
+            methods=route.methods,
+            operation_id=route.operation_id,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+            name=route.name,
+            openapi_extra=route.openapi_extra,
+        )
+    return converted
@@ -1,16 +1,62 @@
-from typing import Annotated
+from contextlib import contextmanager
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from src.core.conditional import collection_validators, is_fresh, not_modified, row_validators, set_validators
 from src.core.database import get_session
-from src.core.constants import AREA_NOT_FOUND
+from src.core.pagination import NEXT_CURSOR_HEADER, keyset_page
+from src.core.serialization import respond
+from src.core.constants import AREA_NOT_FOUND, INVALID_CURSOR
 from src.models.userinfo import UserInfo
 from src.models.area import Area, AreaCreate, AreaPublic, AreaUpdate
-from src.routes.user import get_current_user
+from src.routes.user import get_current_user, get_read_session
+from src.services.writes import delete_owned, release_area_children, update_owned
 
 router = APIRouter()
 
+# List order for cursor pages; areas are few per user.
+LIST_ORDER = ((Area.id, False),)
+
+
+def check_correct_area_id(session: Session, area_id: int, user_id: int) -> Area:
+    area = session.get(Area, area_id)
+    if not area or area.user_id != user_id:
+        raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
+    return area
+
+
+# The (area_id, user_id) keys of area_foreign_keys.
+AREA_OWNER_KEYS = frozenset({"fk_task_area_owner", "fk_note_area_owner"})
+
+
+def _is_area_violation(exc: IntegrityError) -> bool:
+    diag = getattr(exc.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name in AREA_OWNER_KEYS
+    # SQLite doesn't name the key; task and note have no other foreign key a
+    # request can break (user_id is always the caller's).
+    return "FOREIGN KEY constraint failed" in str(exc.orig)
+
+
+@contextmanager
+def area_not_found_on_violation(session: Session):
+    """Turn a rejected write of a task's or note's area_id into AREA_NOT_FOUND.
+
+    They reference their area by (area_id, user_id), so the database refuses
+    an area that doesn't exist or belongs to someone else. Any other
+    violation is re-raised.
+    """
+    try:
+        yield
+    except IntegrityError as exc:
+        if not _is_area_violation(exc):
+            raise
+        session.rollback()
+        raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
+
 
 @router.post("/areas/", response_model=AreaPublic)
 def create_area(
@@ -22,37 +68,60 @@ def create_area(
     area = Area.from_orm(area_in, update={"user_id": current_user.id})
     session.add(area)
     session.commit()
-    session.refresh(area)
     return area
 
 
-@router.get("/areas/", response_model=list[AreaPublic])
+@router.get("/areas/", response_model=list[AreaPublic], responses={400: {"description": INVALID_CURSOR}})
 def read_areas(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     offset: int = 0,
     limit: int = 100,
+    cursor: Annotated[Optional[str], Query(description=f"Value of {NEXT_CURSOR_HEADER} from the previous page")] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    accept: Annotated[Optional[str], Header()] = None,
+    response: Response,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    areas = session.exec(
-        select(Area)
-        .where(Area.user_id == current_user.id)
-        .offset(offset)
-        .limit(limit)
-    ).all()
-    return areas
+    etag, last_modified = collection_validators(
+        session, Area, current_user.id, offset=offset, limit=limit, cursor=cursor
+    )
+    if is_fresh(if_none_match, etag):
+        return not_modified(etag, last_modified)
+
+    select_expr = select(Area).where(Area.user_id == current_user.id)
+    try:
+        areas, next_cursor = keyset_page(session, select_expr, LIST_ORDER, "areas", limit, offset, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    set_validators(response, etag, last_modified)
+    return respond(list[AreaPublic], areas, response, accept)
 
 
 @router.get("/areas/{area_id}", response_model=AreaPublic, responses={404: {"description": AREA_NOT_FOUND}})
 def read_area(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     area_id: int,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    response: Response,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
+    if if_none_match:
+        # Revalidation: the row's timestamp is enough to answer 304.
+        updated_at = session.exec(
+            select(Area.updated_at).where(Area.id == area_id, Area.user_id == current_user.id)
+        ).first()
+        if updated_at is not None:
+            etag, last_modified = row_validators(Area, area_id, updated_at)
+            if is_fresh(if_none_match, etag):
+                return not_modified(etag, last_modified)
     area = session.get(Area, area_id)
     if not area or area.user_id != current_user.id:
         raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
+    set_validators(response, *row_validators(Area, area.id, area.updated_at))
     return area
 
 
@@ -64,15 +133,10 @@ def update_area(
     area_in: AreaUpdate,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    area = session.get(Area, area_id)
-    if not area or area.user_id != current_user.id:
+    area = update_owned(session, Area, area_id, current_user.id, area_in.dict(exclude_unset=True))
+    if area is None:
         raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
-    update_data = area_in.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(area, key, value)
-    session.add(area)
     session.commit()
-    session.refresh(area)
     return area
 
 
@@ -83,9 +147,9 @@ def delete_area(
     area_id: int,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    area = session.get(Area, area_id)
-    if not area or area.user_id != current_user.id:
+    # Its tasks and notes are kept, without an area.
+    release_area_children(session, area_id, current_user.id)
+    if not delete_owned(session, Area, area_id, current_user.id):
         raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
-    session.delete(area)
     session.commit()
     return {"ok": True}
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from typing import Annotated, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlmodel import Session, select
+
+from src.core.database import use_snapshot
+from src.core.pagination import keyset_page
+from src.core.serialization import adapter, respond
+from src.models.area import Area, AreaPublic
+from src.models.bootstrap import Bootstrap
+from src.models.note import Note, NotePublic, NoteSummary
+from src.models.task import Task, TaskPublic, TaskSummary
+from src.models.userinfo import UserInfo
+from src.routes import area as area_routes, note as note_routes, task as task_routes
+from src.routes.user import get_current_user, get_read_session
+from src.services.sync import sync_cursor
+
+router = APIRouter()
+
+
+@router.get("/bootstrap", response_model=Bootstrap)
+def read_bootstrap(
+    *,
+    session: Annotated[Session, Depends(get_read_session)],
+    limit: int = 100,
+    view: Annotated[Literal["full", "summary"], Query(description="'summary' omits task descriptions and note contents")] = "full",
+    accept: Annotated[Optional[str], Header()] = None,
+    current_user: Annotated[UserInfo, Depends(get_current_user)],
+):
+    """The user, their areas, tasks and notes in one response.
+
+    Each collection is the first page its list endpoint would return with the
+    same `limit` and `view`; `cursors` continues the ones that were cut off.
+    """
+    read_at = datetime.now(timezone.utc)
+    use_snapshot(session)
+    user = session.get(UserInfo, current_user.id)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials: UserInfo not found")
+
+    summary = view == "summary"
+    pages = {
+        "areas": (select(Area).where(Area.user_id == user.id), area_routes.LIST_ORDER, AreaPublic),
+        "tasks": (
+            select(*(task_routes.SUMMARY_COLUMNS if summary else (Task,))).where(Task.user_id == user.id),
+            task_routes.LIST_ORDER,
+            TaskSummary if summary else TaskPublic,
+        ),
+        "notes": (
+            select(*(note_routes.SUMMARY_COLUMNS if summary else (Note,))).where(Note.user_id == user.id),
+            note_routes.LIST_ORDER,
+            NoteSummary if summary else NotePublic,
+        ),
+    }
+    payload = {"user": user, "cursors": {}, "sync_cursor": sync_cursor(read_at)}
+    for kind, (select_expr, order, rendered_as) in pages.items():
+        rows, next_cursor = keyset_page(session, select_expr, order, kind, limit)
+        # Validated as the selected view here, the union in Bootstrap only has to recognise them.
+        payload[kind] = adapter(list[rendered_as]).validate_python(rows, from_attributes=True)
+        if next_cursor is not None:
+            payload["cursors"][kind] = next_cursor
+    return respond(Bootstrap, payload, accept=accept)
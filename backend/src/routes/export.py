@@ -0,0 +1,47 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from src.core.constants import INVALID_CURSOR
+from src.core.database import read_session, use_snapshot
+from src.core.serialization import header_qualities
+from src.models.userinfo import UserInfo
+from src.routes.user import get_current_user
+from src.services.export import NDJSON_MEDIA_TYPE, export_lines, gzipped, resume_point
+
+router = APIRouter()
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {NDJSON_MEDIA_TYPE: {}}, "description": "One JSON object per line, ending with an `end` line"},
+        400: {"description": INVALID_CURSOR},
+    },
+)
+def export_data(
+    *,
+    cursor: Annotated[Optional[str], Query(description="`cursor` of the last line received, to resume")] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
+    current_user: Annotated[UserInfo, Depends(get_current_user)],
+):
+    """All of the user's areas, tasks and notes as NDJSON, gzipped if the client accepts it."""
+    try:
+        started_at, *after = resume_point(cursor) if cursor else (datetime.now(timezone.utc),)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+
+    def lines():
+        # A session of its own: it lives as long as the stream, not the handler.
+        with contextmanager(read_session)(current_user.id) as session:
+            use_snapshot(session)
+            yield from export_lines(session, current_user.id, started_at, tuple(after) or None)
+
+    body, headers = lines(), {}
+    if header_qualities(accept_encoding or "").get("gzip", 0) > 0:
+        body, headers = gzipped(body), {"Content-Encoding": "gzip"}
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
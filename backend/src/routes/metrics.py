@@ -0,0 +1,35 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from src.core.config import settings
+from src.core.database import database_stats
+from src.core.invalidation import invalidation_stats
+from src.core.response_cache import response_cache
+from src.core.security import hash_pool_stats
+from src.core.token_cache import token_cache
+
+
+def require_metrics_token(authorization: Optional[str] = Header(default=None)) -> None:
+    """Let only a scraper holding METRICS_TOKEN in; without a token set, the endpoint doesn't exist."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404)
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    if authorization is None or not secrets.compare_digest(authorization.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"})
+
+
+# Mounted at the app root, outside the public API prefix (see main.py).
+router = APIRouter(dependencies=[Depends(require_metrics_token)])
+
+
+@router.get("/internal/metrics", include_in_schema=False)
+def read_metrics():
+    return {
+        "token_cache": token_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "cache_invalidation": invalidation_stats(),
+        "password_hashing": hash_pool_stats(),
+        "database": database_stats(),
+    }
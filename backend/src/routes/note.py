@@ -1,23 +1,27 @@
-from typing import Optional, Annotated
+from typing import Literal, Optional, Annotated, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlmodel import Session, select
 
+from src.core.conditional import collection_validators, is_fresh, not_modified, row_validators, set_validators
 from src.core.database import get_session
-from src.core.constants import AREA_NOT_FOUND, NOTE_NOT_FOUND
+from src.core.pagination import NEXT_CURSOR_HEADER, keyset_page
+from src.core.serialization import respond
+from src.core.constants import AREA_NOT_FOUND, INVALID_CURSOR, NOTE_NOT_FOUND
 from src.models.userinfo import UserInfo
-from src.models.area import Area
-from src.models.note import Note, NoteCreate, NotePublic, NoteUpdate
-from src.routes.user import get_current_user
+from src.models.note import Note, NoteCreate, NotePublic, NoteSummary, NoteUpdate
+from src.routes.area import area_not_found_on_violation, check_correct_area_id
+from src.routes.user import get_current_user, get_read_session
+from src.services.writes import delete_owned, update_owned
 
 router = APIRouter()
 
+# List order: most recently changed first. Matches ix_note_user_id_updated_at and
+# ix_note_user_id_area_id, so cursor pages are index seeks.
+LIST_ORDER = ((Note.updated_at, True), (Note.id, True))
 
-def check_correct_area_id(session: Session, area_id: int, user_id: int) -> Area:
-    area = session.get(Area, area_id)
-    if not area or area.user_id != user_id:
-        raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
-    return area
+# Columns selected for `view=summary`; the content is never read.
+SUMMARY_COLUMNS = tuple(getattr(Note, name) for name in NoteSummary.model_fields)
 
 
 @router.post("/notes/", response_model=NotePublic, responses={404: {"description": AREA_NOT_FOUND}})
@@ -27,44 +31,77 @@ def create_note(
     note_in: NoteCreate,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    check_correct_area_id(session, area_id=note_in.area_id, user_id=current_user.id)
-
     note = Note.from_orm(note_in, update={"user_id": current_user.id})
     session.add(note)
-    session.commit()
-    session.refresh(note)
+    with area_not_found_on_violation(session):
+        session.commit()
     return note
 
 
-@router.get("/notes/", response_model=list[NotePublic], responses={404: {"description": AREA_NOT_FOUND}})
+@router.get(
+    "/notes/",
+    response_model=Union[list[NotePublic], list[NoteSummary]],
+    responses={400: {"description": INVALID_CURSOR}, 404: {"description": AREA_NOT_FOUND}},
+)
 def read_notes(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     offset: int = 0,
     limit: int = 100,
     area_id: Optional[int] = None,
+    cursor: Annotated[Optional[str], Query(description=f"Value of {NEXT_CURSOR_HEADER} from the previous page")] = None,
+    view: Annotated[Literal["full", "summary"], Query(description="'summary' omits the content")] = "full",
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    accept: Annotated[Optional[str], Header()] = None,
+    response: Response,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    select_expr = select(Note).where(Note.user_id == current_user.id)
+    etag, last_modified = collection_validators(
+        session, Note, current_user.id, offset=offset, limit=limit, area_id=area_id, cursor=cursor, view=view
+    )
+    if is_fresh(if_none_match, etag):
+        return not_modified(etag, last_modified)
+
+    columns, rendered_as = (SUMMARY_COLUMNS, NoteSummary) if view == "summary" else ((Note,), NotePublic)
+    select_expr = select(*columns).where(Note.user_id == current_user.id)
     if area_id is not None:
-        check_correct_area_id(session, area_id=area_id, user_id=current_user.id)
         select_expr = select_expr.where(Note.area_id == area_id)
 
-    select_expr = select_expr.order_by(Note.updated_at.desc())
-    notes = session.exec(select_expr.offset(offset).limit(limit)).all()
-    return notes
+    try:
+        notes, next_cursor = keyset_page(session, select_expr, LIST_ORDER, "notes", limit, offset, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+    if not notes and area_id is not None:
+        # Only an empty page can hide an area that isn't the caller's.
+        check_correct_area_id(session, area_id=area_id, user_id=current_user.id)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    set_validators(response, etag, last_modified)
+    return respond(list[rendered_as], notes, response, accept)
 
 
 @router.get("/notes/{note_id}", response_model=NotePublic, responses={404: {"description": NOTE_NOT_FOUND}})
 def read_note(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     note_id: int,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    response: Response,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
+    if if_none_match:
+        # Revalidation: the row's timestamp is enough to answer 304.
+        updated_at = session.exec(
+            select(Note.updated_at).where(Note.id == note_id, Note.user_id == current_user.id)
+        ).first()
+        if updated_at is not None:
+            etag, last_modified = row_validators(Note, note_id, updated_at)
+            if is_fresh(if_none_match, etag):
+                return not_modified(etag, last_modified)
     note = session.get(Note, note_id)
     if not note or note.user_id != current_user.id:
         raise HTTPException(status_code=404, detail=NOTE_NOT_FOUND)
+    set_validators(response, *row_validators(Note, note.id, note.updated_at))
     return note
 
 
@@ -76,20 +113,11 @@ def update_note(
     note_in: NoteUpdate,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    note = session.get(Note, note_id)
-    if not note or note.user_id != current_user.id:
+    with area_not_found_on_violation(session):
+        note = update_owned(session, Note, note_id, current_user.id, note_in.dict(exclude_unset=True))
+    if note is None:
         raise HTTPException(status_code=404, detail=NOTE_NOT_FOUND)
-    update_data = note_in.dict(exclude_unset=True)
-
-    if "area_id" in update_data:
-        check_correct_area_id(session, area_id=update_data["area_id"], user_id=current_user.id)
-
-    for key, value in update_data.items():
-        setattr(note, key, value)
-
-    session.add(note)
     session.commit()
-    session.refresh(note)
     return note
 
 
@@ -100,9 +128,7 @@ def delete_note(
     note_id: int,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    note = session.get(Note, note_id)
-    if not note or note.user_id != current_user.id:
+    if not delete_owned(session, Note, note_id, current_user.id):
         raise HTTPException(status_code=404, detail=NOTE_NOT_FOUND)
-    session.delete(note)
     session.commit()
     return {"ok": True}
\ No newline at end of file
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+
+from src.core.constants import INVALID_CURSOR
+from src.core.database import use_snapshot
+from src.models.sync import SyncChanges
+from src.models.userinfo import UserInfo
+from src.routes.user import get_current_user, get_read_session
+from src.services.sync import changes_since, cursor_time, is_expired, sync_cursor
+
+router = APIRouter()
+
+
+@router.get("/sync", response_model=SyncChanges, responses={400: {"description": INVALID_CURSOR}})
+def read_sync(
+    *,
+    session: Annotated[Session, Depends(get_read_session)],
+    since: Annotated[Optional[str], Query(description="`cursor` of the previous sync, or `sync_cursor` of /bootstrap")] = None,
+    current_user: Annotated[UserInfo, Depends(get_current_user)],
+):
+    """What changed since `since`; everything (`full`) without it or once it has expired."""
+    try:
+        after = cursor_time(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+    # Before the snapshot is taken, so the cursor never gets ahead of what was read.
+    read_at = datetime.now(timezone.utc)
+    full = after is None or is_expired(after, read_at)
+    use_snapshot(session)
+    changes = changes_since(session, current_user.id, None if full else after)
+    return {**changes, "full": full, "cursor": sync_cursor(read_at)}
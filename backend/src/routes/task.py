@@ -1,23 +1,30 @@
-from typing import Optional, Annotated
+from typing import Literal, Optional, Annotated, Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import delete, update
 from sqlmodel import Session, select
 
-from src.core.database import get_session
-from src.core.constants import AREA_NOT_FOUND, TASK_NOT_FOUND
+from src.core.conditional import collection_validators, is_fresh, not_modified, row_validators, set_validators
+from src.core.database import get_session, record_write
+from src.core.pagination import NEXT_CURSOR_HEADER, keyset_page
+from src.core.serialization import respond
+from src.core.constants import AREA_NOT_FOUND, INVALID_CURSOR, TASK_NOT_FOUND
 from src.models.userinfo import UserInfo
-from src.models.area import Area
-from src.models.task import Task, TaskCreate, TaskPublic, TaskUpdate
-from src.routes.user import get_current_user
+from src.models.task import (
+    Task, TaskBulkResult, TaskBulkUpdate, TaskCreate, TaskPublic, TaskSelection, TaskSummary, TaskUpdate
+)
+from src.routes.area import area_not_found_on_violation, check_correct_area_id
+from src.routes.user import get_current_user, get_read_session
+from src.services.writes import delete_owned, leave_tombstones, update_owned
 
 router = APIRouter()
 
+# List order: most recently changed first. Matches ix_task_user_id_updated_at and
+# ix_task_user_id_area_id, so cursor pages are index seeks.
+LIST_ORDER = ((Task.updated_at, True), (Task.id, True))
 
-def check_correct_area_id(session: Session, area_id: int, user_id: int) -> Area:
-    area = session.get(Area, area_id)
-    if not area or area.user_id != user_id:
-        raise HTTPException(status_code=404, detail=AREA_NOT_FOUND)
-    return area
+# Columns selected for `view=summary`; the description is never read.
+SUMMARY_COLUMNS = tuple(getattr(Task, name) for name in TaskSummary.model_fields)
 
 
 @router.post("/tasks/", response_model=TaskPublic, responses={404: {"description": AREA_NOT_FOUND}})
@@ -27,43 +34,129 @@ def create_task(
     task_in: TaskCreate,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    check_correct_area_id(session, area_id=task_in.area_id, user_id=current_user.id)
-
     task = Task.from_orm(task_in, update={"user_id": current_user.id})
     session.add(task)
-    session.commit()
-    session.refresh(task)
+    with area_not_found_on_violation(session):
+        session.commit()
     return task
 
 
-@router.get("/tasks/", response_model=list[TaskPublic], responses={404: {"description": AREA_NOT_FOUND}})
+@router.get(
+    "/tasks/",
+    response_model=Union[list[TaskPublic], list[TaskSummary]],
+    responses={400: {"description": INVALID_CURSOR}, 404: {"description": AREA_NOT_FOUND}},
+)
 def read_tasks(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     offset: int = 0,
     limit: int = 100,
     area_id: Optional[int] = None,
+    cursor: Annotated[Optional[str], Query(description=f"Value of {NEXT_CURSOR_HEADER} from the previous page")] = None,
+    view: Annotated[Literal["full", "summary"], Query(description="'summary' omits the description")] = "full",
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    accept: Annotated[Optional[str], Header()] = None,
+    response: Response,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    select_expr = select(Task).where(Task.user_id == current_user.id)
+    etag, last_modified = collection_validators(
+        session, Task, current_user.id, offset=offset, limit=limit, area_id=area_id, cursor=cursor, view=view
+    )
+    if is_fresh(if_none_match, etag):
+        return not_modified(etag, last_modified)
+
+    columns, rendered_as = (SUMMARY_COLUMNS, TaskSummary) if view == "summary" else ((Task,), TaskPublic)
+    select_expr = select(*columns).where(Task.user_id == current_user.id)
     if area_id is not None:
-        check_correct_area_id(session, area_id=area_id, user_id=current_user.id)
         select_expr = select_expr.where(Task.area_id == area_id)
 
-    tasks = session.exec(select_expr.offset(offset).limit(limit)).all()
-    return tasks
+    try:
+        tasks, next_cursor = keyset_page(session, select_expr, LIST_ORDER, "tasks", limit, offset, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=INVALID_CURSOR)
+    if not tasks and area_id is not None:
+        # Only an empty page can hide an area that isn't the caller's.
+        check_correct_area_id(session, area_id=area_id, user_id=current_user.id)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    set_validators(response, etag, last_modified)
+    return respond(list[rendered_as], tasks, response, accept)
+
+
+def _selected(selection: TaskSelection, user_id: int) -> list:
+    clauses = [Task.user_id == user_id]
+    if selection.ids is not None:
+        clauses.append(Task.id.in_(selection.ids))
+    if selection.area_id is not None:
+        clauses.append(Task.area_id == selection.area_id)
+    if selection.completed is not None:
+        clauses.append(Task.completed == selection.completed)
+    return clauses
+
+
+@router.post("/tasks/bulk/update", response_model=TaskBulkResult, responses={404: {"description": AREA_NOT_FOUND}})
+def bulk_update_tasks(
+    *,
+    session: Annotated[Session, Depends(get_session)],
+    bulk_in: TaskBulkUpdate,
+    current_user: Annotated[UserInfo, Depends(get_current_user)],
+):
+    """Apply the same changes to every selected task in one UPDATE; returns the ids changed."""
+    with area_not_found_on_violation(session):
+        ids = session.exec(
+            update(Task)
+            .where(*_selected(bulk_in.where, current_user.id))
+            .values(**bulk_in.changes.model_dump(exclude_unset=True))
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+    record_write(session, current_user.id, Task, ids)
+    session.commit()
+    return TaskBulkResult(ids=sorted(ids))
+
+
+@router.post("/tasks/bulk/delete", response_model=TaskBulkResult)
+def bulk_delete_tasks(
+    *,
+    session: Annotated[Session, Depends(get_session)],
+    selection: TaskSelection,
+    current_user: Annotated[UserInfo, Depends(get_current_user)],
+):
+    """Delete every selected task in one DELETE; returns the ids deleted."""
+    ids = session.exec(
+        delete(Task)
+        .where(*_selected(selection, current_user.id))
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    ).scalars().all()
+    leave_tombstones(session, Task, current_user.id, ids)
+    record_write(session, current_user.id, Task, ids)
+    session.commit()
+    return TaskBulkResult(ids=sorted(ids))
 
 
 @router.get("/tasks/{task_id}", response_model=TaskPublic, responses={404: {"description": TASK_NOT_FOUND}})
 def read_task(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     task_id: int,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    response: Response,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
+    if if_none_match:
+        # Revalidation: the row's timestamp is enough to answer 304.
+        updated_at = session.exec(
+            select(Task.updated_at).where(Task.id == task_id, Task.user_id == current_user.id)
+        ).first()
+        if updated_at is not None:
+            etag, last_modified = row_validators(Task, task_id, updated_at)
+            if is_fresh(if_none_match, etag):
+                return not_modified(etag, last_modified)
     task = session.get(Task, task_id)
     if not task or task.user_id != current_user.id:
         raise HTTPException(status_code=404, detail=TASK_NOT_FOUND)
+    set_validators(response, *row_validators(Task, task.id, task.updated_at))
     return task
 
 
@@ -75,20 +168,11 @@ def update_task(
     task_in: TaskUpdate,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    task = session.get(Task, task_id)
-    if not task or task.user_id != current_user.id:
+    with area_not_found_on_violation(session):
+        task = update_owned(session, Task, task_id, current_user.id, task_in.dict(exclude_unset=True))
+    if task is None:
         raise HTTPException(status_code=404, detail=TASK_NOT_FOUND)
-    update_data = task_in.dict(exclude_unset=True)
-
-    if "area_id" in update_data:
-        check_correct_area_id(session, area_id=update_data["area_id"], user_id=current_user.id)
-
-    for key, value in update_data.items():
-        setattr(task, key, value)
-
-    session.add(task)
     session.commit()
-    session.refresh(task)
     return task
 
 
@@ -99,9 +183,7 @@ def delete_task(
     task_id: int,
     current_user: Annotated[UserInfo, Depends(get_current_user)],
 ):
-    task = session.get(Task, task_id)
-    if not task or task.user_id != current_user.id:
+    if not delete_owned(session, Task, task_id, current_user.id):
         raise HTTPException(status_code=404, detail=TASK_NOT_FOUND)
-    session.delete(task)
     session.commit()
     return {"ok": True}
\ No newline at end of file
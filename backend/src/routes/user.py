@@ -6,13 +6,20 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import ValidationError
 from sqlmodel import Session, select
 
-from src.core.database import get_session
+from src.core.database import get_session, read_session
+from src.core.constants import AUTH_BUSY
 from src.core.security import (
     create_access_token, decode_access_token,
-    verify_password, get_password_hash
+    verify_password, get_password_hash, PasswordHashQueueFull
 )
+from src.core.token_cache import token_cache
 from src.models.userinfo import UserInfo, UserCreate, UserToken, UserPublic
+from src.models.refresh_token import RefreshRequest
 from src.models.area import Area
+from src.services.auth import (
+    access_token_claims, issue_refresh_token,
+    rotate_refresh_token, revoke_refresh_token
+)
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
@@ -21,6 +28,10 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login")
 def get_current_user(
     session: Annotated[Session, Depends(get_session)], token: Annotated[str, Depends(oauth2_scheme)]
 ) -> UserInfo:
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached.user
+
     try:
         payload = decode_access_token(token)
         token_email: Optional[str] = payload.get("sub")
@@ -36,13 +47,29 @@ def get_current_user(
             status_code=401,
             detail="Could not validate credentials",
         )
-    user = session.exec(select(UserInfo).where(UserInfo.email == token_email)).first()
-    if not user:
-        raise HTTPException(status_code=401, detail="Invalid authentication credentials: UserInfo not found")
+    user_id = payload.get("uid")
+    if user_id is not None:
+        # Access tokens carry everything routes need about the caller.
+        user = UserInfo(id=user_id, email=token_email, full_name=payload.get("name"))
+    else:
+        # Tokens issued before the id was embedded only carry the email.
+        user = session.exec(select(UserInfo).where(UserInfo.email == token_email)).first()
+        if not user:
+            raise HTTPException(status_code=401, detail="Invalid authentication credentials: UserInfo not found")
+    token_cache.put(token, payload, user)
     return user
 
 
-@router.post("/users/register", response_model=UserToken, responses={400: {"description": "User already exists"}})
+def get_read_session(current_user: Annotated[UserInfo, Depends(get_current_user)]):
+    """Session for read-only handlers; routed to the replica when one is configured."""
+    yield from read_session(current_user.id)
+
+
+@router.post(
+    "/users/register",
+    response_model=UserToken,
+    responses={400: {"description": "User already exists"}, 503: {"description": AUTH_BUSY}},
+)
 def create_user(*, session: Annotated[Session, Depends(get_session)], user_in: UserCreate):
     user = session.exec(select(UserInfo).where(UserInfo.email == user_in.email)).first()
     if user:
@@ -50,42 +77,85 @@ def create_user(*, session: Annotated[Session, Depends(get_session)], user_in: U
             status_code=400,
             detail="The user with this username already exists in the system.",
         )
-    hashed_password = get_password_hash(user_in.password)
+    try:
+        hashed_password = get_password_hash(user_in.password)
+    except PasswordHashQueueFull:
+        raise HTTPException(status_code=503, detail=AUTH_BUSY)
     user = UserInfo.from_orm(user_in, update={"hashed_password": hashed_password})
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    # INSERT ... RETURNING id; the user, their area and refresh token commit together.
+    session.flush()
 
     # Create a default "Work" area for the new user
     work_area = Area(name="Work", color="bg-blue-500", user_id=user.id)
     session.add(work_area)
+    refresh_token = issue_refresh_token(session, user)
     session.commit()
-    session.refresh(work_area)
 
-    access_token = create_access_token(subject=user.email)
-    return UserToken(access_token=access_token)
+    access_token = create_access_token(subject=user.email, claims=access_token_claims(user))
+    return UserToken(access_token=access_token, refresh_token=refresh_token)
 
 
-@router.post("/users/login", responses={400: {"description": "Incorrect email or password"}})
+@router.post(
+    "/users/login",
+    responses={400: {"description": "Incorrect email or password"}, 503: {"description": AUTH_BUSY}},
+)
 def login(
     *,
     session: Annotated[Session, Depends(get_session)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
     user: UserInfo = session.exec(select(UserInfo).where(UserInfo.email == form_data.username)).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    try:
+        password_ok = user is not None and verify_password(form_data.password, user.hashed_password)
+    except PasswordHashQueueFull:
+        raise HTTPException(status_code=503, detail=AUTH_BUSY)
+    if not password_ok:
         raise HTTPException(
             status_code=400, detail="Incorrect email or password"
         )
 
     user.last_login = datetime.now(timezone.utc)
     session.add(user)
+    refresh_token = issue_refresh_token(session, user)
     session.commit()
 
-    access_token = create_access_token(subject=user.email)
-    return UserToken(access_token=access_token)
+    access_token = create_access_token(subject=user.email, claims=access_token_claims(user))
+    return UserToken(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.post("/users/refresh", response_model=UserToken, responses={401: {"description": "Invalid refresh token"}})
+def refresh_access_token(
+    *,
+    session: Annotated[Session, Depends(get_session)],
+    refresh_in: RefreshRequest,
+):
+    rotated = rotate_refresh_token(session, refresh_in.refresh_token)
+    if rotated is None:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    user, refresh_token = rotated
+
+    access_token = create_access_token(subject=user.email, claims=access_token_claims(user))
+    return UserToken(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.post("/users/logout")
+def logout(
+    *,
+    session: Annotated[Session, Depends(get_session)],
+    refresh_in: RefreshRequest,
+):
+    revoke_refresh_token(session, refresh_in.refresh_token)
+    return {"ok": True}
 
 
 @router.get("/users/me", response_model=UserPublic)
-def read_users_me(current_user: Annotated[UserInfo, Depends(get_current_user)]):
-    return current_user
+def read_users_me(
+    session: Annotated[Session, Depends(get_read_session)],
+    current_user: Annotated[UserInfo, Depends(get_current_user)],
+):
+    # The token principal has no timestamps; load the row for the full profile.
+    user = session.get(UserInfo, current_user.id)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials: UserInfo not found")
+    return user
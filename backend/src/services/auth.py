@@ -0,0 +1,98 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import or_, update
+from sqlmodel import Session, select
+
+from src.core.config import settings
+from src.models.refresh_token import RefreshToken
+from src.models.userinfo import UserInfo
+
+
+def _hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def access_token_claims(user: UserInfo) -> dict:
+    """Claims that let routes build the current user without a DB lookup."""
+    return {"uid": user.id, "name": user.full_name, "typ": "access"}
+
+
+def issue_refresh_token(session: Session, user: UserInfo) -> str:
+    """Add a new refresh token row for `user`; the caller commits."""
+    token = secrets.token_urlsafe(32)
+    session.add(
+        RefreshToken(
+            user_id=user.id,
+            token_hash=_hash_refresh_token(token),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return token
+
+
+def revoke_user_refresh_tokens(session: Session, user_id: int) -> None:
+    session.exec(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)  # noqa: E712
+        .values(revoked=True)
+    )
+
+
+def rotate_refresh_token(session: Session, token: str) -> Optional[tuple[UserInfo, str]]:
+    """Exchange a refresh token for a new one, revoking the old one.
+
+    Returns the token owner and the new refresh token, or None when the token is unknown, expired or revoked. Presenting an
+    already revoked token revokes every token of that user, since it means the
+    token was replayed after rotation - unless it was rotated within the last
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS, which is a concurrent refresh that lost
+    the race and must not log the winner out.
+    """
+    token_hash = _hash_refresh_token(token)
+    now = datetime.now(timezone.utc)
+    # One conditional UPDATE claims the token: of two concurrent rotations only
+    # one can flip `revoked`, so a token never forks into two live ones.
+    user_id = session.exec(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked == False,  # noqa: E712
+            RefreshToken.expires_at > now,
+        )
+        .values(revoked=True, rotated_at=now)
+        .returning(RefreshToken.user_id)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if user_id is None:
+        grace_start = now - timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+        replayed_owner = session.exec(
+            select(RefreshToken.user_id).where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked == True,  # noqa: E712
+                or_(RefreshToken.rotated_at.is_(None), RefreshToken.rotated_at <= grace_start),
+            )
+        ).first()
+        if replayed_owner is not None:
+            revoke_user_refresh_tokens(session, replayed_owner)
+            session.commit()
+        return None
+
+    user = session.get(UserInfo, user_id)
+    if user is None:
+        session.rollback()
+        return None
+
+    new_token = issue_refresh_token(session, user)
+    session.commit()
+    return user, new_token
+
+
+def revoke_refresh_token(session: Session, token: str) -> None:
+    session.exec(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == _hash_refresh_token(token))
+        .values(revoked=True)
+    )
+    session.commit()
@@ -0,0 +1,90 @@
+"""Full export of a user's data for `/export`, as NDJSON.
+
+The user's areas, then tasks, then notes, each in id order, one JSON object
+per line:
+
+    {"type": "task", "cursor": "...", "data": {...TaskPublic...}}
+
+and a last line `{"type": "end", "sync_cursor": "..."}`; a stream without it
+was cut off. Rows come from a server-side cursor (`yield_per`, which on
+Postgres is a named cursor) in batches of EXPORT_BATCH_ROWS, and each batch
+goes out as one chunk, so memory stays flat however many rows there are.
+
+Every line's `cursor` resumes the export right after that line. Resuming
+reads a new snapshot: rows changed behind the cursor in the meantime are
+not sent again. The cursor carries the time the export started, so the
+`sync_cursor` at the end is that of the original read; a `/sync` from it
+picks up whatever changed while the export ran or was interrupted.
+"""
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from sqlmodel import Session, select
+
+from src.core.config import settings
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.serialization import adapter
+from src.models.area import Area, AreaPublic
+from src.models.note import Note, NotePublic
+from src.models.task import Task, TaskPublic
+from src.services.sync import sync_cursor
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Line type -> (model, what a row is exported as), in export order.
+EXPORT_MODELS = {
+    Area.__tablename__: (Area, AreaPublic),
+    Task.__tablename__: (Task, TaskPublic),
+    Note.__tablename__: (Note, NotePublic),
+}
+
+CURSOR_KIND = "export"
+
+
+def resume_point(cursor: str) -> tuple[datetime, str, int]:
+    """(start of the export, line type, last id sent) of a line's cursor. Raises ValueError for anything else."""
+    kind, key = decode_cursor(cursor)
+    if kind != CURSOR_KIND or len(key) != 3:
+        raise ValueError("Invalid cursor")
+    started_at, line_type, row_id = key
+    if not isinstance(started_at, datetime) or line_type not in EXPORT_MODELS or not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    return started_at, line_type, row_id
+
+
+def export_lines(
+    session: Session,
+    user_id: int,
+    started_at: datetime,
+    after: Optional[tuple[str, int]] = None,
+    batch_rows: Optional[int] = None,
+) -> Iterator[bytes]:
+    """The export as chunks of NDJSON lines, one chunk per batch; from right after `after` (type, id) if given."""
+    batch_rows = batch_rows or settings.EXPORT_BATCH_ROWS
+    types = list(EXPORT_MODELS)
+    first = types.index(after[0]) if after else 0
+    for line_type in types[first:]:
+        model, exported_as = EXPORT_MODELS[line_type]
+        row_adapter = adapter(exported_as)
+        columns = [getattr(model, name) for name in exported_as.model_fields]
+        statement = select(*columns).where(model.user_id == user_id)
+        if after and line_type == after[0]:
+            statement = statement.where(model.id > after[1])
+        statement = statement.order_by(model.id).execution_options(yield_per=batch_rows)
+        prefix = b'{"type":"' + line_type.encode() + b'","cursor":"'
+        for rows in session.exec(statement).partitions():
+            yield b"".join(
+                prefix + encode_cursor(CURSOR_KIND, [started_at, line_type, row.id]).encode() + b'","data":'
+                + row_adapter.dump_json(row_adapter.validate_python(row, from_attributes=True)) + b"}\n"
+                for row in rows
+            )
+    yield b'{"type":"end","sync_cursor":"' + sync_cursor(started_at).encode() + b'"}\n'
+
+
+def gzipped(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """`chunks` as one gzip stream, flushed after each chunk so every batch arrives whole."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
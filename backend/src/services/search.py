@@ -0,0 +1,329 @@
+"""Full-text search backends for `/search/`.
+
+- Postgres: a generated `search_vector tsvector` column with a GIN index,
+  matched with `@@` and ranked with `ts_rank`.
+- SQLite: external-content FTS5 tables kept in sync by triggers, ranked
+  with `bm25`.
+- Anything else (or a database without the FTS objects): the original
+  `ilike('%query%')` scan.
+
+Every backend orders and limits in SQL (see `_order_by`), so a broad query
+only loads the `limit` rows that are returned.
+
+Both full-text backends use the 'simple' configuration/unicode61 tokenizer
+(no stemming) and prefix-match every query term, so local SQLite and
+production Postgres return the same matches.
+"""
+import re
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from sqlalchemy import (
+    DDL, Float, Integer, String, cast, column, event, false, func, literal_column, null, or_, table, text, union_all,
+)
+from sqlalchemy.sql import Select
+from sqlmodel import Session, select
+
+from src.core.pagination import decode_cursor, encode_cursor, keyset_after
+from src.models.note import Note, NoteSearchResult
+from src.models.task import TASK_SEARCH_ORDER, Task, TaskSearchResult, priority_ordinal
+
+# Searchable text columns per table.
+SEARCH_FIELDS = {
+    Task: ("title", "description"),
+    Note: ("title", "content"),
+}
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def query_terms(query: str) -> list[str]:
+    return _TERM.findall(query.lower())
+
+
+def _pg_vector_sql(model) -> str:
+    columns = " || ' ' || ".join(f"coalesce({c}, '')" for c in SEARCH_FIELDS[model])
+    return f"to_tsvector('simple', {columns})"
+
+
+def _register_ddl(model) -> None:
+    table = model.__table__
+    name = table.name
+    columns = SEARCH_FIELDS[model]
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+
+    postgres = [
+        f"ALTER TABLE {name} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_pg_vector_sql(model)}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{name}_search_vector ON {name} USING gin (search_vector)",
+    ]
+    sqlite = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name}_fts USING fts5({cols}, content='{name}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_fts_ai AFTER INSERT ON {name} BEGIN "
+        f"INSERT INTO {name}_fts(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_fts_ad AFTER DELETE ON {name} BEGIN "
+        f"INSERT INTO {name}_fts({name}_fts, rowid, {cols}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_fts_au AFTER UPDATE ON {name} BEGIN "
+        f"INSERT INTO {name}_fts({name}_fts, rowid, {cols}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {name}_fts(rowid, {cols}) VALUES (new.id, {new_values}); END",
+    ]
+    for statement in postgres:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    for statement in sqlite:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {name}_fts").execute_if(dialect="sqlite"))
+
+
+for _model in SEARCH_FIELDS:
+    _register_ddl(_model)
+
+
+def _order_by(model, rank=None) -> list:
+    """Result order: tasks by status/priority/due date, notes newest first.
+
+    The text rank breaks ties between tasks and comes first for notes. The
+    ilike path has no rank, which lets both orders be read straight off
+    ix_task_user_id_search_order / ix_note_user_id_updated_at.
+    """
+    if model is Task:
+        keys = list(TASK_SEARCH_ORDER)
+        if rank is not None:
+            keys.append(rank.desc())
+        return keys + [Task.id]
+    keys = [] if rank is None else [rank.desc()]
+    return keys + [model.updated_at.desc(), model.id.desc()]
+
+
+def _sort_keys(model, rank=None) -> list[tuple[Any, bool]]:
+    """`_order_by` as (expression, descending) pairs for cursors, with no NULLs."""
+    if model is Task:
+        keys = [
+            (Task.completed, False),
+            (priority_ordinal, True),
+            (Task.due_date.is_(None), False),
+            (func.coalesce(Task.due_date, ""), False),
+        ]
+        if rank is not None:
+            keys.append((rank, True))
+        return keys + [(Task.id, False)]
+    keys = [] if rank is None else [(rank, True)]
+    return keys + [(model.updated_at, True), (model.id, True)]
+
+
+class SearchBackend(ABC):
+    """Matches a query against a model's SEARCH_FIELDS for one user."""
+
+    name: str
+
+    def rank(self, model, query: str):
+        """Relevance of a matching row (higher is better), or None if unranked."""
+        return None
+
+    @abstractmethod
+    def where(self, statement: Select, model, user_id: int, query: str) -> Optional[Select]:
+        """`statement` narrowed to the user's matches; None if nothing can match."""
+
+
+class IlikeSearch(SearchBackend):
+    """Substring match without an index; the fallback everywhere."""
+
+    name = "ilike"
+
+    def where(self, statement: Select, model, user_id: int, query: str) -> Optional[Select]:
+        pattern = f"%{query}%"
+        return statement.where(
+            model.user_id == user_id,
+            or_(*(getattr(model, c).ilike(pattern) for c in SEARCH_FIELDS[model])),
+        )
+
+
+class PostgresFullTextSearch(SearchBackend):
+    name = "postgres"
+
+    @staticmethod
+    def _match(model, query: str):
+        terms = query_terms(query)
+        vector = literal_column(f"{model.__tablename__}.search_vector")
+        return vector, func.to_tsquery("simple", " & ".join(f"{t}:*" for t in terms)), bool(terms)
+
+    def rank(self, model, query: str):
+        vector, tsquery, _ = self._match(model, query)
+        return func.ts_rank(vector, tsquery)
+
+    def where(self, statement: Select, model, user_id: int, query: str) -> Optional[Select]:
+        vector, tsquery, has_terms = self._match(model, query)
+        if not has_terms:
+            return None
+        return statement.where(model.user_id == user_id, vector.op("@@")(tsquery))
+
+
+class SqliteFullTextSearch(SearchBackend):
+    name = "sqlite"
+
+    def rank(self, model, query: str):
+        # bm25() is "lower is better"; negate so higher ranks sort first.
+        return -func.bm25(literal_column(f"{model.__tablename__}_fts"))
+
+    def where(self, statement: Select, model, user_id: int, query: str) -> Optional[Select]:
+        terms = query_terms(query)
+        if not terms:
+            return None
+        fts = table(f"{model.__tablename__}_fts", column("rowid"))
+        match = " AND ".join(f'"{t}"*' for t in terms)
+        return statement.join(fts, fts.c.rowid == model.id).where(
+            model.user_id == user_id, literal_column(fts.name).op("MATCH")(match)
+        )
+
+
+_ilike = IlikeSearch()
+_backends: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+
+
+def _detect(connection) -> Optional[Any]:
+    dialect = connection.dialect.name
+    tables = [model.__tablename__ for model in SEARCH_FIELDS]
+    if dialect == "postgresql":
+        found = connection.execute(
+            text(
+                "SELECT count(*) FROM information_schema.columns "
+                "WHERE column_name = 'search_vector' AND table_name = ANY(:tables)"
+            ),
+            {"tables": tables},
+        ).scalar()
+        return PostgresFullTextSearch() if found == len(tables) else None
+    if dialect == "sqlite":
+        found = connection.execute(
+            text("SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name IN (%s)"
+                 % ", ".join(f"'{t}_fts'" for t in tables))
+        ).scalar()
+        return SqliteFullTextSearch() if found == len(tables) else None
+    return None
+
+
+def get_search_backend(session: Session):
+    """Pick the backend for the session's database, caching the choice per engine."""
+    bind = session.get_bind()
+    if getattr(getattr(bind, "dialect", None), "name", None) not in ("postgresql", "sqlite"):
+        return _ilike
+    backend = _backends.get(bind)
+    if backend is None:
+        backend = _detect(session.connection()) or _ilike
+        _backends[bind] = backend
+    return backend
+
+
+# Unified search: tasks and notes in one UNION ALL, tasks first (as before),
+# each branch in its own order. Both branches produce the same columns, and
+# the k_* columns make one sort key that keeps each branch's order.
+KINDS = {"task": Task, "note": Note}
+
+
+def _search_columns(kind: str, rank) -> list:
+    # Constants are rendered inline and NULLs are cast, so Postgres can type
+    # every UNION column without looking at bound parameters.
+    score = (rank if rank is not None else literal_column("0.0", Float)).label("score")
+    if kind == "task":
+        return [
+            literal_column("'task'", String).label("kind"),
+            Task.id.label("id"),
+            Task.title.label("title"),
+            Task.description.label("body"),
+            Task.due_date.label("due_date"),
+            Task.completed.label("completed"),
+            Task.priority.label("priority"),
+            literal_column("0", Integer).label("k_kind"),
+            Task.completed.label("k_done"),
+            priority_ordinal.label("k_prio"),
+            Task.due_date.is_(None).label("k_undated"),
+            func.coalesce(Task.due_date, literal_column("''")).label("k_due"),
+            score,
+            cast(null(), Note.updated_at.type).label("k_updated"),
+            Task.id.label("k_id"),
+        ]
+    return [
+        literal_column("'note'", String).label("kind"),
+        Note.id.label("id"),
+        Note.title.label("title"),
+        Note.content.label("body"),
+        cast(null(), Task.due_date.type).label("due_date"),
+        cast(null(), Task.completed.type).label("completed"),
+        cast(null(), Task.priority.type).label("priority"),
+        literal_column("1", Integer).label("k_kind"),
+        false().label("k_done"),
+        literal_column("0", Integer).label("k_prio"),
+        false().label("k_undated"),
+        literal_column("''", String).label("k_due"),
+        score,
+        Note.updated_at.label("k_updated"),
+        (-Note.id).label("k_id"),
+    ]
+
+
+def _cursor_key(row, ranked: bool) -> list:
+    """Values of `_sort_keys` for a unified row, for the cursor after it."""
+    ranked = [row.score] if ranked else []
+    if row.kind == "task":
+        return [row.k_done, row.k_prio, row.k_undated, row.k_due, *ranked, row.id]
+    return [*ranked, row.k_updated, row.id]
+
+
+def _to_result(row):
+    if row.kind == "task":
+        return TaskSearchResult(
+            id=row.id, title=row.title, description=row.body, due_date=row.due_date,
+            completed=row.completed, priority=row.priority,
+        )
+    return NoteSearchResult(id=row.id, title=row.title, content=row.body)
+
+
+def unified_search(
+    session: Session,
+    user_id: int,
+    query: str,
+    limit: int,
+    kinds: list[str],
+    cursor: Optional[str] = None,
+) -> tuple[list, Optional[str]]:
+    """One page of task and note matches in a single round trip.
+
+    Returns the results and the cursor of the next page (None on the last
+    page). Raises ValueError for a cursor that doesn't fit this search.
+    """
+    after_kind, after_key = decode_cursor(cursor) if cursor else (None, None)
+    if after_kind is not None and after_kind not in kinds:
+        raise ValueError("Invalid cursor")
+
+    backend = get_search_backend(session)
+    branches = []
+    for kind in kinds:
+        if after_kind == "note" and kind == "task":
+            continue  # every task was on an earlier page
+        model = KINDS[kind]
+        rank = backend.rank(model, query)
+        statement = backend.where(select(*_search_columns(kind, rank)), model, user_id, query)
+        if statement is None:
+            continue
+        if kind == after_kind:
+            statement = statement.where(keyset_after(_sort_keys(model, rank), after_key))
+        # Each branch is ordered and limited on its own so it can stop early.
+        branches.append(statement.order_by(*_order_by(model, rank)).limit(limit + 1).subquery())
+    if not branches:
+        return [], None
+
+    parts = [select(*branch.c) for branch in branches]
+    combined = (union_all(*parts) if len(parts) > 1 else parts[0]).subquery()
+    c = combined.c
+    statement = select(*c).order_by(
+        c.k_kind, c.k_done, c.k_prio.desc(), c.k_undated, c.k_due, c.score.desc(), c.k_updated.desc(), c.k_id
+    ).limit(limit + 1)
+    rows = session.exec(statement).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        ranked = backend.rank(KINDS[rows[-1].kind], query) is not None
+        next_cursor = encode_cursor(rows[-1].kind, _cursor_key(rows[-1], ranked))
+    return [_to_result(row) for row in rows], next_cursor
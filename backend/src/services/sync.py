@@ -0,0 +1,73 @@
+"""Delta sync for `/sync`.
+
+A sync cursor is a point in time. Everything the user created or updated
+after it comes back as rows, found through the (user_id, updated_at)
+indexes; everything deleted after it comes back as ids, from the
+tombstones the delete handlers leave (`src.services.writes`).
+
+`updated_at` is set when a row is written, not when the write commits, so a
+cursor is handed out `SYNC_OVERLAP_SECONDS` behind the read: a write still
+in flight (or on its way to the replica) falls inside the next sync's
+window instead of behind it. Clients apply rows as upserts, so seeing one
+twice is harmless.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlmodel import Session, select
+
+from src.core.config import settings
+from src.core.pagination import decode_cursor, encode_cursor
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.tombstone import Tombstone
+
+# Response key -> model, in the order clients should apply them.
+SYNC_MODELS = {"areas": Area, "tasks": Task, "notes": Note}
+
+CURSOR_KIND = "sync"
+
+
+def sync_cursor(read_at: datetime) -> str:
+    """Cursor for a client that has everything as of `read_at`."""
+    return encode_cursor(CURSOR_KIND, [read_at - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)])
+
+
+def cursor_time(cursor: str) -> datetime:
+    """The point in time of a sync cursor. Raises ValueError for anything else."""
+    kind, key = decode_cursor(cursor)
+    if kind != CURSOR_KIND or len(key) != 1 or not isinstance(key[0], datetime):
+        raise ValueError("Invalid cursor")
+    return key[0]
+
+
+def is_expired(since: datetime, now: datetime) -> bool:
+    """Whether tombstones from `since` on may already be gone."""
+    return since < now - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+
+
+def changes_since(session: Session, user_id: int, since: Optional[datetime]) -> dict[str, Any]:
+    """The user's rows changed after `since` and the ids deleted after it; all rows without `since`."""
+    changes: dict[str, Any] = {}
+    for name, model in SYNC_MODELS.items():
+        statement = select(model).where(model.user_id == user_id)
+        if since is not None:
+            statement = statement.where(model.updated_at > since)
+        changes[name] = session.exec(statement.order_by(model.updated_at, model.id)).all()
+
+    changes["deleted"] = deleted = {name: [] for name in SYNC_MODELS}
+    if since is None:
+        return changes
+    names = {model.__tablename__: name for name, model in SYNC_MODELS.items()}
+    # SQLite can hand a deleted row's id to a new row; the row wins.
+    live = {(model.__tablename__, row.id) for name, model in SYNC_MODELS.items() for row in changes[name]}
+    tombstones = session.exec(
+        select(Tombstone.entity, Tombstone.entity_id)
+        .where(Tombstone.user_id == user_id, Tombstone.deleted_at > since)
+        .order_by(Tombstone.deleted_at, Tombstone.id)
+    ).all()
+    for entity, entity_id in dict.fromkeys(tombstones):
+        if entity in names and (entity, entity_id) not in live:
+            deleted[names[entity]].append(entity_id)
+    return changes
@@ -0,0 +1,85 @@
+"""Single-statement writes to rows owned by a user.
+
+PATCH and DELETE handlers used to `session.get` the row, check its owner,
+change it, commit and `refresh` it: four round trips. Here the owner check
+is part of the statement (`WHERE id = ? AND user_id = ?`) and RETURNING
+hands back what the handler responds with, so a missing row and someone
+else's row both come back empty and the write is one round trip.
+
+Creates need no helper: flushing a new object already runs
+INSERT ... RETURNING id, and request sessions don't expire objects on
+commit, so nothing has to be read back afterwards.
+
+Deletes leave a `Tombstone` per row, so /sync can tell clients what is gone.
+"""
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, TypeVar
+
+from sqlalchemy import delete, insert, update
+from sqlmodel import Session, SQLModel, select
+
+from src.core.database import record_write
+from src.models.note import Note
+from src.models.task import Task
+from src.models.tombstone import Tombstone
+
+Model = TypeVar("Model", bound=SQLModel)
+
+
+def update_owned(session: Session, model: type[Model], row_id: int, user_id: int, values: dict[str, Any]) -> Optional[Model]:
+    """Apply `values` to the user's row and return it as updated, or None if they have no such row."""
+    owned = (model.id == row_id, model.user_id == user_id)
+    if not values:
+        # Nothing to write; don't bump updated_at.
+        return session.exec(select(model).where(*owned)).first()
+    row = session.exec(
+        update(model)
+        .where(*owned)
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    if row is not None:
+        record_write(session, user_id, model, [row_id])
+    return row
+
+
+def delete_owned(session: Session, model: type[SQLModel], row_id: int, user_id: int) -> bool:
+    """Delete the user's row and leave its tombstone; False if they have no such row."""
+    deleted = session.exec(
+        delete(model)
+        .where(model.id == row_id, model.user_id == user_id)
+        .returning(model.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if deleted is not None:
+        leave_tombstones(session, model, user_id, [row_id])
+        record_write(session, user_id, model, [row_id])
+    return deleted is not None
+
+
+def leave_tombstones(session: Session, model: type[SQLModel], user_id: int, ids: Iterable[int]) -> None:
+    """Record that the user's `model` rows `ids` were deleted, in one INSERT."""
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"user_id": user_id, "entity": model.__tablename__, "entity_id": row_id, "deleted_at": now}
+        for row_id in ids
+    ]
+    if rows:
+        session.exec(insert(Tombstone).values(rows))
+
+
+def release_area_children(session: Session, area_id: int, user_id: int) -> None:
+    """Make the effect of deleting an area on its tasks and notes visible to /sync.
+
+    The area foreign keys would null their area_id without touching
+    updated_at. Null it here instead, so updated_at moves. Run before
+    deleting the area; does nothing if the user has no such area.
+    """
+    for model in (Task, Note):
+        session.exec(
+            update(model)
+            .where(model.area_id == area_id, model.user_id == user_id)
+            .values(area_id=None)
+            .execution_options(synchronize_session=False)
+        )
@@ -10,6 +10,25 @@ from fastapi.testclient import TestClient
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+	"""Cached responses must not leak between tests that reuse user ids."""
+	from src.core.response_cache import response_cache
+
+	response_cache.clear()
+	yield
+	response_cache.clear()
+
+
+@pytest.fixture
+def postgres_url():
+	"""URL of a scratch Postgres database (TEST_POSTGRES_URL); tests using it are skipped without one."""
+	url = os.getenv("TEST_POSTGRES_URL")
+	if not url:
+		pytest.skip("TEST_POSTGRES_URL is not set")
+	return url
+
+
 @pytest.fixture
 def mock_session():
 	"""Reusable Mock for SQLModel Session-like behavior.
@@ -59,9 +78,13 @@ def client(mock_session):
 	def _override_get_session():
 		yield mock_session
 
+	from src.routes import user as user_mod
+
 	main_mod.app.dependency_overrides[database_mod.get_session] = _override_get_session
+	main_mod.app.dependency_overrides[user_mod.get_read_session] = _override_get_session
 	client = TestClient(main_mod.app)
 	yield client
 	# Clean up override after test
 	main_mod.app.dependency_overrides.pop(database_mod.get_session, None)
+	main_mod.app.dependency_overrides.pop(user_mod.get_read_session, None)
 
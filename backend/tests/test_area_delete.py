@@ -0,0 +1,174 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi import HTTPException
+from sqlalchemy import MetaData, event, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.core import database
+from src.models.area import Area, area_foreign_keys
+from src.models.note import Note
+from src.models.task import Task
+from src.models.tombstone import Tombstone
+from src.models.userinfo import UserInfo
+from src.routes.area import area_not_found_on_violation
+
+
+def _metadata(dialect: str) -> MetaData:
+    # The same schema with the area foreign keys area_foreign_keys builds for `dialect`.
+    metadata = MetaData()
+    for table in SQLModel.metadata.sorted_tables:
+        copy = table.to_metadata(metadata)
+        if table.name not in ("task", "note"):
+            continue
+        for fk in [fk for fk in copy.foreign_key_constraints if (fk.name or "").startswith(f"fk_{table.name}_area_")]:
+            copy.constraints.discard(fk)
+            for element in fk.elements:
+                element.parent.foreign_keys.discard(element)
+                copy.foreign_keys.discard(element)
+        for fk in area_foreign_keys(table.name, dialect):
+            copy.append_constraint(fk)
+    return metadata
+
+
+def _seed(engine) -> None:
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(Area(id=1, name="Doomed", color="c", user_id=1))
+        session.add(Area(id=2, name="Kept", color="c", user_id=1))
+        session.commit()
+        for i in range(1, 51):
+            session.add(Task(id=i, title=f"t{i}", area_id=1 + i % 2, user_id=1))
+            session.add(Note(id=i, title=f"n{i}", area_id=1 + i % 2, user_id=1))
+        session.commit()
+
+
+def _engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    _metadata("sqlite").create_all(engine)
+    _seed(engine)
+    return engine
+
+
+@pytest.fixture
+def delete_client(monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    def _client(engine):
+        monkeypatch.setattr(database, "engine", engine)
+        return TestClient(main_mod.app)
+
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield _client
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def test_delete_area_leaves_children_changes_for_sync(delete_client):
+    engine = _engine()
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement.split()[0])
+    event.listen(engine, "before_cursor_execute", listener)
+
+    response = delete_client(engine).delete("/api/v1/areas/1")
+
+    event.remove(engine, "before_cursor_execute", listener)
+    assert response.json() == {"ok": True}
+    # Per child table, nulling the area (which moves updated_at); then the area and its tombstone.
+    assert statements == ["UPDATE", "UPDATE", "DELETE", "INSERT"]
+    with Session(engine) as session:
+        tombstones = session.exec(select(Tombstone.entity, Tombstone.entity_id)).all()
+        for model in (Task, Note):
+            rows = session.exec(select(model)).all()
+            assert {r.area_id for r in rows if r.id % 2} == {2}
+            orphans = [r for r in rows if not r.id % 2]
+            kept = [r for r in rows if r.id % 2]
+            assert len(orphans) == 25 and all(r.area_id is None for r in orphans)
+            assert min(r.updated_at for r in orphans) > max(r.updated_at for r in kept)
+            assert not [i for entity, i in tombstones if entity == model.__tablename__]
+        assert session.get(Area, 1) is None
+        assert ("area", 1) in tombstones
+
+
+def test_delete_other_users_area_is_not_found(delete_client):
+    engine = _engine()
+    with Session(engine) as session:
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=3, name="Theirs", color="c", user_id=2))
+        session.commit()
+
+    assert delete_client(engine).delete("/api/v1/areas/3").status_code == 404
+    with Session(engine) as session:
+        assert session.get(Area, 3) is not None
+
+
+def test_postgres_owner_key_nulls_only_area_id():
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateTable
+
+    ddl = str(CreateTable(_metadata("postgresql").tables["task"]).compile(dialect=postgresql.dialect()))
+
+    assert "FOREIGN KEY(area_id, user_id) REFERENCES area (id, user_id) ON DELETE SET NULL (area_id)" in ddl
+    assert "fk_task_area_id" not in ddl
+
+
+def test_orm_delete_does_not_load_children():
+    engine = _engine()
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    with Session(engine) as session:
+        area = session.get(Area, 1)
+        event.listen(engine, "before_cursor_execute", listener)
+        session.delete(area)
+        session.commit()
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert [s.split()[0] for s in statements] == ["DELETE"]
+
+
+def test_postgres_deletes_an_area_with_children(postgres_url):
+    """Postgres runs the owner key's check and action as one trigger; no other key may get in first."""
+    engine = create_engine(postgres_url)
+    metadata = _metadata("postgresql")
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    try:
+        _seed(engine)
+        with engine.begin() as conn:
+            conn.execute(metadata.tables["area"].delete().where(metadata.tables["area"].c.id == 1))
+        with Session(engine) as session:
+            tasks = session.exec(select(Task.id, Task.area_id, Task.user_id)).all()
+        assert len(tasks) == 50
+        assert all(t.area_id is None for t in tasks if not t.id % 2)
+        assert all(t.user_id == 1 for t in tasks)
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
+
+
+def test_postgres_tells_area_violations_from_others(postgres_url):
+    """Postgres names the violated key; only the owner key means the area isn't the caller's."""
+    engine = create_engine(postgres_url)
+    metadata = _metadata("postgresql")
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    try:
+        _seed(engine)
+        with Session(engine) as session:
+            session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+            session.add(Area(id=3, name="Theirs", color="c", user_id=2))
+            session.commit()
+        for area_id in (3, 999):
+            with Session(engine) as session:
+                with pytest.raises(HTTPException):
+                    with area_not_found_on_violation(session):
+                        session.exec(update(Task).where(Task.id == 1).values(area_id=area_id))
+        with Session(engine) as session:
+            with pytest.raises(IntegrityError, match="not-null"):
+                with area_not_found_on_violation(session):
+                    session.exec(update(Task).where(Task.id == 1).values(title=None))
+    finally:
+        metadata.drop_all(engine)
+        engine.dispose()
@@ -0,0 +1,120 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+from src.routes.area import area_not_found_on_violation
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="Mine", color="c", user_id=1))
+        session.add(Area(id=2, name="Empty", color="c", user_id=1))
+        session.add(Area(id=3, name="Theirs", color="c", user_id=2))
+        session.add(Task(id=1, title="t", area_id=1, user_id=1))
+        session.add(Note(id=1, title="n", area_id=1, user_id=1))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def statements(engine):
+    seen = []
+    listener = lambda conn, cursor, statement, *args: seen.append(statement.split()[0])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield seen
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+@pytest.fixture
+def owner_client(engine, monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    def _override_read_session():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setattr(database, "engine", engine)
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    main_mod.app.dependency_overrides[user_mod.get_read_session] = _override_read_session
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+    main_mod.app.dependency_overrides.pop(user_mod.get_read_session, None)
+
+
+def test_sqlite_enforces_the_owner_key(engine):
+    with Session(engine) as session:
+        session.add(Task(title="sneaky", area_id=3, user_id=1))
+        with pytest.raises(Exception, match="FOREIGN KEY"):
+            session.commit()
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/", "/api/v1/notes/"])
+@pytest.mark.parametrize("area_id", [3, 999])
+def test_create_in_foreign_or_missing_area_is_not_found(owner_client, statements, path, area_id):
+    response = owner_client.post(path, json={"title": "x", "area_id": area_id})
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Area not found"
+    # The area isn't looked up; the INSERT itself is rejected.
+    assert statements == ["INSERT"]
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/1", "/api/v1/notes/1"])
+def test_move_to_foreign_area_is_not_found(owner_client, path):
+    assert owner_client.patch(path, json={"area_id": 3}).status_code == 404
+    assert owner_client.patch(path, json={"area_id": 2}).json()["area_id"] == 2
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/api/v1/tasks/1", {"title": None}),
+    ("/api/v1/tasks/1", {"completed": None}),
+    ("/api/v1/notes/1", {"title": None}),
+    ("/api/v1/tasks/bulk/update", {"where": {"ids": [1]}, "changes": {"completed": None}}),
+])
+def test_null_for_not_null_column_is_rejected(owner_client, statements, path, body):
+    send = owner_client.post if path.endswith("update") else owner_client.patch
+    response = send(path, json=body)
+
+    assert response.status_code == 422
+    assert statements == []
+
+
+def test_other_violations_are_not_area_not_found(engine):
+    with Session(engine) as session:
+        with pytest.raises(IntegrityError, match="NOT NULL"):
+            with area_not_found_on_violation(session):
+                session.exec(update(Task).where(Task.id == 1).values(title=None))
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/", "/api/v1/notes/"])
+@pytest.mark.parametrize("body", [{"title": "loose"}, {"title": "loose", "area_id": None}])
+def test_create_without_area(owner_client, path, body):
+    response = owner_client.post(path, json=body)
+
+    assert response.status_code == 200
+    assert response.json()["area_id"] is None
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/", "/api/v1/notes/"])
+def test_area_filtered_list(owner_client, statements, path):
+    assert [item["id"] for item in owner_client.get(path, params={"area_id": 1}).json()] == [1]
+    # The collection version for the ETag, then the page.
+    assert statements == ["SELECT", "SELECT"]
+
+    assert owner_client.get(path, params={"area_id": 2}).json() == []
+    assert owner_client.get(path, params={"area_id": 3}).status_code == 404
@@ -0,0 +1,101 @@
+import asyncio
+import inspect
+import secrets
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.util.concurrency import greenlet_spawn
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core import security
+from src.core.config import settings
+from src.core.database import get_async_session
+from src.models.userinfo import UserInfo
+from src.routes import area_router, search_router, task_router
+from src.routes.aio import async_get_current_user, async_get_read_session, async_router, to_async
+from src.routes.task import read_tasks
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    db_path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(sync_engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+
+    async def _override_get_async_session():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(async_router(area_router))
+    app.include_router(async_router(task_router))
+    app.include_router(async_router(search_router))
+    app.dependency_overrides[get_async_session] = _override_get_async_session
+    app.dependency_overrides[async_get_read_session] = _override_get_async_session
+    app.dependency_overrides[async_get_current_user] = lambda: UserInfo(id=1, email="u@x.com", full_name="U")
+    with TestClient(app) as client:
+        yield client
+    asyncio.run(async_engine.dispose())
+
+
+def test_to_async_returns_coroutine_endpoint_with_async_session():
+    endpoint = to_async(read_tasks)
+
+    assert inspect.iscoroutinefunction(endpoint)
+    session_param = inspect.signature(endpoint).parameters["session"]
+    assert "AsyncSession" in repr(session_param.annotation)
+
+
+def test_async_routes_round_trip(async_client):
+    area = async_client.post("/areas/", json={"name": "Work", "color": "c"}).json()
+    created = async_client.post("/tasks/", json={"title": "T", "area_id": area["id"]})
+    assert created.status_code == 200
+
+    tasks = async_client.get("/tasks/", params={"area_id": area["id"]}).json()
+    assert [t["title"] for t in tasks] == ["T"]
+
+    missing = async_client.get("/tasks/999")
+    assert missing.status_code == 404
+
+
+def test_verify_password_awaits_inside_greenlet(monkeypatch):
+    security.shutdown_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0, raising=False)
+    pwd = secrets.token_urlsafe(16)
+    hashed = security.get_password_hash(pwd)
+
+    async def _run():
+        return await greenlet_spawn(security.verify_password, pwd, hashed)
+
+    assert asyncio.run(_run()) is True
+
+
+def test_async_current_user_dependency(async_client, monkeypatch):
+    from src.core.token_cache import token_cache
+
+    token_cache.clear()
+    async_client.app.dependency_overrides.pop(async_get_current_user)
+    monkeypatch.setattr(
+        "src.routes.user.decode_access_token",
+        lambda t: {"sub": "u@x.com", "uid": 1, "name": "U"},
+    )
+
+    assert async_client.get("/areas/").status_code == 401
+    response = async_client.get("/areas/", headers={"Authorization": "Bearer t"})
+    assert response.status_code == 200
+
+
+def test_async_search_pages_with_cursor(async_client):
+    area = async_client.post("/areas/", json={"name": "Work", "color": "c"}).json()
+    for i in range(3):
+        async_client.post("/tasks/", json={"title": f"match {i}", "area_id": area["id"]})
+
+    first = async_client.get("/search/", params={"query": "match", "limit": 2})
+    rest = async_client.get("/search/", params={"query": "match", "limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+
+    assert len(first.json()) == 2
+    assert len(rest.json()) == 1 and "X-Next-Cursor" not in rest.headers
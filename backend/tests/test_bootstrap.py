@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core.database import use_snapshot
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1))
+        session.add(Area(id=2, name="B", color="c", user_id=2))
+        for i in range(1, 4):
+            updated = now - timedelta(minutes=i)
+            session.add(Task(id=i, title=f"t{i}", description="d", area_id=1, user_id=1, updated_at=updated))
+            session.add(Note(id=i, title=f"n{i}", content="c", area_id=1, user_id=1, updated_at=updated))
+        session.add(Task(id=4, title="other", user_id=2))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    def _override_session():
+        with Session(engine) as session:
+            yield session
+
+    main_mod.app.dependency_overrides[user_mod.get_read_session] = _override_session
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_read_session, None)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def test_bootstrap_matches_the_list_endpoints(client):
+    body = client.get("/api/v1/bootstrap").json()
+
+    assert body["user"]["email"] == "a@example.com"
+    assert body["areas"] == client.get("/api/v1/areas/").json()
+    assert body["tasks"] == client.get("/api/v1/tasks/").json()
+    assert body["notes"] == client.get("/api/v1/notes/").json()
+    assert body["cursors"] == {}
+
+
+def test_bootstrap_limit_hands_out_list_cursors(client):
+    body = client.get("/api/v1/bootstrap", params={"limit": 2}).json()
+
+    assert [t["id"] for t in body["tasks"]] == [1, 2]
+    assert set(body["cursors"]) == {"tasks", "notes"}
+    rest = client.get("/api/v1/tasks/", params={"limit": 2, "cursor": body["cursors"]["tasks"]})
+    assert [t["id"] for t in rest.json()] == [3]
+
+
+def test_bootstrap_summary_view_omits_bodies(client):
+    body = client.get("/api/v1/bootstrap", params={"view": "summary"}).json()
+
+    assert body["tasks"] == client.get("/api/v1/tasks/", params={"view": "summary"}).json()
+    assert "description" not in body["tasks"][0]
+    assert "content" not in body["notes"][0]
+
+
+def test_bootstrap_reads_everything_in_one_transaction(client, engine):
+    statements, begins = [], []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    event.listen(engine, "begin", lambda conn: begins.append(conn))
+
+    assert client.get("/api/v1/bootstrap").status_code == 200
+
+    assert len(statements) == 4
+    assert len(begins) == 1
+
+
+def test_use_snapshot_asks_postgres_for_repeatable_read():
+    session = Mock(spec=["get_bind", "connection"])
+    session.get_bind.return_value.dialect.name = "postgresql"
+
+    use_snapshot(session)
+
+    session.connection.assert_called_once_with(
+        execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+    )
+
+
+def test_use_snapshot_leaves_sqlite_alone():
+    session = Mock(spec=["get_bind", "connection"])
+    session.get_bind.return_value.dialect.name = "sqlite"
+
+    use_snapshot(session)
+
+    session.connection.assert_not_called()
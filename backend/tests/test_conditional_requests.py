@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.core.conditional import is_fresh
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1, updated_at=yesterday))
+        session.add(Area(id=2, name="B", color="c", user_id=2, updated_at=yesterday))
+        for i in (1, 2):
+            session.add(Task(id=i, title=f"t{i}", area_id=1, user_id=1, updated_at=yesterday))
+            session.add(Note(id=i, title=f"n{i}", area_id=1, user_id=1, updated_at=yesterday))
+        session.add(Task(id=3, title="theirs", area_id=2, user_id=2, updated_at=yesterday))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    monkeypatch.setattr(database, "engine", engine)
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+@pytest.fixture
+def statements(engine):
+    seen = []
+    listener = lambda conn, cursor, statement, *args: seen.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    yield seen
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+LISTS = ["/api/v1/tasks/", "/api/v1/notes/", "/api/v1/areas/"]
+DETAILS = ["/api/v1/tasks/1", "/api/v1/notes/1", "/api/v1/areas/1"]
+
+
+@pytest.mark.parametrize("path", LISTS + DETAILS)
+def test_unchanged_poll_is_304_after_one_query(client, statements, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert "Last-Modified" in first.headers
+    statements.clear()
+
+    again = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize(
+    "path, change",
+    [
+        ("/api/v1/tasks/", lambda c: c.patch("/api/v1/tasks/2", json={"completed": True})),
+        ("/api/v1/tasks/", lambda c: c.post("/api/v1/tasks/", json={"title": "new"})),
+        ("/api/v1/tasks/", lambda c: c.delete("/api/v1/tasks/2")),
+        ("/api/v1/notes/", lambda c: c.delete("/api/v1/notes/1")),
+        ("/api/v1/areas/", lambda c: c.patch("/api/v1/areas/1", json={"name": "renamed"})),
+        ("/api/v1/tasks/1", lambda c: c.patch("/api/v1/tasks/1", json={"title": "renamed"})),
+    ],
+)
+def test_any_change_gives_a_full_response(client, path, change):
+    etag = client.get(path).headers["ETag"]
+    change(client)
+
+    response = client.get(path, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_etag_depends_on_the_query(client):
+    full = client.get("/api/v1/tasks/").headers["ETag"]
+    summary = client.get("/api/v1/tasks/", params={"view": "summary"}).headers["ETag"]
+
+    assert full != summary
+    assert client.get("/api/v1/tasks/", params={"view": "summary"}, headers={"If-None-Match": full}).status_code == 200
+
+
+def test_other_users_row_is_still_not_found(client):
+    etag = client.get("/api/v1/tasks/1").headers["ETag"]
+
+    assert client.get("/api/v1/tasks/3", headers={"If-None-Match": etag}).status_code == 404
+
+
+def test_stale_detail_etag_reads_the_row(client):
+    response = client.get("/api/v1/tasks/1", headers={"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "t1"
+
+
+@pytest.mark.parametrize(
+    "header, fresh",
+    [(None, False), ("*", True), ('W/"abc"', True), ('"abc"', True), ('"x", W/"abc"', True), ('W/"abcd"', False)],
+)
+def test_if_none_match_uses_weak_comparison(header, fresh):
+    assert is_fresh(header, 'W/"abc"') is fresh
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from src.core import database
+from src.core.config import settings
+from src.core.database import TimedNullPool, TimedQueuePool, engine_options, pool_stats
+
+PG_URL = "postgresql://u:p@db/app"
+
+
+def test_sqlite_gets_no_pool_sizing():
+    assert engine_options("sqlite:///:memory:") == {"echo": False}
+
+
+def test_default_profile_uses_sized_queue_pool(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7, raising=False)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 3, raising=False)
+
+    options = engine_options(PG_URL)
+
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert options["pool_pre_ping"] is True
+
+
+def test_pgbouncer_profile_disables_pool_and_prepared_statements(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_PROFILE", "pgbouncer", raising=False)
+
+    assert engine_options(PG_URL)["poolclass"] is TimedNullPool
+    connect_args = engine_options("postgresql+asyncpg://u:p@db/app", is_async=True)["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+
+
+def test_unknown_profile_raises(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_PROFILE", "huge", raising=False)
+    with pytest.raises(ValueError):
+        engine_options(PG_URL)
+
+
+def test_pool_stats_report_checkouts_and_overflow(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=1, max_overflow=1
+    )
+    first = engine.connect()
+    second = engine.connect()
+    first.execute(text("select 1"))
+
+    stats = pool_stats(engine.pool)
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["wait_max_ms"] >= 0
+
+    first.close()
+    second.close()
+    assert pool_stats(engine.pool)["checked_out"] == 0
+
+
+def test_database_stats_include_primary_engine():
+    assert "primary" in database.database_stats()
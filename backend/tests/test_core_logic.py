@@ -22,17 +22,18 @@ def test_create_user_success_creates_default_area(mock_token, mock_session, user
     mock_token.return_value = "token123"
     mock_session.exec.return_value.first.return_value = None  # email не занят
 
-    # Simulate commit() and refresh() setting the user ID
-    def set_user_id_on_refresh(user_obj):
-        user_obj.id = 1  # Simulate DB-assigned ID
-    
-    mock_session.refresh.side_effect = set_user_id_on_refresh
+    # Simulate flush() assigning the user ID from INSERT ... RETURNING
+    def set_user_id_on_flush():
+        mock_session.add.call_args_list[0][0][0].id = 1  # Simulate DB-assigned ID
+
+    mock_session.flush.side_effect = set_user_id_on_flush
 
     result = create_user(session=mock_session, user_in=user_data)
 
     assert result.access_token == "token123"
-    # Проверяем, что добавили пользователя и область (2 add calls)
-    assert mock_session.add.call_count == 2
+    assert result.refresh_token
+    # Проверяем, что добавили пользователя, область и refresh-токен (3 add calls)
+    assert mock_session.add.call_count == 3
     # Проверяем, что область называется "Work" и привязана к пользователю
     area_call = mock_session.add.call_args_list[1][0][0]
     assert isinstance(area_call, Area)
@@ -78,7 +79,8 @@ def test_login_success(mock_verify, mock_token, mock_session):
     result = login(session=mock_session, form_data=form_data)
 
     assert result.access_token == "token123"
-    mock_session.add.assert_called_once_with(user)  # обновился last_login
+    assert result.refresh_token
+    mock_session.add.assert_any_call(user)  # обновился last_login
     mock_session.commit.assert_called_once()
 
 # 5. Получение текущего пользователя по токену (интеграция с security)
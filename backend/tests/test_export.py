@@ -0,0 +1,98 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.core.pagination import encode_cursor
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+from src.services.export import export_lines, gzipped
+from src.services.sync import cursor_time, sync_cursor
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1))
+        session.add(Area(id=2, name="B", color="c", user_id=2))
+        for i in (1, 2, 3):
+            session.add(Task(id=i, title=f"t{i}", area_id=1, user_id=1))
+        session.add(Task(id=4, title="theirs", area_id=2, user_id=2))
+        session.add(Note(id=1, title="n1", content="c", area_id=1, user_id=1))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    monkeypatch.setattr(database, "engine", engine)
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_streams_every_row_of_the_user(client):
+    response = client.get("/api/v1/export", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    lines = _lines(response)
+    assert [(line["type"], line.get("data", {}).get("id")) for line in lines] == [
+        ("area", 1), ("task", 1), ("task", 2), ("task", 3), ("note", 1), ("end", None),
+    ]
+    assert "user_id" not in lines[1]["data"] and lines[4]["data"]["content"] == "c"
+    assert cursor_time(lines[-1]["sync_cursor"]) < datetime.now(timezone.utc)
+
+
+def test_export_resumes_after_a_lines_cursor(client):
+    first = _lines(client.get("/api/v1/export"))
+
+    resumed = _lines(client.get("/api/v1/export", params={"cursor": first[2]["cursor"]}))
+
+    assert [(line["type"], line.get("data", {}).get("id")) for line in resumed] == [("task", 3), ("note", 1), ("end", None)]
+    # The sync cursor is still that of the original read.
+    assert resumed[-1] == first[-1]
+
+
+@pytest.mark.parametrize("cursor", ["garbage", sync_cursor(datetime.now(timezone.utc)),
+                                    encode_cursor("export", [datetime.now(timezone.utc), "user_info", 1])])
+def test_export_rejects_other_cursors(client, cursor):
+    assert client.get("/api/v1/export", params={"cursor": cursor}).status_code == 400
+
+
+def test_export_is_gzipped_when_accepted(client):
+    plain = client.get("/api/v1/export", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/api/v1/export", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert [line.get("data") for line in _lines(compressed)] == [line.get("data") for line in _lines(plain)]
+
+
+def test_rows_are_fetched_and_sent_in_batches(engine):
+    started_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+    with Session(engine) as session:
+        chunks = list(export_lines(session, 1, started_at, batch_rows=2))
+
+    # area, tasks 1-2, task 3, note, end
+    assert [chunk.count(b"\n") for chunk in chunks] == [1, 2, 1, 1, 1]
+    assert gzip.decompress(b"".join(gzipped(chunks))) == b"".join(chunks)
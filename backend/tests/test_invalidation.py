@@ -0,0 +1,164 @@
+import json
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database, invalidation
+from src.core.invalidation import InvalidationListener, MAX_PAYLOAD_BYTES, decode, encode, evict_local
+from src.core.response_cache import CachedResponse, MemoryBackend, ResponseCache, ResponseCacheMiddleware, response_cache
+from src.core.token_cache import token_cache
+from src.models.area import Area
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+class FakeListenConnection:
+    """The slice of a LISTENing psycopg2 connection the listener polls."""
+
+    def __init__(self):
+        self.notifies = []
+
+    def poll(self):
+        pass
+
+    def notify(self, channel, payload):
+        self.notifies.append(SimpleNamespace(channel=channel, payload=payload))
+
+
+def test_payload_round_trips_and_skips_own_worker():
+    events = [(1, "task", 5), (1, "task", 5), (2, "note", 7), (None, "task", 1)]
+
+    [payload] = encode(events, worker_id="a")
+
+    assert sorted(decode(payload, worker_id="b")) == [(1, "task", 5), (2, "note", 7)]
+    assert decode(payload, worker_id="a") == []
+    assert decode("not json", worker_id="b") == []
+    assert encode([], worker_id="a") == []
+
+
+def test_large_writes_coalesce_to_their_users():
+    events = [(uid, "task", i) for uid in (1, 2) for i in range(2000)]
+
+    payloads = encode(events, worker_id="a")
+
+    assert len(payloads) == 1 and len(payloads[0]) <= MAX_PAYLOAD_BYTES
+    assert decode(payloads[0], worker_id="b") == [(1, None, None), (2, None, None)]
+
+    many_users = encode([(uid, "task", 1) for uid in range(5000)], worker_id="a")
+    assert len(many_users) > 1 and all(len(p) <= MAX_PAYLOAD_BYTES for p in many_users)
+    assert sum(len(json.loads(p)["e"]) for p in many_users) == 5000
+
+
+def test_listener_applies_a_burst_as_one_batch():
+    connection = FakeListenConnection()
+    batches = []
+    listener = InvalidationListener(lambda: connection, "ch", invalidate=batches.append, worker_id="b", batch_seconds=0)
+    for i in range(50):
+        [payload] = encode([(1, "task", i % 10), (2, "note", 1)], worker_id="a")
+        connection.notify("ch", payload)
+    [own] = encode([(3, "task", 1)], worker_id="b")
+    connection.notify("ch", own)
+
+    assert listener.poll(connection, timeout=0) == 11
+
+    assert len(batches) == 1
+    assert {user_id for user_id, _, _ in batches[0]} == {1, 2}
+    assert connection.notifies == []
+    assert listener.stats() == {"batches": 1, "events": 11}
+
+
+def test_evict_local_drops_the_users_cached_entries():
+    exp = int(time.time()) + 3600
+    for uid in (1, 2):
+        token_cache.put(f"token-{uid}", {"uid": uid, "exp": exp}, UserInfo(id=uid))
+    keys = {uid: response_cache.key(uid, "/api/v1/tasks/", "") for uid in (1, 2)}
+    for uid, key in keys.items():
+        response_cache.put(uid, key, CachedResponse(headers=[], body=b"[]"))
+
+    evict_local({(1, "user_info", 1), (2, "task", 9)})
+
+    assert response_cache.backend.get(keys[1]) is None
+    assert response_cache.backend.get(keys[2]) is None
+    assert token_cache.get("token-1") is None
+    # A task write doesn't change who the token belongs to.
+    assert token_cache.get("token-2") is not None
+    assert database.reads_from_primary(2)
+
+    evict_local(None)
+    assert token_cache.get("token-2") is None
+    token_cache.clear()
+
+
+def _make_engine(path):
+    return create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+
+def test_write_on_one_engine_evicts_the_other_workers_cache(tmp_path, monkeypatch):
+    """Two workers, each with its own engine and cache, on one database.
+
+    SQLite has no NOTIFY: worker A's connections get a `pg_notify` function
+    that hands payloads to worker B's (fake) LISTEN connection.
+    """
+    import main as main_mod
+
+    bus = FakeListenConnection()
+    engine_a, engine_b = _make_engine(tmp_path / "app.db"), _make_engine(tmp_path / "app.db")
+    database.enforce_foreign_keys(engine_a)
+    database.enforce_foreign_keys(engine_b)
+    event.listen(engine_a, "connect", lambda conn, record: conn.create_function("pg_notify", 2, bus.notify))
+    SQLModel.metadata.create_all(engine_a)
+    with Session(engine_a) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1))
+        session.add(Task(id=1, title="t1", area_id=1, user_id=1))
+        session.commit()
+    bus.notifies.clear()
+    monkeypatch.setattr(invalidation, "NOTIFY_DIALECTS", {"postgresql", "sqlite"})
+    # Worker A's own cache is the module's; keep it out of the way.
+    monkeypatch.setattr(response_cache, "enabled", False)
+    cache_b = ResponseCache(MemoryBackend(max_bytes=1 << 20, ttl=60))
+    worker_b = TestClient(ResponseCacheMiddleware(main_mod.app, prefix="/api/v1", cache=cache_b))
+    worker_a = TestClient(main_mod.app)
+
+    def evict_b(events):
+        for user_id, _, _ in events:
+            cache_b.invalidate_user(user_id)
+
+    listener_b = InvalidationListener(lambda: bus, "cache_invalidation", invalidate=evict_b, worker_id="worker-b", batch_seconds=0)
+    token_cache.put("token-1", {"uid": 1, "exp": int(time.time()) + 3600}, UserInfo(id=1))
+    auth = {"Authorization": "Bearer token-1"}
+
+    try:
+        monkeypatch.setattr(database, "engine", engine_b)
+        assert worker_b.get("/api/v1/tasks/", headers=auth).headers["X-Cache"] == "MISS"
+        assert worker_b.get("/api/v1/tasks/", headers=auth).headers["X-Cache"] == "HIT"
+
+        monkeypatch.setattr(database, "engine", engine_a)
+        assert worker_a.post("/api/v1/tasks/", json={"title": "new"}, headers=auth).status_code == 200
+        [notification] = bus.notifies
+        assert notification.channel == "cache_invalidation"
+        assert decode(notification.payload, worker_id="worker-b") == [(1, "task", 2)]
+
+        assert listener_b.poll(bus, timeout=0) == 1
+        monkeypatch.setattr(database, "engine", engine_b)
+        response = worker_b.get("/api/v1/tasks/", headers=auth)
+    finally:
+        token_cache.clear()
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert [t["title"] for t in response.json()] == ["new", "t1"]
+
+
+def test_sessions_without_notify_do_not_publish():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.commit()
+
+    assert not any("pg_notify" in s for s in statements)
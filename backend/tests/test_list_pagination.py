@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def list_client(session):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    def _override_session():
+        yield session
+
+    main_mod.app.dependency_overrides[user_mod.get_read_session] = _override_session
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_read_session, None)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def _walk(client, path, limit, **params):
+    pages, cursor = [], None
+    while True:
+        response = client.get(path, params={"limit": limit, **params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def populated(session):
+    now = datetime.now(timezone.utc)
+    session.add(Area(id=1, name="A", color="c", user_id=1))
+    session.add(Area(id=2, name="B", color="c", user_id=1))
+    session.add(Area(id=3, name="C", color="c", user_id=2))
+    for i in range(1, 8):
+        # Two rows share each timestamp, so the id tie-breaker matters.
+        updated = now - timedelta(minutes=i // 2)
+        session.add(Task(id=i, title=f"t{i}", area_id=1 + i % 2, user_id=1, updated_at=updated))
+        session.add(Note(id=i, title=f"n{i}", area_id=1 + i % 2, user_id=1, updated_at=updated))
+    session.add(Task(id=8, title="other", user_id=2))
+    session.commit()
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/", "/api/v1/notes/"])
+def test_cursor_pages_are_most_recent_first_without_gaps(list_client, populated, path):
+    pages = _walk(list_client, path, limit=3)
+
+    assert pages == [[1, 3, 2], [5, 4, 7], [6]]
+    assert list_client.get(path, params={"limit": 100}).json() == list_client.get(path).json()
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/", "/api/v1/notes/"])
+def test_cursor_pages_respect_area_filter(list_client, populated, path):
+    assert _walk(list_client, path, limit=2, area_id=2) == [[1, 3], [5, 7]]
+
+
+def test_offset_paging_still_works(list_client, populated):
+    response = list_client.get("/api/v1/tasks/", params={"offset": 3, "limit": 3})
+
+    assert [t["id"] for t in response.json()] == [5, 4, 7]
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_areas_page_by_id(list_client, populated):
+    assert _walk(list_client, "/api/v1/areas/", limit=1) == [[1], [2]]
+
+
+def test_cursor_from_another_listing_is_rejected(list_client, populated):
+    cursor = list_client.get("/api/v1/tasks/", params={"limit": 1}).headers["X-Next-Cursor"]
+
+    response = list_client.get("/api/v1/notes/", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("path, heavy", [("/api/v1/tasks/", "description"), ("/api/v1/notes/", "content")])
+def test_summary_view_omits_heavy_column(list_client, populated, path, heavy):
+    full = list_client.get(path, params={"limit": 3}).json()
+    summary = list_client.get(path, params={"limit": 3, "view": "summary"}).json()
+
+    assert [item["id"] for item in summary] == [item["id"] for item in full]
+    assert all(heavy not in item for item in summary)
+    assert summary == [{k: v for k, v in item.items() if k != heavy} for item in full]
+    assert all(heavy in item for item in full)
+
+
+def test_summary_view_pages_with_cursor(list_client, populated):
+    assert _walk(list_client, "/api/v1/tasks/", limit=3, view="summary") == [[1, 3, 2], [5, 4, 7], [6]]
+
+
+def test_summary_view_selects_only_summary_columns(session, populated):
+    from fastapi import Response
+    from sqlalchemy import event
+
+    from src.routes.task import read_tasks
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    try:
+        read_tasks(session=session, limit=10, view="summary", response=Response(), current_user=UserInfo(id=1))
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+    # The collection version for the ETag, then the page.
+    assert len(statements) == 2 and "task.description" not in statements[1]
+
+
+def test_unknown_view_is_rejected(list_client, populated):
+    assert list_client.get("/api/v1/notes/", params={"view": "everything"}).status_code == 422
@@ -0,0 +1,125 @@
+import time
+from datetime import datetime, timezone
+
+import msgpack
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.core.serialization import PRIORITY_EXT, msgpack_to_json, packb, wants_msgpack
+from src.core.token_cache import token_cache
+from src.models.area import Area
+from src.models.task import Priority, Task
+from src.models.userinfo import UserInfo
+
+MSGPACK = {"Accept": "application/msgpack"}
+CREATED = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    import main as main_mod
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="1@example.com", full_name="U", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1))
+        session.add(Task(id=1, title="t1", area_id=1, user_id=1, priority=Priority.HIGH,
+                         created_at=CREATED, updated_at=CREATED))
+        session.commit()
+    monkeypatch.setattr(database, "engine", engine)
+    token_cache.put("token-1", {"uid": 1, "exp": int(time.time()) + 3600}, UserInfo(id=1))
+    yield TestClient(main_mod.app, headers={"Authorization": "Bearer token-1"})
+    token_cache.clear()
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, False),
+    ("application/json", False),
+    ("*/*", False),
+    ("application/msgpack", True),
+    ("application/x-msgpack", True),
+    ("application/json;q=0.5, application/msgpack", True),
+    ("application/msgpack;q=0.5, application/json", False),
+    ("application/msgpack, */*;q=0.1", True),
+    ("application/msgpack;q=0", False),
+])
+def test_negotiation_defaults_to_json(accept, expected):
+    assert wants_msgpack(accept) is expected
+
+
+def test_datetimes_and_priorities_pack_compactly():
+    packed = packb({"priority": Priority.MEDIUM, "created_at": CREATED})
+
+    value = msgpack.unpackb(packed)
+    assert value["priority"] == msgpack.ExtType(PRIORITY_EXT, b"\x02")
+    assert value["created_at"] == msgpack.Timestamp.from_datetime(CREATED)
+    assert len(packed) < len(b'{"priority":"Medium","created_at":"2026-03-01T12:30:00Z"}') * 0.6
+
+
+def test_list_responses_follow_accept(client):
+    as_json = client.get("/api/v1/tasks/")
+    packed = client.get("/api/v1/tasks/", headers=MSGPACK)
+
+    assert as_json.headers["content-type"] == "application/json"
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert "Accept" in packed.headers["vary"]
+    [task] = msgpack.unpackb(packed.content, timestamp=3)
+    assert task.keys() == as_json.json()[0].keys()
+    assert task["priority"] == msgpack.ExtType(PRIORITY_EXT, b"\x03")
+    assert task["created_at"] == CREATED
+
+
+def test_other_routes_are_packed_by_their_response_model(client):
+    response = client.get("/api/v1/tasks/1", headers=MSGPACK)
+    missing = client.get("/api/v1/tasks/99", headers=MSGPACK)
+
+    assert response.headers["content-type"] == "application/msgpack"
+    task = msgpack.unpackb(response.content, timestamp=3)
+    assert task["title"] == "t1" and task["created_at"] == CREATED
+    assert missing.status_code == 404
+    assert msgpack.unpackb(missing.content) == {"detail": "Task not found"}
+
+
+def test_msgpack_request_bodies(client):
+    body = packb({"title": "new", "priority": Priority.LOW, "area_id": 1})
+
+    response = client.post("/api/v1/tasks/", content=body, headers={"Content-Type": "application/msgpack"})
+    invalid = client.post("/api/v1/tasks/", content=b"\xc1", headers={"Content-Type": "application/msgpack"})
+
+    assert response.status_code == 200
+    assert response.json()["priority"] == "Low"
+    assert invalid.status_code == 400
+    assert invalid.json() == {"detail": "Invalid MessagePack body"}
+    assert msgpack_to_json(packb({"at": CREATED})) == b'{"at": "2026-03-01T12:30:00+00:00"}'
+
+
+def test_cache_keeps_each_format_apart(client):
+    for headers in ({}, MSGPACK):
+        assert client.get("/api/v1/tasks/", headers=headers).headers["X-Cache"] == "MISS"
+
+    as_json = client.get("/api/v1/tasks/")
+    packed = client.get("/api/v1/tasks/", headers=MSGPACK)
+
+    assert as_json.headers["X-Cache"] == packed.headers["X-Cache"] == "HIT"
+    assert as_json.json()[0]["title"] == "t1"
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert "Accept" in packed.headers["vary"]
+    assert msgpack.unpackb(packed.content, timestamp=3)[0]["title"] == "t1"
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/", "/api/v1/tasks/1"])
+def test_each_format_has_its_own_etag(client, path):
+    as_json = client.get(path)
+    packed = client.get(path, headers=MSGPACK)
+
+    assert packed.headers["etag"] != as_json.headers["etag"]
+    assert client.get(path, headers={**MSGPACK, "If-None-Match": packed.headers["etag"]}).status_code == 304
+    assert client.get(path, headers={"If-None-Match": as_json.headers["etag"]}).status_code == 304
+    # A validator of one format doesn't revalidate the other.
+    assert client.get(path, headers={**MSGPACK, "If-None-Match": as_json.headers["etag"]}).status_code == 200
+    assert client.get(path, headers={"If-None-Match": packed.headers["etag"]}).status_code == 200
@@ -1,6 +1,6 @@
 from unittest.mock import Mock
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 from src.routes.note import read_notes
 from src.models.area import Area
@@ -9,9 +9,12 @@ from src.models.userinfo import UserInfo
 
 def test_read_notes_area_mismatch_raises():
     mock_session = Mock()
+    # The owner-scoped query finds nothing in someone else's area.
+    mock_session.exec.return_value.all.return_value = []
+    mock_session.exec.return_value.one.return_value = (None, 0, None)
     # session.get will return an area owned by another user
     mock_session.get.return_value = Area(id=1, user_id=99, name="A", color="c")
     user = UserInfo(id=1)
 
     with pytest.raises(HTTPException):
-        read_notes(session=mock_session, offset=0, limit=10, area_id=1, current_user=user)
+        read_notes(session=mock_session, offset=0, limit=10, area_id=1, cursor=None, response=Response(), current_user=user)
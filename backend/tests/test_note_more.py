@@ -1,4 +1,6 @@
+import json
 from unittest.mock import Mock
+from fastapi import Response
 
 from src.routes.note import read_notes
 from src.models.note import Note
@@ -10,10 +12,11 @@ def test_read_notes_no_area_returns_list():
     n = Note(id=1, title="N1", content="c", user_id=1)
     m = Mock()
     m.all.return_value = [n]
+    m.one.return_value = (None, 1, None)
     mock_session.exec.return_value = m
     user = UserInfo(id=1)
 
-    res = read_notes(session=mock_session, offset=0, limit=10, area_id=None, current_user=user)
+    res = json.loads(read_notes(session=mock_session, offset=0, limit=10, area_id=None, cursor=None, response=Response(), current_user=user).body)
 
     assert isinstance(res, list)
-    assert res[0].id == 1
+    assert res[0]["id"] == 1
@@ -1,6 +1,6 @@
 from unittest.mock import Mock
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 from src.routes.note import (
     create_note,
@@ -26,10 +26,6 @@ def test_check_correct_area_id_ok():
 def test_create_note_success():
     mock_session = Mock()
 
-    def refresh_side(obj):
-        obj.id = 11
-
-    mock_session.refresh.side_effect = refresh_side
     user = UserInfo(id=4)
     note_in = NoteCreate(title="N", content="c", area_id=1)
 
@@ -39,7 +35,7 @@ def test_create_note_success():
 
     assert mock_session.add.called
     assert mock_session.commit.called
-    assert getattr(note, "id", None) == 11
+    mock_session.refresh.assert_not_called()
     assert note.user_id == user.id
 
 
@@ -49,33 +45,33 @@ def test_read_note_not_found_raises():
     user = UserInfo(id=1)
 
     with pytest.raises(HTTPException) as exc:
-        read_note(session=mock_session, note_id=1, current_user=user)
+        read_note(session=mock_session, note_id=1, response=Response(), current_user=user)
     assert exc.value.status_code == 404
 
 
 def test_update_note_area_change_checks_area():
     mock_session = Mock()
-    note = Note(id=1, user_id=5, title="X", content="c")
-    mock_session.get.return_value = note
     user = UserInfo(id=5)
 
-    # When updating area_id, session.get needs to return an area owned by user
-    mock_session.get.side_effect = [note, Area(id=2, user_id=5, name="A", color="c")]
+    # The (area_id, user_id) foreign key checks the area as part of the UPDATE.
+    mock_session.exec.return_value.scalar_one_or_none.return_value = Note(id=1, user_id=5, title="X", area_id=2)
 
     updated = update_note(session=mock_session, note_id=1, note_in=NoteUpdate(area_id=2), current_user=user)
 
+    mock_session.get.assert_not_called()
     assert mock_session.commit.called
     assert updated.area_id == 2
 
 
 def test_delete_note_success():
     mock_session = Mock()
-    note = Note(id=1, user_id=3, title="X", content="c")
-    mock_session.get.return_value = note
+    # DELETE ... RETURNING id found the row.
+    mock_session.exec.return_value.first.return_value = 1
     user = UserInfo(id=3)
 
     res = delete_note(session=mock_session, note_id=1, current_user=user)
 
     assert res == {"ok": True}
-    mock_session.delete.assert_called_once_with(note)
+    mock_session.get.assert_not_called()
+    mock_session.delete.assert_not_called()
     mock_session.commit.assert_called_once()
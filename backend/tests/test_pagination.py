@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import column
+
+from src.core.pagination import decode_cursor, encode_cursor, keyset_after
+
+
+def test_cursor_round_trips_values():
+    when = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    cursor = encode_cursor("note", [1.5, when, "2026-01-01", True, 7])
+
+    assert decode_cursor(cursor) == ("note", [1.5, when, "2026-01-01", True, 7])
+
+
+def test_naive_cursor_datetimes_are_utc():
+    kind, key = decode_cursor(encode_cursor("note", [datetime(2026, 1, 2)]))
+
+    assert key == [datetime(2026, 1, 2, tzinfo=timezone.utc)]
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", "bm90IGpzb24", encode_cursor("task", [1])[:-2] + "x"])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_keyset_after_uses_row_comparison_for_one_direction():
+    clause = keyset_after([(column("updated_at"), True), (column("id"), True)], [5, 9])
+
+    assert str(clause) == "(updated_at, id) < (:param_1, :param_2)"
+
+
+def test_keyset_after_expands_mixed_directions():
+    clause = keyset_after([(column("done"), False), (column("id"), True)], [0, 9])
+
+    assert str(clause) == "done > :param_1 OR done = :param_1 AND id < :param_2"
+
+
+def test_keyset_after_rejects_wrong_key_length():
+    with pytest.raises(ValueError):
+        keyset_after([(column("id"), False)], [1, 2])
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, text
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.services.search import IlikeSearch, _order_by
+from src.models.userinfo import UserInfo
+
+USERS = 20
+ROWS_PER_USER = 500
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('idx') / 'plan.db'}")
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(insert(UserInfo), [
+            {"id": u, "email": f"u{u}@x.com", "full_name": "U", "hashed_password": "h",
+             "last_login": now, "created_at": now, "updated_at": now}
+            for u in range(1, USERS + 1)
+        ])
+        conn.execute(insert(Area), [
+            {"id": u * 10 + a, "user_id": u, "name": "A", "color": "c", "created_at": now, "updated_at": now}
+            for u in range(1, USERS + 1) for a in range(5)
+        ])
+        rows = [
+            {"user_id": u, "area_id": u * 10 + i % 5, "created_at": now, "updated_at": now - timedelta(minutes=i)}
+            for u in range(1, USERS + 1) for i in range(ROWS_PER_USER)
+        ]
+        conn.execute(insert(Task), [{**r, "title": "t", "completed": False} for r in rows])
+        conn.execute(insert(Note), [{**r, "title": "n"} for r in rows])
+        conn.execute(text("ANALYZE"))
+    return engine
+
+
+def _plan(engine, statement) -> str:
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return " | ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+def test_read_notes_uses_user_updated_at_index_for_order(engine):
+    plan = _plan(engine, select(Note).where(Note.user_id == 3).order_by(Note.updated_at.desc()).limit(100))
+
+    assert "ix_note_user_id_updated_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("model, index", [(Task, "ix_task_user_id_area_id"), (Note, "ix_note_user_id_area_id")])
+def test_area_filtered_lists_use_user_area_index(engine, model, index):
+    plan = _plan(engine, select(model).where(model.user_id == 3, model.area_id == 31).limit(100))
+
+    assert index in plan
+
+
+def test_area_listing_uses_user_index(engine):
+    # "ix_area_user_id (", so ix_area_user_id_updated_at doesn't count.
+    assert "USING INDEX ix_area_user_id (" in _plan(engine, select(Area).where(Area.user_id == 3))
+
+
+def test_task_listing_does_not_scan_table(engine):
+    plan = _plan(engine, select(Task).where(Task.user_id == 3).limit(100))
+
+    assert plan.startswith("SEARCH task USING INDEX ix_task_user_id")
+
+
+def test_task_search_order_is_read_from_index(engine):
+    # Compile with bound parameters, as executed: the expression index only
+    # matches if the ORDER BY expressions don't turn into placeholders.
+    statement = select(Task).where(Task.user_id == 3, Task.title.ilike("%t%")).order_by(*_order_by(Task)).limit(10)
+    compiled = statement.compile(engine)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+    with engine.connect() as conn:
+        plan = " | ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params))
+
+    assert "ix_task_user_id_search_order" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_ilike_search_returns_limit_rows(engine):
+    with Session(engine) as session:
+        statement = IlikeSearch().where(select(Task), Task, 3, "t").order_by(*_order_by(Task)).limit(10)
+        assert len(session.exec(statement).all()) == 10
+
+
+@pytest.mark.parametrize("area_id, index", [(None, "ix_note_user_id_updated_at"), (31, "ix_note_user_id_area_id")])
+def test_cursor_page_seeks_list_index(engine, area_id, index):
+    from src.core.pagination import keyset_after
+    from src.routes.note import LIST_ORDER
+
+    statement = select(Note).where(Note.user_id == 3)
+    if area_id is not None:
+        statement = statement.where(Note.area_id == area_id)
+    after = keyset_after(LIST_ORDER, [datetime.now(timezone.utc) - timedelta(minutes=300), 10_000])
+    statement = statement.where(after).order_by(Note.updated_at.desc(), Note.id.desc()).limit(100)
+
+    plan = _plan(engine, statement)
+
+    # A range seek into the index, not a scan past the earlier pages.
+    assert f"{index} (" in plan and "updated_at<" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize(
+    "model, index",
+    [(Area, "ix_area_user_id_updated_at"), (Task, "ix_task_user_id_updated_at"), (Note, "ix_note_user_id_updated_at")],
+)
+def test_sync_delta_uses_user_updated_at_index(engine, model, index):
+    since = datetime.now(timezone.utc) - timedelta(minutes=5)
+    plan = _plan(engine, select(model).where(model.user_id == 3, model.updated_at > since)
+                 .order_by(model.updated_at, model.id))
+
+    assert index in plan
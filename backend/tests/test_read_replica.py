@@ -0,0 +1,74 @@
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.core.config import settings
+from src.models.task import Task
+
+
+def _engine():
+    return create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+
+def test_read_session_uses_replica_unless_user_wrote_recently(monkeypatch):
+    primary, replica = _engine(), _engine()
+    monkeypatch.setattr(database, "engine", primary)
+    monkeypatch.setattr(database, "read_engine", replica)
+    monkeypatch.setattr(database, "_recent_writes", {})
+
+    gen = database.read_session(1)
+    assert next(gen).get_bind() is replica
+    gen.close()
+
+    database.mark_user_write(1)
+    gen = database.read_session(1)
+    assert next(gen).get_bind() is primary
+    gen.close()
+
+    # Other users are unaffected
+    gen = database.read_session(2)
+    assert next(gen).get_bind() is replica
+    gen.close()
+
+
+def test_read_session_falls_back_to_primary_without_replica(monkeypatch):
+    monkeypatch.setattr(database, "read_engine", None)
+    gen = database.read_session(1)
+    assert next(gen).get_bind() is database.engine
+    gen.close()
+
+
+def test_read_your_writes_window_expires(monkeypatch):
+    monkeypatch.setattr(database, "_recent_writes", {})
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 0, raising=False)
+
+    database.mark_user_write(1)
+    assert database.reads_from_primary(1) is False
+
+
+def test_commit_marks_writer_sticky(monkeypatch):
+    monkeypatch.setattr(database, "_recent_writes", {})
+    engine = _engine()
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Task(title="T", user_id=5))
+        session.flush()
+        assert database.reads_from_primary(5) is False
+        session.commit()
+
+    assert database.reads_from_primary(5) is True
+    assert database.reads_from_primary(6) is False
+
+
+def test_rollback_does_not_mark_writer(monkeypatch):
+    monkeypatch.setattr(database, "_recent_writes", {})
+    engine = _engine()
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Task(title="T", user_id=5))
+        session.flush()
+        session.rollback()
+
+    assert database.reads_from_primary(5) is False
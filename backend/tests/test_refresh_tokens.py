@@ -0,0 +1,164 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.core import config, security
+from src.core.token_cache import token_cache
+from src.models.refresh_token import RefreshRequest, RefreshToken
+from src.models.userinfo import UserInfo
+from src.routes.user import get_current_user, logout, refresh_access_token
+from src.services.auth import issue_refresh_token, rotate_refresh_token
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def db_user(session):
+    user = UserInfo(email="u@x.com", full_name="U", hashed_password="h")
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
+
+
+def test_refresh_rotates_token(session, db_user):
+    token = issue_refresh_token(session, db_user)
+    session.commit()
+
+    result = refresh_access_token(session=session, refresh_in=RefreshRequest(refresh_token=token))
+
+    assert result.access_token
+    assert result.refresh_token and result.refresh_token != token
+    # The old token is single-use
+    with pytest.raises(HTTPException) as exc:
+        refresh_access_token(session=session, refresh_in=RefreshRequest(refresh_token=token))
+    assert exc.value.status_code == 401
+
+
+def test_replayed_token_revokes_whole_family(session, db_user):
+    token = issue_refresh_token(session, db_user)
+    session.commit()
+    _, new_token = rotate_refresh_token(session, token)
+    # Replayed after the grace window of a concurrent refresh.
+    rotated = session.exec(select(RefreshToken).where(RefreshToken.revoked == True)).one()  # noqa: E712
+    rotated.rotated_at -= timedelta(seconds=config.settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS + 1)
+    session.add(rotated)
+    session.commit()
+
+    assert rotate_refresh_token(session, token) is None
+    assert rotate_refresh_token(session, new_token) is None
+
+
+def test_token_reused_within_grace_window_keeps_successor(session, db_user):
+    token = issue_refresh_token(session, db_user)
+    session.commit()
+    _, new_token = rotate_refresh_token(session, token)
+
+    assert rotate_refresh_token(session, token) is None
+    assert rotate_refresh_token(session, new_token) is not None
+
+
+def test_token_revoked_by_logout_is_a_replay(session, db_user):
+    token = issue_refresh_token(session, db_user)
+    other = issue_refresh_token(session, db_user)
+    session.commit()
+    logout(session=session, refresh_in=RefreshRequest(refresh_token=token))
+
+    assert rotate_refresh_token(session, token) is None
+    assert rotate_refresh_token(session, other) is None
+
+
+def test_concurrent_refreshes_rotate_the_token_once(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'auth.db'}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = UserInfo(email="u@x.com", full_name="U", hashed_password="h")
+        session.add(user)
+        session.commit()
+        token = issue_refresh_token(session, user)
+        session.commit()
+    # Both requests reach the UPDATE together.
+    both_ready = threading.Barrier(2)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _meet(conn, cursor, statement, *args):
+        if statement.startswith("UPDATE refresh_token") and "RETURNING" in statement:
+            both_ready.wait(timeout=5)
+
+    results = []
+
+    def refresh():
+        with Session(engine) as session:
+            rotated = rotate_refresh_token(session, token)
+            results.append(rotated[1] if rotated else None)
+
+    threads = [threading.Thread(target=refresh) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 2
+    assert len([r for r in results if r is not None]) == 1
+    with Session(engine) as session:
+        assert len(session.exec(select(RefreshToken).where(RefreshToken.revoked == False)).all()) == 1  # noqa: E712
+
+
+def test_expired_refresh_token_is_rejected(session, db_user):
+    token = issue_refresh_token(session, db_user)
+    session.commit()
+    stored = session.exec(select(RefreshToken)).one()
+    stored.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    session.add(stored)
+    session.commit()
+
+    assert rotate_refresh_token(session, token) is None
+
+
+def test_logout_revokes_refresh_token(session, db_user):
+    token = issue_refresh_token(session, db_user)
+    session.commit()
+
+    assert logout(session=session, refresh_in=RefreshRequest(refresh_token=token)) == {"ok": True}
+    assert rotate_refresh_token(session, token) is None
+
+
+def test_get_current_user_uses_claims_without_db(monkeypatch):
+    token_cache.clear()
+    monkeypatch.setattr(
+        "src.routes.user.decode_access_token",
+        lambda t: {"sub": "u@x.com", "uid": 9, "name": "U"},
+    )
+    session = Mock(spec=Session)
+
+    user = get_current_user(session=session, token="t")
+
+    assert (user.id, user.email, user.full_name) == (9, "u@x.com", "U")
+    session.exec.assert_not_called()
+
+
+def test_access_token_carries_claims_and_short_expiry(monkeypatch, rsa_keys):
+    priv_pem, pub_pem = rsa_keys
+    monkeypatch.setattr(config.settings, "SECRET_KEY", priv_pem, raising=False)
+    monkeypatch.setattr(config.settings, "PUBLIC_KEY", pub_pem, raising=False)
+    monkeypatch.setattr(security, "SECRET_JWK", None, raising=False)
+    monkeypatch.setattr(security, "PUBLIC_JWK", None, raising=False)
+
+    token = security.create_access_token("u@x.com", claims={"uid": 9})
+    payload = security.decode_access_token(token)
+
+    assert payload["uid"] == 9
+    assert payload["sub"] == "u@x.com"
+    assert payload["exp"] - payload["iat"] == config.settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
@@ -0,0 +1,237 @@
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.core.config import settings
+from src.core.response_cache import CachedResponse, MemoryBackend, RedisBackend, ResponseCache, response_cache
+from src.core.token_cache import token_cache
+from src.models.area import Area
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+def _entry(size: int) -> CachedResponse:
+    return CachedResponse(headers=[(b"content-type", b"application/json")], body=b"x" * size)
+
+
+class FakeRedis:
+    """The slice of the redis-py client RedisBackend uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        value, expires = self.data.get(key, (None, None))
+        if expires is not None and expires <= time.monotonic():
+            return None
+        return value
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and self.get(key) is not None:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+        return True
+
+
+def test_memory_backend_evicts_least_recently_used_within_byte_budget():
+    overhead = _entry(0).size
+    cache = ResponseCache(MemoryBackend(max_bytes=3 * (overhead + 100), ttl=60))
+    for key in "abc":
+        cache.put(1, key, _entry(100))
+    assert cache.get("a") is not None
+
+    cache.put(1, "d", _entry(100))
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in "acd")
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert stats["hit_ratio"] == pytest.approx(4 / 5)
+
+
+def test_memory_backend_skips_entries_over_budget_and_expires_old_ones():
+    backend = MemoryBackend(max_bytes=50, ttl=0.05)
+    backend.set(1, "big", _entry(100))
+    backend.set(1, "small", _entry(10))
+
+    assert backend.get("big") is None
+    assert backend.get("small") is not None
+    time.sleep(0.06)
+    assert backend.get("small") is None
+
+
+def test_write_bumps_version_and_drops_the_users_entries():
+    cache = ResponseCache(MemoryBackend(max_bytes=10_000, ttl=60))
+    key = cache.key(1, "/api/v1/tasks/", "limit=10&view=summary")
+    cache.put(1, key, _entry(10))
+    cache.put(2, cache.key(2, "/api/v1/tasks/", ""), _entry(10))
+
+    assert cache.key(1, "/api/v1/tasks/", "view=summary&limit=10") == key
+    cache.invalidate_user(1)
+
+    assert cache.key(1, "/api/v1/tasks/", "limit=10&view=summary") != key
+    assert cache.get(key) is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_redis_backend_round_trip_and_versions():
+    client = FakeRedis()
+    cache = ResponseCache(RedisBackend(client, ttl=60))
+    entry = CachedResponse(headers=[(b"etag", b'W/"1"'), (b"x-next-cursor", b"abc")], body=b'[{"id":1}]')
+
+    key = cache.key(1, "/api/v1/tasks/", "")
+    cache.put(1, key, entry)
+
+    assert cache.get(key) == entry
+    # Another worker on the same server sees the entry and the bump.
+    other = ResponseCache(RedisBackend(client, ttl=60))
+    assert other.key(1, "/api/v1/tasks/", "") == key
+    other.invalidate_user(1)
+    assert cache.key(1, "/api/v1/tasks/", "") != key
+
+
+def test_redis_backend_restarts_evicted_version_fresh():
+    client = FakeRedis()
+    backend = RedisBackend(client, ttl=60)
+    first = backend.version(1)
+    del client.data["rc:version:1"]
+
+    assert backend.version(1) not in ("0", first)
+
+
+def test_redis_backend_without_redis_package_fails_fast(monkeypatch):
+    monkeypatch.setitem(sys.modules, "redis", None)
+
+    with pytest.raises(RuntimeError, match="redis package is missing"):
+        RedisBackend.from_url("redis://localhost:6379/0", ttl=60)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    with Session(engine) as session:
+        for uid in (1, 2):
+            session.add(UserInfo(id=uid, email=f"{uid}@example.com", full_name="U", hashed_password="x"))
+            session.add(Area(id=uid, name="A", color="c", user_id=uid, updated_at=yesterday))
+            session.add(Task(id=uid, title=f"t{uid}", area_id=uid, user_id=uid, updated_at=yesterday))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    import main as main_mod
+
+    monkeypatch.setattr(database, "engine", engine)
+    token_cache.clear()
+    exp = int(time.time()) + 3600
+    for uid in (1, 2):
+        # Verified tokens, as get_current_user would have cached them.
+        token_cache.put(f"token-{uid}", {"sub": f"{uid}@example.com", "uid": uid, "exp": exp}, UserInfo(id=uid))
+    yield TestClient(main_mod.app)
+    token_cache.clear()
+
+
+def _auth(uid):
+    return {"Authorization": f"Bearer token-{uid}"}
+
+
+def test_repeated_list_is_served_from_cache_without_queries(client, engine):
+    first = client.get("/api/v1/tasks/", headers=_auth(1))
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        second = client.get("/api/v1/tasks/", headers=_auth(1))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json() == [first.json()[0]]
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert statements == []
+
+
+def test_cached_etag_is_answered_with_304(client):
+    etag = client.get("/api/v1/areas/", headers=_auth(1)).headers["ETag"]
+
+    response = client.get("/api/v1/areas/", headers={**_auth(1), "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["X-Cache"] == "HIT"
+
+
+def test_write_invalidates_only_the_writers_entries(client):
+    client.get("/api/v1/tasks/", headers=_auth(1))
+    client.get("/api/v1/tasks/", headers=_auth(2))
+
+    client.post("/api/v1/tasks/", json={"title": "new"}, headers=_auth(1))
+    mine = client.get("/api/v1/tasks/", headers=_auth(1))
+    theirs = client.get("/api/v1/tasks/", headers=_auth(2))
+
+    assert mine.headers["X-Cache"] == "MISS"
+    assert [t["title"] for t in mine.json()] == ["new", "t1"]
+    assert theirs.headers["X-Cache"] == "HIT"
+    assert [t["title"] for t in theirs.json()] == ["t2"]
+
+
+def test_bulk_and_delete_writes_invalidate(client):
+    client.get("/api/v1/tasks/", headers=_auth(1))
+    client.post("/api/v1/tasks/bulk/update", json={"where": {"ids": [1]}, "changes": {"completed": True}}, headers=_auth(1))
+
+    assert client.get("/api/v1/tasks/", headers=_auth(1)).json()[0]["completed"] is True
+    client.delete("/api/v1/tasks/1", headers=_auth(1))
+    assert client.get("/api/v1/tasks/", headers=_auth(1)).json() == []
+
+
+def test_requests_without_a_verified_token_are_not_cached(client):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    # The handler still authenticates the request its own way.
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    try:
+        response = client.get("/api/v1/tasks/", headers={"Authorization": "Bearer unknown"})
+    finally:
+        main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
+    assert response_cache.stats()["stores"] == 0
+
+
+def test_metrics_report_hit_ratio(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape")
+    client.get("/api/v1/notes/", headers=_auth(1))
+    client.get("/api/v1/notes/", headers=_auth(1))
+
+    stats = client.get("/internal/metrics", headers={"Authorization": "Bearer scrape"}).json()["response_cache"]
+
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_metrics_require_the_metrics_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    assert client.get("/internal/metrics").status_code == 404
+    assert client.get("/api/v1/internal/metrics").status_code == 404
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape")
+
+    assert client.get("/internal/metrics").status_code == 401
+    assert client.get("/internal/metrics", headers=_auth(1)).status_code == 401
+    assert client.get("/internal/metrics", headers={"Authorization": "Bearer scrape"}).status_code == 200
@@ -1,30 +1,90 @@
-from unittest.mock import Mock
+import json
+import pytest
+from fastapi import Response
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
 from src.routes.search import search_items
 from src.models.task import Task, Priority
 from src.models.note import Note
 from src.models.userinfo import UserInfo
 
 
-def _make_query_result(items):
-    m = Mock()
-    m.all.return_value = items
-    return m
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def search_client(session):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    def _override_session():
+        yield session
+
+    main_mod.app.dependency_overrides[user_mod.get_read_session] = _override_session
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_read_session, None)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def test_search_items_returns_tasks_then_notes(session):
+    session.add(Task(id=1, title="T1", description="x", completed=False, priority=Priority.HIGH, due_date="2026-01-01", user_id=1))
+    session.add(Task(id=2, title="T2", description="x", completed=True, priority=Priority.LOW, due_date=None, user_id=1))
+    session.add(Note(id=10, title="N1", content="x", user_id=1))
+    session.add(Note(id=11, title="N2", content="x", user_id=2))
+    session.commit()
+
+    response = Response()
+    results = json.loads(search_items(query="x", item_type=None, limit=10, cursor=None, response=response, session=session, current_user=UserInfo(id=1)).body)
+
+    assert [(r["type"], r["id"]) for r in results] == [("task", 1), ("task", 2), ("note", 10)]
+    assert results[0]["priority"] == Priority.HIGH
+    assert "x-next-cursor" not in response.headers
+
+
+def test_search_pages_with_cursor_across_tasks_and_notes(session, search_client):
+    for i in range(5):
+        session.add(Task(title=f"match {i}", priority=list(Priority)[i % 3], due_date=None if i % 2 else f"2026-01-0{i + 1}", user_id=1))
+    for i in range(4):
+        session.add(Note(title=f"match {i}", user_id=1))
+    session.commit()
+
+    everything = search_client.get("/api/v1/search/", params={"query": "match", "limit": 100}).json()
+    pages, cursor = [], None
+    while True:
+        params = {"query": "match", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = search_client.get("/api/v1/search/", params=params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 1]
+    assert [item for page in pages for item in page] == everything
+    assert [item["type"] for item in everything] == ["task"] * 5 + ["note"] * 4
+
+
+def test_search_rejects_bad_cursor(search_client):
+    response = search_client.get("/api/v1/search/", params={"query": "x", "cursor": "not-a-cursor"})
 
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
 
-def test_search_items_returns_tasks_then_notes():
-    # Create some tasks and notes belonging to user 1
-    t1 = Task(id=1, title="T1", description="x", completed=False, priority=Priority.HIGH, due_date="2026-01-01", user_id=1)
-    t2 = Task(id=2, title="T2", description="y", completed=True, priority=Priority.LOW, due_date=None, user_id=1)
-    n1 = Note(id=10, title="N1", content="a", user_id=1)
 
-    mock_session = Mock()
-    # First call for tasks, second for notes
-    mock_session.exec.side_effect = [_make_query_result([t1, t2]), _make_query_result([n1])]
+def test_search_rejects_cursor_for_other_item_type(session, search_client):
+    for i in range(3):
+        session.add(Note(title=f"match {i}", user_id=1))
+    session.commit()
+    cursor = search_client.get("/api/v1/search/", params={"query": "match", "limit": 1, "item_type": "note"}).headers["X-Next-Cursor"]
 
-    user = UserInfo(id=1)
-    results = search_items(query="x", item_type=None, limit=10, session=mock_session, current_user=user)
+    response = search_client.get("/api/v1/search/", params={"query": "match", "item_type": "task", "cursor": cursor})
 
-    # We expect TaskSearchResult and NoteSearchResult representations appended
-    ids = [r.id for r in results]
-    assert 1 in ids
-    assert 10 in ids
+    assert response.status_code == 400
@@ -0,0 +1,105 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Response
+from sqlalchemy import text
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+from src.routes.search import search_items
+from src.services.search import IlikeSearch, SearchBackend, SqliteFullTextSearch, get_search_backend, unified_search
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    SQLModel.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        for uid in (1, 2):
+            session.add(UserInfo(id=uid, email=f"u{uid}@x.com", full_name="U", hashed_password="h",
+                                 last_login=now, created_at=now, updated_at=now))
+        session.add(Task(id=1, title="Write quarterly report", description="finance numbers", user_id=1))
+        session.add(Task(id=2, title="Groceries", description="milk, eggs", user_id=1))
+        session.add(Task(id=3, title="Quarterly report", description="someone else's", user_id=2))
+        session.add(Note(id=1, title="Report ideas", content="report report report", user_id=1))
+        session.add(Note(id=2, title="Meeting", content="mentions the report once", user_id=1))
+        session.commit()
+    return engine
+
+
+def _task_ids(session, query):
+    results, _ = unified_search(session, 1, query, 10, ["task"])
+    return sorted(r.id for r in results)
+
+
+def test_backend_must_implement_where():
+    class NoWhere(SearchBackend):
+        name = "none"
+
+    with pytest.raises(TypeError):
+        NoWhere()
+
+
+def test_sqlite_uses_fts5_backend(engine):
+    with Session(engine) as session:
+        assert isinstance(get_search_backend(session), SqliteFullTextSearch)
+
+
+def test_fts_prefix_matches_all_terms_and_scopes_to_user(engine):
+    with Session(engine) as session:
+        assert _task_ids(session, "quart rep") == [1]
+        assert _task_ids(session, "MILK") == [2]
+        assert _task_ids(session, "quarterly milk") == []
+        assert _task_ids(session, "  !! ") == []
+
+
+def test_fts_ranks_better_matches_first(engine):
+    with Session(engine) as session:
+        results = json.loads(search_items(query="report", item_type="note", limit=10, cursor=None, response=Response(),
+                                          session=session, current_user=UserInfo(id=1)).body)
+
+    assert [r["id"] for r in results] == [1, 2]
+
+
+def test_fts_index_follows_updates_and_deletes(engine):
+    with Session(engine) as session:
+        task = session.get(Task, 2)
+        task.title = "Hardware store"
+        session.add(task)
+        session.delete(session.get(Task, 1))
+        session.commit()
+
+        assert _task_ids(session, "groceries") == []
+        assert _task_ids(session, "hardware") == [2]
+        assert _task_ids(session, "report") == []
+
+
+def test_falls_back_to_ilike_without_fts_tables(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for table in ("task", "note"):
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(text(f"DROP TRIGGER {table}_fts_{suffix}"))
+            conn.execute(text(f"DROP TABLE {table}_fts"))
+
+    with Session(engine) as session:
+        session.add(Task(id=1, title="Plain substring", user_id=1))
+        session.commit()
+        assert isinstance(get_search_backend(session), IlikeSearch)
+        assert _task_ids(session, "bstri") == [1]
+
+
+def test_fts_ranked_pages_follow_the_cursor(engine):
+    with Session(engine) as session:
+        first = Response()
+        page = json.loads(search_items(query="report", item_type=None, limit=2, cursor=None, response=first,
+                                       session=session, current_user=UserInfo(id=1)).body)
+        rest = json.loads(search_items(query="report", item_type=None, limit=2, cursor=first.headers["X-Next-Cursor"],
+                                       response=Response(), session=session, current_user=UserInfo(id=1)).body)
+
+    assert [(r["type"], r["id"]) for r in page + rest] == [("task", 1), ("note", 1), ("note", 2)]
@@ -1,4 +1,7 @@
-from unittest.mock import Mock
+import json
+import pytest
+from fastapi import Response
+from sqlmodel import Session, SQLModel, create_engine
 
 from src.routes.search import search_items
 from src.models.task import Task, Priority
@@ -6,56 +9,75 @@ from src.models.note import Note
 from src.models.userinfo import UserInfo
 
 
-def _make_query_result(items):
-    m = Mock()
-    m.all.return_value = items
-    return m
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
 
 
-def test_search_task_sorting_by_priority_and_due_date():
-    # Tasks with different priority/completion/due_date
-    t_high = Task(id=1, title="high", description="x", completed=False, priority=Priority.HIGH, due_date="2026-01-01", user_id=1)
-    t_med = Task(id=2, title="med", description="x", completed=False, priority=Priority.MEDIUM, due_date="2026-01-02", user_id=1)
-    t_low_completed = Task(id=3, title="low", description="x", completed=True, priority=Priority.LOW, due_date=None, user_id=1)
+def _add(session, *items):
+    for item in items:
+        session.add(item)
+    session.commit()
+
 
-    mock_session = Mock()
-    mock_session.exec.return_value = _make_query_result([t_med, t_low_completed, t_high])
+def test_search_task_sorting_by_priority_and_due_date(session):
+    # Tasks with different priority/completion/due_date
+    _add(
+        session,
+        Task(id=1, title="high later", description="x", completed=False, priority=Priority.HIGH, due_date="2026-02-01", user_id=1),
+        Task(id=2, title="med", description="x", completed=False, priority=Priority.MEDIUM, due_date="2026-01-02", user_id=1),
+        Task(id=3, title="low", description="x", completed=True, priority=Priority.LOW, due_date=None, user_id=1),
+        Task(id=4, title="high undated", description="x", completed=False, priority=Priority.HIGH, due_date=None, user_id=1),
+        Task(id=5, title="high sooner", description="x", completed=False, priority=Priority.HIGH, due_date="2026-01-01", user_id=1),
+        Task(id=6, title="low active", description="x", completed=False, priority=Priority.LOW, due_date="2025-01-01", user_id=1),
+    )
 
     user = UserInfo(id=1)
-    results = search_items(query="x", item_type="task", limit=10, session=mock_session, current_user=user)
+    results = json.loads(search_items(query="x", item_type="task", limit=10, cursor=None, response=Response(), session=session, current_user=user).body)
 
-    # Order should prefer incomplete, then priority (HIGH first), then due_date
-    ids = [r.id for r in results]
-    assert ids[0] == 1
-    assert ids[1] == 2
-    assert 3 in ids
+    # Incomplete first, then priority (HIGH first), then earliest due_date with undated last
+    assert [r["id"] for r in results] == [5, 1, 4, 2, 6, 3]
 
 
-def test_search_limit_and_item_type_note():
-    n1 = Note(id=10, title="N1", content="x", user_id=1)
-    n2 = Note(id=11, title="N2", content="x", user_id=1)
+def test_search_limit_and_item_type_note(session):
+    from datetime import datetime, timedelta, timezone
 
-    mock_session = Mock()
-    # When searching notes only, search() should only call exec once for notes.
-    mock_session.exec.return_value = _make_query_result([n1, n2])
+    now = datetime.now(timezone.utc)
+    _add(
+        session,
+        Note(id=10, title="N1", content="x", user_id=1, updated_at=now - timedelta(minutes=1)),
+        Note(id=11, title="N2", content="x", user_id=1, updated_at=now),
+    )
 
     user = UserInfo(id=1)
-    results = search_items(query="x", item_type="note", limit=1, session=mock_session, current_user=user)
+    results = json.loads(search_items(query="x", item_type="note", limit=1, cursor=None, response=Response(), session=session, current_user=user).body)
 
     assert len(results) == 1
-    # Notes are sorted by `updated_at` (newest first); n2 was created after n1
-    assert results[0].id == 11
+    # Notes are sorted by `updated_at` (newest first)
+    assert results[0]["id"] == 11
 
 
-def test_search_item_type_all_returns_both():
-    t = Task(id=5, title="T", description="x", user_id=1)
-    n = Note(id=20, title="N", content="x", user_id=1)
-
-    mock_session = Mock()
-    mock_session.exec.side_effect = [_make_query_result([t]), _make_query_result([n])]
+def test_search_item_type_all_returns_both(session):
+    _add(session, Task(id=5, title="T", description="x", user_id=1), Note(id=20, title="N", content="x", user_id=1))
 
     user = UserInfo(id=1)
-    results = search_items(query="x", item_type="all", limit=10, session=mock_session, current_user=user)
+    results = json.loads(search_items(query="x", item_type="all", limit=10, cursor=None, response=Response(), session=session, current_user=user).body)
 
-    ids = [r.id for r in results]
+    ids = [r["id"] for r in results]
     assert 5 in ids and 20 in ids
+
+
+def test_search_fills_limit_with_notes_after_tasks(session):
+    _add(
+        session,
+        *(Task(id=i, title=f"match {i}", user_id=1) for i in range(1, 4)),
+        *(Note(id=i, title=f"match {i}", user_id=1) for i in range(10, 15)),
+    )
+
+    user = UserInfo(id=1)
+    results = json.loads(search_items(query="match", item_type=None, limit=5, cursor=None, response=Response(), session=session, current_user=user).body)
+
+    assert [r["type"] for r in results] == ["task"] * 3 + ["note"] * 2
@@ -0,0 +1,79 @@
+import pytest
+
+from security.keys import generate_key_pair
+from src.core import jws, security
+from src.core.config import settings
+
+
+def _use_keys(monkeypatch, algorithm, private_pem, public_pem, legacy=None):
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", algorithm, raising=False)
+    monkeypatch.setattr(settings, "SECRET_KEY", private_pem, raising=False)
+    monkeypatch.setattr(settings, "PUBLIC_KEY", public_pem, raising=False)
+    legacy_alg, legacy_pem = legacy or ("RS256", "")
+    monkeypatch.setattr(settings, "JWT_LEGACY_ALGORITHM", legacy_alg, raising=False)
+    monkeypatch.setattr(settings, "JWT_LEGACY_PUBLIC_KEY", legacy_pem, raising=False)
+    monkeypatch.setattr(security, "SECRET_JWK", None, raising=False)
+    monkeypatch.setattr(security, "PUBLIC_JWK", None, raising=False)
+    monkeypatch.setattr(security, "LEGACY_PUBLIC_JWK", None, raising=False)
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "PS256", "ES256", "EdDSA"])
+def test_round_trip_per_algorithm(monkeypatch, algorithm):
+    _use_keys(monkeypatch, algorithm, *generate_key_pair(algorithm))
+
+    token = security.create_access_token("me@example.com", claims={"uid": 1})
+
+    assert jws.peek_algorithm(token) == algorithm
+    payload = security.decode_access_token(token)
+    assert payload["sub"] == "me@example.com"
+    assert payload["uid"] == 1
+
+
+@pytest.mark.parametrize("algorithm", ["ES256", "EdDSA"])
+def test_native_tokens_from_another_key_are_rejected(monkeypatch, algorithm):
+    _use_keys(monkeypatch, algorithm, *generate_key_pair(algorithm))
+    token = security.create_access_token("me@example.com")
+
+    _use_keys(monkeypatch, algorithm, *generate_key_pair(algorithm))
+    with pytest.raises(ValueError):
+        security.decode_access_token(token)
+
+
+def test_native_expired_token_is_rejected(monkeypatch):
+    from datetime import timedelta
+
+    _use_keys(monkeypatch, "EdDSA", *generate_key_pair("EdDSA"))
+    token = security.create_access_token("me@example.com", expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(ValueError):
+        security.decode_access_token(token)
+
+
+def test_legacy_rs256_tokens_validate_during_migration(monkeypatch):
+    rsa_private, rsa_public = generate_key_pair("RS256")
+    _use_keys(monkeypatch, "RS256", rsa_private, rsa_public)
+    old_token = security.create_access_token("me@example.com")
+
+    _use_keys(monkeypatch, "EdDSA", *generate_key_pair("EdDSA"), legacy=("RS256", rsa_public))
+    new_token = security.create_access_token("me@example.com")
+
+    assert jws.peek_algorithm(new_token) == "EdDSA"
+    assert security.decode_access_token(old_token)["sub"] == "me@example.com"
+    assert security.decode_access_token(new_token)["sub"] == "me@example.com"
+
+    # Once the legacy key is dropped, old tokens stop validating.
+    _use_keys(monkeypatch, "EdDSA", settings.SECRET_KEY, settings.PUBLIC_KEY)
+    with pytest.raises(ValueError):
+        security.decode_access_token(old_token)
+
+
+def test_key_type_must_match_algorithm(monkeypatch):
+    _use_keys(monkeypatch, "ES256", *generate_key_pair("EdDSA"))
+    with pytest.raises(ValueError):
+        security._ensure_jwks()
+
+
+def test_unsupported_algorithm_is_rejected(monkeypatch):
+    _use_keys(monkeypatch, "HS256", *generate_key_pair("RS256"))
+    with pytest.raises(ValueError):
+        security._ensure_jwks()
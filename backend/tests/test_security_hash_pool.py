@@ -0,0 +1,84 @@
+import asyncio
+import secrets
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from src.core import security
+from src.core.config import settings
+
+
+@pytest.fixture
+def hash_pool(monkeypatch):
+    security.shutdown_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1, raising=False)
+    yield
+    security.shutdown_hash_executor()
+
+
+def test_hash_and_verify_run_in_worker_process(hash_pool):
+    pwd = secrets.token_urlsafe(16)
+    hashed = security.get_password_hash(pwd)
+
+    assert security._hash_executor is not None
+    assert security.verify_password(pwd, hashed) is True
+    assert security.verify_password(pwd + "x", hashed) is False
+    assert security.hash_pool_stats()["pending"] == 0
+
+
+def test_async_hash_and_verify(hash_pool):
+    pwd = secrets.token_urlsafe(16)
+
+    async def _run():
+        hashed = await security.aget_password_hash(pwd)
+        return await security.averify_password(pwd, hashed)
+
+    assert asyncio.run(_run()) is True
+
+
+def test_disabled_pool_hashes_inline(monkeypatch):
+    security.shutdown_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0, raising=False)
+    pwd = secrets.token_urlsafe(16)
+
+    assert security.verify_password(pwd, security.get_password_hash(pwd)) is True
+    assert security._hash_executor is None
+
+
+def test_full_queue_is_rejected(hash_pool, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 0, raising=False)
+    rejected = security.hash_pool_stats()["rejected"]
+
+    with pytest.raises(security.PasswordHashQueueFull):
+        security.get_password_hash("pwd")
+    assert security.hash_pool_stats()["rejected"] == rejected + 1
+
+
+def test_login_returns_503_when_queue_full(monkeypatch):
+    from src.models.userinfo import UserInfo
+    from src.routes.user import login
+
+    def _busy(*args):
+        raise security.PasswordHashQueueFull()
+
+    monkeypatch.setattr("src.routes.user.verify_password", _busy)
+    session = Mock(spec=Session)
+    session.exec.return_value.first.return_value = UserInfo(email="u@x.com", hashed_password="h")
+
+    with pytest.raises(HTTPException) as exc:
+        login(session=session, form_data=Mock(username="u@x.com", password="p"))
+    assert exc.value.status_code == 503
+
+
+def test_app_shutdown_stops_hash_workers(hash_pool):
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.app):
+        security.get_password_hash(secrets.token_urlsafe(16))
+        assert security._hash_executor is not None
+
+    assert security._hash_executor is None
@@ -0,0 +1,63 @@
+import json
+from datetime import datetime, timezone
+from typing import Union
+
+from fastapi import Response
+
+from src.core.serialization import adapter, render, respond
+from src.models.task import Priority, Task, TaskPublic, TaskSummary
+
+
+class CountingRow:
+    """A result row that counts how often each column is read."""
+
+    def __init__(self, **values):
+        self._values = values
+        self.reads = {}
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._values:
+            raise AttributeError(name)
+        self.reads[name] = self.reads.get(name, 0) + 1
+        return self._values[name]
+
+
+def _row(i):
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return CountingRow(id=i, title=f"t{i}", area_id=None, due_date=None, completed=False,
+                       priority=Priority.HIGH, created_at=now, updated_at=now)
+
+
+def test_rows_are_validated_once():
+    rows = [_row(i) for i in range(3)]
+
+    body = json.loads(render(list[TaskSummary], rows))
+
+    assert [item["id"] for item in body] == [0, 1, 2]
+    assert all(row.reads["id"] == 1 for row in rows)
+    # What the union response_model did before: every row validated against both views.
+    union_rows = [_row(i) for i in range(3)]
+    adapter(Union[list[TaskPublic], list[TaskSummary]]).validate_python(union_rows, from_attributes=True)
+    assert all(row.reads["id"] == 2 for row in union_rows)
+
+
+def test_render_matches_the_response_model_output():
+    task = Task(id=1, title="T", description="d", priority=Priority.LOW, user_id=1)
+
+    rendered = render(list[TaskPublic], [task])
+
+    expected = adapter(list[TaskPublic]).dump_json([TaskPublic.model_validate(task)])
+    assert rendered == expected
+    assert "user_id" not in json.loads(rendered)[0]
+
+
+def test_respond_keeps_the_handlers_headers():
+    handler_response = Response()
+    handler_response.headers["X-Next-Cursor"] = "abc"
+
+    response = respond(list[int], [], handler_response)
+
+    assert response.body == b"[]"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert response.headers["content-type"] == "application/json"
+    assert adapter(list[int]) is adapter(list[int])
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1))
+        session.add(Area(id=2, name="B", color="c", user_id=2))
+        session.add(Task(id=1, title="mine", area_id=1, user_id=1, updated_at=yesterday))
+        session.add(Task(id=2, title="theirs", area_id=2, user_id=2, updated_at=yesterday))
+        session.add(Note(id=1, title="mine", area_id=1, user_id=1, updated_at=yesterday))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def statements(engine):
+    """SQL statements run against `engine` while a request is handled, excluding transaction control."""
+    seen = []
+    listener = lambda conn, cursor, statement, *args: seen.append(statement.split()[0])
+    event.listen(engine, "before_cursor_execute", listener)
+    yield seen
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+@pytest.fixture
+def write_client(engine, monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "_recent_writes", {})
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+@pytest.mark.parametrize(
+    "path, body, field",
+    [("/api/v1/tasks/1", {"completed": True}, "completed"), ("/api/v1/notes/1", {"title": "new"}, "title"),
+     ("/api/v1/areas/1", {"name": "new"}, "name")],
+)
+def test_patch_is_one_update_returning(write_client, statements, path, body, field):
+    response = write_client.patch(path, json=body)
+
+    assert response.status_code == 200
+    assert response.json()[field] == body[field]
+    updated_at = datetime.fromisoformat(response.json()["updated_at"]).replace(tzinfo=timezone.utc)
+    assert updated_at > datetime.now(timezone.utc) - timedelta(hours=1)
+    assert statements == ["UPDATE"]
+    assert database.reads_from_primary(1)
+
+
+@pytest.mark.parametrize("path", ["/api/v1/tasks/1", "/api/v1/notes/1"])
+def test_delete_is_one_delete_returning_and_its_tombstone(write_client, statements, path):
+    assert write_client.delete(path).json() == {"ok": True}
+    assert statements == ["DELETE", "INSERT"]
+    assert write_client.delete(path).status_code == 404
+
+
+def test_create_is_one_insert(write_client, statements):
+    response = write_client.post("/api/v1/tasks/", json={"title": "new", "area_id": 1})
+
+    assert response.status_code == 200
+    assert response.json()["id"] > 2
+    # Nothing is read back after commit.
+    assert statements == ["INSERT"]
+
+
+def test_other_users_rows_are_not_found(write_client, engine):
+    assert write_client.patch("/api/v1/tasks/2", json={"title": "stolen"}).status_code == 404
+    assert write_client.delete("/api/v1/tasks/2").status_code == 404
+
+    with Session(engine) as session:
+        assert session.get(Task, 2).title == "theirs"
+    assert not database.reads_from_primary(1)
+
+
+def test_empty_patch_does_not_touch_updated_at(write_client, statements, engine):
+    with Session(engine) as session:
+        before = session.get(Task, 1).updated_at
+    statements.clear()
+
+    assert write_client.patch("/api/v1/tasks/1", json={}).status_code == 200
+
+    assert statements == ["SELECT"]
+    with Session(engine) as session:
+        assert session.get(Task, 1).updated_at == before
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from src.core import database
+from src.core.pagination import encode_cursor
+from src.models.area import Area
+from src.models.note import Note
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+from src.services.sync import sync_cursor
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1, updated_at=yesterday))
+        session.add(Area(id=2, name="B", color="c", user_id=2, updated_at=yesterday))
+        for i in (1, 2, 3):
+            session.add(Task(id=i, title=f"t{i}", area_id=1, user_id=1, updated_at=yesterday))
+        session.add(Task(id=4, title="theirs", area_id=2, user_id=2, updated_at=yesterday))
+        session.add(Note(id=1, title="n1", area_id=1, user_id=1, updated_at=yesterday))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    monkeypatch.setattr(database, "engine", engine)
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def _ids(rows):
+    return [row["id"] for row in rows]
+
+
+def test_sync_without_cursor_is_everything(client):
+    body = client.get("/api/v1/sync").json()
+
+    assert body["full"] is True
+    assert _ids(body["areas"]) == [1]
+    assert _ids(body["tasks"]) == [1, 2, 3]
+    assert _ids(body["notes"]) == [1]
+    assert body["deleted"] == {"areas": [], "tasks": [], "notes": []}
+
+
+def test_sync_returns_only_changes_since_bootstrap(client):
+    since = client.get("/api/v1/bootstrap").json()["sync_cursor"]
+    assert client.get("/api/v1/sync", params={"since": since}).json()["tasks"] == []
+
+    client.patch("/api/v1/tasks/1", json={"completed": True})
+    client.delete("/api/v1/tasks/2")
+    client.post("/api/v1/tasks/bulk/delete", json={"ids": [3, 4]})
+    created = client.post("/api/v1/notes/", json={"title": "new", "area_id": 1}).json()
+    body = client.get("/api/v1/sync", params={"since": since}).json()
+
+    assert body["full"] is False
+    assert [(t["id"], t["completed"]) for t in body["tasks"]] == [(1, True)]
+    assert _ids(body["notes"]) == [created["id"]]
+    assert body["areas"] == []
+    # Task 4 is someone else's and was left alone.
+    assert body["deleted"] == {"areas": [], "tasks": [2, 3], "notes": []}
+
+
+def test_sync_cursor_overlaps_so_late_commits_are_not_missed(client, engine):
+    since = client.get("/api/v1/sync").json()["cursor"]
+    # A write stamped just before that read, committed just after it.
+    with Session(engine) as session:
+        task = session.get(Task, 1)
+        task.title = "late"
+        task.updated_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.add(task)
+        session.commit()
+
+    body = client.get("/api/v1/sync", params={"since": since}).json()
+
+    assert [t["title"] for t in body["tasks"]] == ["late"]
+
+
+def test_area_delete_is_synced_with_its_children(client):
+    since = sync_cursor(datetime.now(timezone.utc))
+
+    assert client.delete("/api/v1/areas/1").json() == {"ok": True}
+    body = client.get("/api/v1/sync", params={"since": since}).json()
+
+    assert body["deleted"]["areas"] == [1]
+    # SET NULL: the children are updated, not deleted.
+    assert {t["id"]: t["area_id"] for t in body["tasks"]} == {1: None, 2: None, 3: None}
+    assert [n["area_id"] for n in body["notes"]] == [None]
+
+
+def test_recreated_id_is_not_reported_deleted(client, engine):
+    since = sync_cursor(datetime.now(timezone.utc))
+    client.delete("/api/v1/notes/1")
+    with Session(engine) as session:
+        # SQLite may hand out the id of a deleted row again.
+        session.add(Note(id=1, title="again", user_id=1))
+        session.commit()
+
+    body = client.get("/api/v1/sync", params={"since": since}).json()
+
+    assert _ids(body["notes"]) == [1]
+    assert body["deleted"]["notes"] == []
+
+
+def test_expired_cursor_gets_a_full_sync(client):
+    since = sync_cursor(datetime.now(timezone.utc) - timedelta(days=365))
+
+    body = client.get("/api/v1/sync", params={"since": since}).json()
+
+    assert body["full"] is True
+    assert _ids(body["tasks"]) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("since", ["garbage", encode_cursor("tasks", [datetime.now(timezone.utc), 1])])
+def test_invalid_sync_cursor_is_rejected(client, since):
+    response = client.get("/api/v1/sync", params={"since": since})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_sync_is_one_query_per_collection_and_tombstones(client, engine):
+    since = sync_cursor(datetime.now(timezone.utc))
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+
+    client.get("/api/v1/sync", params={"since": since})
+
+    event.remove(engine, "before_cursor_execute", listener)
+    assert len(statements) == 4
@@ -1,6 +1,6 @@
 from unittest.mock import Mock
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 from src.routes.task import read_tasks
 from src.models.area import Area
@@ -9,8 +9,11 @@ from src.models.userinfo import UserInfo
 
 def test_read_tasks_area_mismatch_raises():
     mock_session = Mock()
+    # The owner-scoped query finds nothing in someone else's area.
+    mock_session.exec.return_value.all.return_value = []
+    mock_session.exec.return_value.one.return_value = (None, 0, None)
     mock_session.get.return_value = Area(id=2, user_id=99, name="A", color="c")
     user = UserInfo(id=1)
 
     with pytest.raises(HTTPException):
-        read_tasks(session=mock_session, offset=0, limit=10, area_id=2, current_user=user)
+        read_tasks(session=mock_session, offset=0, limit=10, area_id=2, cursor=None, response=Response(), current_user=user)
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from src.core import database
+from src.models.area import Area
+from src.models.task import Task
+from src.models.userinfo import UserInfo
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.enforce_foreign_keys(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(UserInfo(id=1, email="a@example.com", full_name="A", hashed_password="x"))
+        session.add(UserInfo(id=2, email="b@example.com", full_name="B", hashed_password="x"))
+        session.add(Area(id=1, name="A", color="c", user_id=1))
+        session.add(Area(id=2, name="B", color="c", user_id=1))
+        session.add(Area(id=3, name="C", color="c", user_id=2))
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        for i in range(1, 7):
+            session.add(Task(id=i, title=f"t{i}", area_id=1 + i % 2, completed=i > 4, user_id=1, updated_at=yesterday))
+        session.add(Task(id=7, title="other", area_id=3, user_id=2))
+        session.commit()
+        yield session
+
+
+@pytest.fixture
+def bulk_client(session, monkeypatch):
+    import main as main_mod
+    from src.routes import user as user_mod
+
+    def _override_session():
+        yield session
+
+    monkeypatch.setattr(database, "_recent_writes", {})
+    main_mod.app.dependency_overrides[database.get_session] = _override_session
+    main_mod.app.dependency_overrides[user_mod.get_current_user] = lambda: UserInfo(id=1)
+    yield TestClient(main_mod.app)
+    main_mod.app.dependency_overrides.pop(database.get_session, None)
+    main_mod.app.dependency_overrides.pop(user_mod.get_current_user, None)
+
+
+def _tasks(session, user_id=1):
+    session.expire_all()
+    return {t.id: t for t in session.exec(select(Task).where(Task.user_id == user_id))}
+
+
+def test_complete_open_tasks_in_area(bulk_client, session):
+    response = bulk_client.post(
+        "/api/v1/tasks/bulk/update",
+        json={"where": {"area_id": 2, "completed": False}, "changes": {"completed": True}},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"ids": [1, 3]}
+    tasks = _tasks(session)
+    assert sorted(i for i, t in tasks.items() if t.completed) == [1, 3, 5, 6]
+    # updated_at still moves, so list order and cursors see the change.
+    assert tasks[1].updated_at > tasks[2].updated_at
+    assert database.reads_from_primary(1)
+
+
+def test_move_by_ids_is_one_statement_and_skips_other_users(bulk_client, session):
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    try:
+        response = bulk_client.post(
+            "/api/v1/tasks/bulk/update", json={"where": {"ids": [1, 2, 3, 7]}, "changes": {"area_id": 1}}
+        )
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+    assert response.json() == {"ids": [1, 2, 3]}
+    # One UPDATE for all the tasks; the foreign key checks the target area.
+    assert [s.split()[0] for s in statements] == ["UPDATE"]
+    assert {t.area_id for t in _tasks(session).values() if t.id <= 3} == {1}
+    assert _tasks(session, user_id=2)[7].area_id == 3
+
+
+def test_move_to_foreign_area_is_rejected(bulk_client, session):
+    response = bulk_client.post("/api/v1/tasks/bulk/update", json={"where": {"ids": [1]}, "changes": {"area_id": 3}})
+
+    assert response.status_code == 404
+    assert _tasks(session)[1].area_id == 2
+
+
+def test_bulk_delete_returns_deleted_ids(bulk_client, session):
+    response = bulk_client.post("/api/v1/tasks/bulk/delete", json={"completed": True})
+
+    assert response.json() == {"ids": [5, 6]}
+    assert sorted(_tasks(session)) == [1, 2, 3, 4]
+    assert list(_tasks(session, user_id=2)) == [7]
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    [
+        ("/api/v1/tasks/bulk/delete", {}),
+        ("/api/v1/tasks/bulk/delete", {"ids": None}),
+        ("/api/v1/tasks/bulk/update", {"where": {"ids": [1]}, "changes": {}}),
+        ("/api/v1/tasks/bulk/delete", {"ids": list(range(1001))}),
+    ],
+)
+def test_bulk_requires_a_selection_and_changes(bulk_client, session, path, body):
+    assert bulk_client.post(path, json=body).status_code == 422
+    assert len(_tasks(session)) == 6
@@ -1,6 +1,6 @@
 from unittest.mock import Mock
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 from src.routes.task import (
     create_task,
@@ -35,10 +35,6 @@ def test_check_correct_area_id_not_found_raises():
 def test_create_task_success():
     mock_session = Mock()
 
-    def refresh_side(obj):
-        obj.id = 7
-
-    mock_session.refresh.side_effect = refresh_side
     user = UserInfo(id=3)
     task_in = TaskCreate(title="T", description="d", area_id=1)
 
@@ -49,7 +45,7 @@ def test_create_task_success():
 
     assert mock_session.add.called
     assert mock_session.commit.called
-    assert getattr(task, "id", None) == 7
+    mock_session.refresh.assert_not_called()
     assert task.user_id == user.id
 
 
@@ -59,14 +55,14 @@ def test_read_task_not_found_raises():
     user = UserInfo(id=1)
 
     with pytest.raises(HTTPException) as exc:
-        read_task(session=mock_session, task_id=1, current_user=user)
+        read_task(session=mock_session, task_id=1, response=Response(), current_user=user)
     assert exc.value.status_code == 404
 
 
 def test_update_task_owner_mismatch_raises():
     mock_session = Mock()
-    task = Task(id=1, user_id=99, title="X", description=None)
-    mock_session.get.return_value = task
+    # The owner-scoped UPDATE matches no row.
+    mock_session.exec.return_value.scalar_one_or_none.return_value = None
     user = UserInfo(id=2)
 
     with pytest.raises(HTTPException) as exc:
@@ -76,12 +72,13 @@ def test_update_task_owner_mismatch_raises():
 
 def test_delete_task_success():
     mock_session = Mock()
-    task = Task(id=1, user_id=2, title="X", description=None)
-    mock_session.get.return_value = task
+    # DELETE ... RETURNING id found the row.
+    mock_session.exec.return_value.first.return_value = 1
     user = UserInfo(id=2)
 
     res = delete_task(session=mock_session, task_id=1, current_user=user)
 
     assert res == {"ok": True}
-    mock_session.delete.assert_called_once_with(task)
+    mock_session.get.assert_not_called()
+    mock_session.delete.assert_not_called()
     mock_session.commit.assert_called_once()
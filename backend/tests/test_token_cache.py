@@ -0,0 +1,102 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+from sqlmodel import Session
+
+from src.core.token_cache import TokenCache, token_cache
+from src.models.userinfo import UserInfo
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def _claims(ttl=3600):
+    return {"sub": "u@x.com", "exp": int(time.time()) + ttl}
+
+
+def test_put_get_returns_detached_principal_and_counts_hits():
+    cache = TokenCache(maxsize=8, ttl=60)
+    user = UserInfo(id=1, email="u@x.com", full_name="U", hashed_password="secret")
+
+    assert cache.get("tok") is None
+    cache.put("tok", _claims(), user)
+    entry = cache.get("tok")
+
+    assert entry.user.id == 1
+    assert entry.user is not user
+    assert entry.user.hashed_password is None
+    assert entry.claims["sub"] == "u@x.com"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entry_expires_no_later_than_token_exp():
+    cache = TokenCache(maxsize=8, ttl=3600)
+    cache.put("tok", {"sub": "u@x.com", "exp": time.time() + 0.05}, UserInfo(id=1))
+    assert cache.get("tok") is not None
+    time.sleep(0.06)
+    assert cache.get("tok") is None
+
+
+def test_tokens_without_exp_are_not_cached():
+    cache = TokenCache(maxsize=8, ttl=60)
+    cache.put("tok", {"sub": "u@x.com"}, UserInfo(id=1))
+    assert cache.get("tok") is None
+
+
+def test_lru_eviction_and_user_invalidation():
+    cache = TokenCache(maxsize=2, ttl=60)
+    cache.put("a", _claims(), UserInfo(id=1))
+    cache.put("b", _claims(), UserInfo(id=2))
+    cache.get("a")
+    cache.put("c", _claims(), UserInfo(id=1))
+
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    cache.invalidate_user(1)
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_get_current_user_skips_decode_and_lookup_on_hit(monkeypatch):
+    from src.routes.user import get_current_user
+
+    decode = Mock(return_value=_claims())
+    monkeypatch.setattr("src.routes.user.decode_access_token", decode)
+    session = Mock(spec=Session)
+    session.exec.return_value.first.return_value = UserInfo(id=3, email="u@x.com", full_name="U")
+
+    first = get_current_user(session=session, token="real-token")
+    second = get_current_user(session=session, token="real-token")
+
+    assert first.id == second.id == 3
+    decode.assert_called_once()
+    session.exec.assert_called_once()
+
+
+def test_user_row_update_invalidates_cached_tokens():
+    from sqlalchemy.pool import StaticPool
+    from sqlmodel import SQLModel, create_engine
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        user = UserInfo(email="u@x.com", full_name="U", hashed_password="h")
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+
+        token_cache.put("tok", _claims(), user)
+        assert token_cache.get("tok") is not None
+
+        user.full_name = "Renamed"
+        session.add(user)
+        session.commit()
+
+    assert token_cache.get("tok") is None
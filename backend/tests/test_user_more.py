@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import Mock
 import unittest
 from src.routes.user import read_users_me
 from src.models.userinfo import UserInfo
@@ -6,4 +7,7 @@ from src.models.userinfo import UserInfo
 
 def test_read_users_me_returns_user():
     u = UserInfo(id=1, email="u@x.com", full_name="U")
-    assert read_users_me(current_user=u) == u
+    mock_session = Mock()
+    mock_session.get.return_value = u
+    assert read_users_me(session=mock_session, current_user=UserInfo(id=1)) == u
+    mock_session.get.assert_called_once_with(UserInfo, 1)
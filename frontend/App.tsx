@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import Sidebar from './components/Sidebar';
 import Dashboard from './pages/Dashboard';
 import TasksPage from './pages/Tasks';
@@ -9,6 +9,7 @@ import SignUp from './pages/SignUp';
 import TaskModal from './components/TaskModal';
 import NoteModal from './components/NoteModal';
 import { api } from './services/api';
+import { applySync } from './services/sync';
 import { AppData, Task, Note, Area, Priority } from './types';
 
 const App: React.FC = () => {
@@ -17,6 +18,8 @@ const App: React.FC = () => {
   const [currentPage, setCurrentPage] = useState('dashboard');
   const [appData, setAppData] = useState<AppData | null>(null);
   const [isLoading, setIsLoading] = useState(false);
+  // Where the next /sync picks up from.
+  const syncCursor = useRef<string | null>(null);
 
   // Modal States
   const [editingTask, setEditingTask] = useState<Task | null>(null);
@@ -26,12 +29,8 @@ const App: React.FC = () => {
   const fetchData = async () => {
     setIsLoading(true);
     try {
-      const [user, areas, tasks, notes] = await Promise.all([
-        api.getUser(),
-        api.getAreas(),
-        api.getTasks(),
-        api.getNotes(),
-      ]);
+      const { user, areas, tasks, notes, sync_cursor } = await api.getBootstrap();
+      syncCursor.current = sync_cursor;
       setAppData({ user, areas, tasks, notes });
     } catch (error) {
       console.error("Failed to load data", error);
@@ -44,6 +43,20 @@ const App: React.FC = () => {
     }
   };
 
+  // After an edit, fetch only what changed instead of everything.
+  const syncData = async () => {
+    if (!syncCursor.current) {
+      return fetchData();
+    }
+    try {
+      const changes = await api.sync(syncCursor.current);
+      syncCursor.current = changes.cursor;
+      setAppData(current => current && applySync(current, changes));
+    } catch (error) {
+      console.error("Failed to sync data", error);
+    }
+  };
+
   useEffect(() => {
     if (isAuthenticated) {
         fetchData();
@@ -65,14 +78,16 @@ const App: React.FC = () => {
 
   const handleLogout = () => {
       localStorage.removeItem('focusflow_token');
+      localStorage.removeItem('focusflow_refresh_token');
       setIsAuthenticated(false);
       setAppData(null);
+      syncCursor.current = null;
       setCurrentPage('dashboard');
   };
 
   const handleCreateArea = async (name: string, color: string) => {
       await api.createArea(name, color);
-      fetchData();
+      syncData();
   };
 
   const handleCreateTask = (areaId: number | null = null) => {
@@ -112,7 +127,7 @@ const App: React.FC = () => {
       } else {
           await api.updateTask(task.id, taskToSave);
       }
-      fetchData();
+      syncData();
   };
 
   const handleSaveNote = async (note: Note) => {
@@ -126,12 +141,12 @@ const App: React.FC = () => {
       } else {
           await api.updateNote(note.id, noteData);
       }
-      fetchData();
+      syncData();
   };
 
   const handleToggleTask = async (taskId: string, completed: boolean) => {
       await api.toggleTaskCompletion(taskId, completed);
-      fetchData();
+      syncData();
   };
 
 
@@ -180,7 +195,7 @@ const App: React.FC = () => {
       case 'tasks':
         return <TasksPage 
             data={appData} 
-            onDataUpdate={fetchData} 
+            onDataUpdate={syncData} 
             onOpenTask={setEditingTask}
             onNewTask={handleCreateTask}
             onOpenNote={setEditingNote}
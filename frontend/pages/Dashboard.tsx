@@ -24,6 +24,7 @@ const Dashboard: React.FC<DashboardProps> = ({ data, onNavigate, onNewTask, onNe
   const [searchResults, setSearchResults] = useState<SearchResult[]>([]);
   const [isSearchLoading, setIsSearchLoading] = useState(false);
   const [noSearchResults, setNoSearchResults] = useState(false);
+  const [searchCursor, setSearchCursor] = useState<string | null>(null);
   const searchRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -31,9 +32,10 @@ const Dashboard: React.FC<DashboardProps> = ({ data, onNavigate, onNewTask, onNe
       if (searchQuery.length > 1) {
         setIsSearchLoading(true);
         try {
-          const results = await api.search(searchQuery, 'all');
-          setSearchResults(results);
-          setNoSearchResults(results.length === 0);
+          const page = await api.searchPage(searchQuery, 'all');
+          setSearchResults(page.results);
+          setSearchCursor(page.nextCursor);
+          setNoSearchResults(page.results.length === 0);
         } catch (error) {
           console.error("Search failed:", error);
           setSearchResults([]);
@@ -43,6 +45,7 @@ const Dashboard: React.FC<DashboardProps> = ({ data, onNavigate, onNewTask, onNe
         }
       } else {
         setSearchResults([]);
+        setSearchCursor(null);
         setNoSearchResults(false);
       }
     }, 300); // 300ms debounce
@@ -64,6 +67,17 @@ const Dashboard: React.FC<DashboardProps> = ({ data, onNavigate, onNewTask, onNe
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
+  const handleLoadMoreResults = async () => {
+    if (!searchCursor) return;
+    try {
+      const page = await api.searchPage(searchQuery, 'all', searchCursor);
+      setSearchResults(prev => [...prev, ...page.results]);
+      setSearchCursor(page.nextCursor);
+    } catch (error) {
+      console.error("Search failed:", error);
+    }
+  };
+
   const handleOpenResult = (result: SearchResult) => {
     if (!data) return;
     if (result.type === 'task') {
@@ -146,6 +160,14 @@ const Dashboard: React.FC<DashboardProps> = ({ data, onNavigate, onNewTask, onNe
                         )}
                     </button>
                     ))}
+                    {searchCursor && (
+                    <button
+                        onClick={handleLoadMoreResults}
+                        className="w-full p-2 text-sm font-medium text-primary hover:bg-slate-50 dark:hover:bg-slate-700 transition-colors"
+                    >
+                        Show more results
+                    </button>
+                    )}
                 </div>
             )}
             {searchQuery.length > 1 && !isSearchLoading && noSearchResults && (
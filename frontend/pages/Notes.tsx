@@ -16,6 +16,7 @@ const NotesPage: React.FC<NotesPageProps> = ({ data, onOpenNote, onNewNote, onOp
   const [searchResults, setSearchResults] = useState<SearchResult[]>([]);
   const [isSearchLoading, setIsSearchLoading] = useState(false);
   const [noSearchResults, setNoSearchResults] = useState(false);
+  const [searchCursor, setSearchCursor] = useState<string | null>(null);
   const searchRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -23,9 +24,10 @@ const NotesPage: React.FC<NotesPageProps> = ({ data, onOpenNote, onNewNote, onOp
       if (searchQuery.length > 1) {
         setIsSearchLoading(true);
         try {
-          const results = await api.search(searchQuery, 'note'); // Search only for notes
-          setSearchResults(results);
-          setNoSearchResults(results.length === 0);
+          const page = await api.searchPage(searchQuery, 'note'); // Search only for notes
+          setSearchResults(page.results);
+          setSearchCursor(page.nextCursor);
+          setNoSearchResults(page.results.length === 0);
         } catch (error) {
           console.error("Search failed:", error);
           setSearchResults([]);
@@ -35,6 +37,7 @@ const NotesPage: React.FC<NotesPageProps> = ({ data, onOpenNote, onNewNote, onOp
         }
       } else {
         setSearchResults([]);
+        setSearchCursor(null);
         setNoSearchResults(false);
       }
     }, 300); // 300ms debounce
@@ -56,6 +59,17 @@ const NotesPage: React.FC<NotesPageProps> = ({ data, onOpenNote, onNewNote, onOp
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
+  const handleLoadMoreResults = async () => {
+    if (!searchCursor) return;
+    try {
+      const page = await api.searchPage(searchQuery, 'note', searchCursor);
+      setSearchResults(prev => [...prev, ...page.results]);
+      setSearchCursor(page.nextCursor);
+    } catch (error) {
+      console.error("Search failed:", error);
+    }
+  };
+
   const handleOpenResult = (result: SearchResult) => {
     if (!data) return;
     if (result.type === 'note') {
@@ -120,6 +134,14 @@ const NotesPage: React.FC<NotesPageProps> = ({ data, onOpenNote, onNewNote, onOp
                             )}
                         </button>
                         ))}
+                        {searchCursor && (
+                        <button
+                            onClick={handleLoadMoreResults}
+                            className="w-full p-2 text-sm font-medium text-primary hover:bg-slate-50 dark:hover:bg-slate-700 transition-colors"
+                        >
+                            Show more results
+                        </button>
+                        )}
                     </div>
                     )}
                     {searchQuery.length > 1 && !isSearchLoading && noSearchResults && (
@@ -15,6 +15,7 @@ const TasksPage: React.FC<TasksPageProps> = ({ data, onDataUpdate, onOpenTask, o
   const [searchResults, setSearchResults] = useState<SearchResult[]>([]);
   const [isSearchLoading, setIsSearchLoading] = useState(false);
   const [noSearchResults, setNoSearchResults] = useState(false);
+  const [searchCursor, setSearchCursor] = useState<string | null>(null);
   const searchRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -22,9 +23,10 @@ const TasksPage: React.FC<TasksPageProps> = ({ data, onDataUpdate, onOpenTask, o
       if (searchQuery.length > 1) {
         setIsSearchLoading(true);
         try {
-          const results = await api.search(searchQuery, 'task');
-          setSearchResults(results);
-          setNoSearchResults(results.length === 0);
+          const page = await api.searchPage(searchQuery, 'task');
+          setSearchResults(page.results);
+          setSearchCursor(page.nextCursor);
+          setNoSearchResults(page.results.length === 0);
         } catch (error) {
           console.error("Search failed:", error);
           setSearchResults([]);
@@ -34,6 +36,7 @@ const TasksPage: React.FC<TasksPageProps> = ({ data, onDataUpdate, onOpenTask, o
         }
       } else {
         setSearchResults([]);
+        setSearchCursor(null);
         setNoSearchResults(false);
       }
     }, 300); // 300ms debounce
@@ -55,6 +58,17 @@ const TasksPage: React.FC<TasksPageProps> = ({ data, onDataUpdate, onOpenTask, o
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
+  const handleLoadMoreResults = async () => {
+    if (!searchCursor) return;
+    try {
+      const page = await api.searchPage(searchQuery, 'task', searchCursor);
+      setSearchResults(prev => [...prev, ...page.results]);
+      setSearchCursor(page.nextCursor);
+    } catch (error) {
+      console.error("Search failed:", error);
+    }
+  };
+
   const handleOpenResult = (result: SearchResult) => {
     if (!data) return;
     if (result.type === 'task') {
@@ -129,6 +143,14 @@ const TasksPage: React.FC<TasksPageProps> = ({ data, onDataUpdate, onOpenTask, o
                     )}
                 </button>
                 ))}
+                {searchCursor && (
+                <button
+                    onClick={handleLoadMoreResults}
+                    className="w-full p-2 text-sm font-medium text-primary hover:bg-slate-50 dark:hover:bg-slate-700 transition-colors"
+                >
+                    Show more results
+                </button>
+                )}
             </div>
             )}
             {searchQuery.length > 1 && !isSearchLoading && noSearchResults && (
@@ -1,3 +1,5 @@
+import { Bootstrap, SearchPage, SyncChanges } from '../types';
+
 const BASE_URL = import.meta.env.VITE_API_URL || 'http://127.0.0.1:5000/api/v1';
 
 const getAuthToken = (): string | null => {
@@ -8,7 +10,47 @@ const setAuthToken = (token: string) => {
     localStorage.setItem('focusflow_token', token);
 };
 
-const apiFetch = async (url: string, options: RequestInit = {}) => {
+const setTokens = (data: { access_token: string; refresh_token?: string }) => {
+    setAuthToken(data.access_token);
+    if (data.refresh_token) {
+        localStorage.setItem('focusflow_refresh_token', data.refresh_token);
+    }
+};
+
+// Access tokens are short-lived; exchange the stored refresh token for a new pair.
+const rotateRefreshToken = async (): Promise<boolean> => {
+    const refreshToken = localStorage.getItem('focusflow_refresh_token');
+    if (!refreshToken) {
+        return false;
+    }
+    const response = await fetch(`${BASE_URL}/users/refresh`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ refresh_token: refreshToken }),
+    });
+    if (!response.ok) {
+        localStorage.removeItem('focusflow_refresh_token');
+        return false;
+    }
+    setTokens(await response.json());
+    return true;
+};
+
+// Requests that get a 401 together share one refresh: the refresh token is
+// single-use, and the server treats a second rotation of it as a replay and
+// revokes the whole session.
+let refreshInFlight: Promise<boolean> | null = null;
+
+const refreshTokens = (): Promise<boolean> => {
+    if (!refreshInFlight) {
+        refreshInFlight = rotateRefreshToken().finally(() => {
+            refreshInFlight = null;
+        });
+    }
+    return refreshInFlight;
+};
+
+const apiRequest = async (url: string, options: RequestInit = {}, retry = true): Promise<Response> => {
     const token = getAuthToken();
     const headers = {
         'Content-Type': 'application/json',
@@ -25,6 +67,10 @@ const apiFetch = async (url: string, options: RequestInit = {}) => {
     });
 
     if (!response.ok) {
+        // Another request may have refreshed the token while this one was in flight.
+        if (response.status === 401 && retry && (getAuthToken() !== token || await refreshTokens())) {
+            return apiRequest(url, options, false);
+        }
         // If unauthorized, clear token and notify app to logout
         if (response.status === 401) {
             localStorage.removeItem('focusflow_token');
@@ -34,6 +80,11 @@ const apiFetch = async (url: string, options: RequestInit = {}) => {
         throw new Error(errorData.detail || 'An unknown error occurred');
     }
 
+    return response;
+};
+
+const apiFetch = async (url: string, options: RequestInit = {}) => {
+    const response = await apiRequest(url, options);
     return response.json();
 };
 
@@ -49,7 +100,7 @@ export const api = {
             throw new Error(errorData.detail || 'An unknown error occurred');
         }
         const data = await response.json();
-        setAuthToken(data.access_token);
+        setTokens(data);
         return data;
     },
 
@@ -58,7 +109,7 @@ export const api = {
             method: 'POST',
             body: JSON.stringify({ email, full_name: fullName, password }),
         });
-        setAuthToken(data.access_token);
+        setTokens(data);
         return data;
     },
 
@@ -66,6 +117,16 @@ export const api = {
         return apiFetch('/users/me');
     },
 
+    // The user, areas, tasks and notes in one request.
+    getBootstrap: async (): Promise<Bootstrap> => {
+        return apiFetch('/bootstrap');
+    },
+
+    // What changed since `since` (the sync_cursor of getBootstrap or the cursor of the last sync).
+    sync: async (since: string): Promise<SyncChanges> => {
+        return apiFetch(`/sync?since=${encodeURIComponent(since)}`);
+    },
+
     // Areas
     getAreas: async () => {
         return apiFetch('/areas/');
@@ -137,4 +198,20 @@ export const api = {
         }
         return apiFetch(`/search/?query=${encodeURIComponent(query)}`);
     },
+
+    // One page of search results; pass the returned nextCursor to get the next one.
+    searchPage: async (query: string, item_type: string, cursor?: string | null): Promise<SearchPage> => {
+        let url = `/search/?query=${encodeURIComponent(query)}`;
+        if (item_type) {
+            url += `&item_type=${encodeURIComponent(item_type)}`;
+        }
+        if (cursor) {
+            url += `&cursor=${encodeURIComponent(cursor)}`;
+        }
+        const response = await apiRequest(url);
+        return {
+            results: await response.json(),
+            nextCursor: response.headers?.get('X-Next-Cursor') ?? null,
+        };
+    },
 };
\ No newline at end of file
@@ -0,0 +1,22 @@
+import { AppData, SyncChanges } from '../types';
+
+type Row = { id: any };
+
+// Changed rows replace their old versions and come first, newest first, as the list endpoints order them.
+const merge = <T extends Row>(rows: T[], changed: T[], deleted: number[]): T[] => {
+    const replaced = new Set([...deleted, ...changed.map(row => row.id)]);
+    return [...changed].reverse().concat(rows.filter(row => !replaced.has(row.id)));
+};
+
+// Apply a /sync response to the data on screen.
+export const applySync = (data: AppData, changes: SyncChanges): AppData => {
+    if (changes.full) {
+        return { ...data, areas: changes.areas, tasks: changes.tasks, notes: changes.notes };
+    }
+    return {
+        ...data,
+        areas: merge(data.areas, changes.areas, changes.deleted.areas).sort((a, b) => a.id - b.id),
+        tasks: merge(data.tasks, changes.tasks, changes.deleted.tasks),
+        notes: merge(data.notes, changes.notes, changes.deleted.notes),
+    };
+};
@@ -49,10 +49,7 @@ describe('App Component', () => {
 
   it('fetches data and renders dashboard on successful login', async () => {
     localStorage.setItem('focusflow_token', 'test-token');
-    (api.getUser as vi.Mock).mockResolvedValue(mockData.user);
-    (api.getAreas as vi.Mock).mockResolvedValue(mockData.areas);
-    (api.getTasks as vi.Mock).mockResolvedValue(mockData.tasks);
-    (api.getNotes as vi.Mock).mockResolvedValue(mockData.notes);
+    (api.getBootstrap as vi.Mock).mockResolvedValue({ ...mockData, cursors: {}, sync_cursor: 'sync-1' });
 
     render(<App />);
 
@@ -65,10 +62,7 @@ describe('App Component', () => {
 
   it('logs out and returns to login page', async () => {
     localStorage.setItem('focusflow_token', 'test-token');
-    (api.getUser as vi.Mock).mockResolvedValue(mockData.user);
-    (api.getAreas as vi.Mock).mockResolvedValue(mockData.areas);
-    (api.getTasks as vi.Mock).mockResolvedValue(mockData.tasks);
-    (api.getNotes as vi.Mock).mockResolvedValue(mockData.notes);
+    (api.getBootstrap as vi.Mock).mockResolvedValue({ ...mockData, cursors: {}, sync_cursor: 'sync-1' });
 
     render(<App />);
 
@@ -85,11 +79,13 @@ describe('App Component', () => {
 
   it('opens and saves a new task', async () => {
     localStorage.setItem('focusflow_token', 'test-token');
-    (api.getUser as vi.Mock).mockResolvedValue(mockData.user);
-    (api.getAreas as vi.Mock).mockResolvedValue(mockData.areas);
-    (api.getTasks as vi.Mock).mockResolvedValue(mockData.tasks);
-    (api.getNotes as vi.Mock).mockResolvedValue(mockData.notes);
+    (api.getBootstrap as vi.Mock).mockResolvedValue({ ...mockData, cursors: {}, sync_cursor: 'sync-1' });
     (api.createTask as vi.Mock).mockResolvedValue({});
+    (api.sync as vi.Mock).mockResolvedValue({
+      areas: [], notes: [], full: false, cursor: 'sync-2',
+      tasks: [{ id: 2, title: 'A brand new task', area_id: 1, completed: false, priority: Priority.Medium }],
+      deleted: { areas: [], tasks: [], notes: [] },
+    });
 
     render(<App />);
 
@@ -107,14 +103,14 @@ describe('App Component', () => {
     await waitFor(() => {
       expect(screen.queryByPlaceholderText('Task title')).not.toBeInTheDocument();
     });
+    // Only the changes are fetched after the save.
+    expect(api.sync).toHaveBeenCalledWith('sync-1');
+    expect(api.getBootstrap).toHaveBeenCalledTimes(1);
   });
 
   it('navigates between pages', async () => {
     localStorage.setItem('focusflow_token', 'test-token');
-    (api.getUser as vi.Mock).mockResolvedValue(mockData.user);
-    (api.getAreas as vi.Mock).mockResolvedValue(mockData.areas);
-    (api.getTasks as vi.Mock).mockResolvedValue(mockData.tasks);
-    (api.getNotes as vi.Mock).mockResolvedValue(mockData.notes);
+    (api.getBootstrap as vi.Mock).mockResolvedValue({ ...mockData, cursors: {}, sync_cursor: 'sync-1' });
 
     render(<App />);
 
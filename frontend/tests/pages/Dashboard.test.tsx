@@ -81,7 +81,7 @@ describe('Dashboard Page', () => {
 
   it('triggers search and displays results', async () => {
     const searchResults: SearchResult[] = [{ id: 1, type: 'task', title: 'Work Task 1' }];
-    (api.search as vi.Mock).mockResolvedValue(searchResults);
+    (api.searchPage as vi.Mock).mockResolvedValue({ results: searchResults, nextCursor: null });
 
     render(<Dashboard data={mockData} onNavigate={onNavigate} onNewTask={onNewTask} onNewNote={onNewNote} onOpenTask={onOpenTask} onOpenNote={onOpenNote} />);
 
@@ -97,8 +97,27 @@ describe('Dashboard Page', () => {
     expect(onOpenTask).toHaveBeenCalledWith(mockData.tasks[0]);
   });
 
+  it('loads the next page of search results', async () => {
+    (api.searchPage as vi.Mock)
+      .mockResolvedValueOnce({ results: [{ id: 1, type: 'task', title: 'Work Task 1' }], nextCursor: 'c1' })
+      .mockResolvedValueOnce({ results: [{ id: 1, type: 'note', title: 'Work Note 1', content: '' }], nextCursor: null });
+
+    render(<Dashboard data={mockData} onNavigate={onNavigate} onNewTask={onNewTask} onNewNote={onNewNote} onOpenTask={onOpenTask} onOpenNote={onOpenNote} />);
+
+    await userEvent.type(screen.getByPlaceholderText('Search all...'), 'Work');
+    await waitForDebounce();
+
+    await userEvent.click(await screen.findByText('Show more results'));
+
+    await waitFor(() => {
+      expect(screen.getByText('Work Note 1')).toBeInTheDocument();
+    });
+    expect(api.searchPage).toHaveBeenLastCalledWith('Work', 'all', 'c1');
+    expect(screen.queryByText('Show more results')).not.toBeInTheDocument();
+  });
+
   it('displays no results message', async () => {
-    (api.search as vi.Mock).mockResolvedValue([]);
+    (api.searchPage as vi.Mock).mockResolvedValue({ results: [], nextCursor: null });
 
     render(<Dashboard data={mockData} onNavigate={onNavigate} onNewTask={onNewTask} onNewNote={onNewNote} onOpenTask={onOpenTask} onOpenNote={onOpenNote} />);
 
@@ -91,6 +91,45 @@ describe('API Service', () => {
       expect(localStorage.getItem('focusflow_token')).toBeNull();
     });
 
+    it('refreshes the access token on 401 and retries once', async () => {
+      localStorage.setItem('focusflow_token', 'expired-token');
+      localStorage.setItem('focusflow_refresh_token', 'refresh-1');
+      const user = { email: 'test@test.com', full_name: 'Test' };
+      mockFetch
+        .mockResolvedValueOnce({ ok: false, status: 401, json: async () => ({ detail: 'Unauthorized' }) })
+        .mockResolvedValueOnce({ ok: true, json: async () => ({ access_token: 'fresh-token', refresh_token: 'refresh-2' }) })
+        .mockResolvedValueOnce({ ok: true, json: async () => user });
+
+      const result = await api.getUser();
+
+      expect(result).toEqual(user);
+      expect(mockFetch).toHaveBeenNthCalledWith(2, expect.stringContaining('/users/refresh'), expect.any(Object));
+      expect(localStorage.getItem('focusflow_token')).toBe('fresh-token');
+      expect(localStorage.getItem('focusflow_refresh_token')).toBe('refresh-2');
+    });
+
+    it('parallel 401s share one refresh', async () => {
+      localStorage.setItem('focusflow_token', 'expired-token');
+      localStorage.setItem('focusflow_refresh_token', 'refresh-1');
+      mockFetch.mockImplementation(async (url: string, options: RequestInit) => {
+        if (url.endsWith('/users/refresh')) {
+          return { ok: true, json: async () => ({ access_token: 'fresh-token', refresh_token: 'refresh-2' }) };
+        }
+        const headers = options.headers as Record<string, string>;
+        if (headers['Authorization'] !== 'Bearer fresh-token') {
+          return { ok: false, status: 401, json: async () => ({ detail: 'Unauthorized' }) };
+        }
+        return { ok: true, json: async () => ({ email: 'test@test.com' }) };
+      });
+
+      const results = await Promise.all([api.getUser(), api.getUser(), api.getUser()]);
+
+      expect(results).toHaveLength(3);
+      const refreshes = mockFetch.mock.calls.filter(([url]) => String(url).endsWith('/users/refresh'));
+      expect(refreshes).toHaveLength(1);
+      expect(localStorage.getItem('focusflow_refresh_token')).toBe('refresh-2');
+    });
+
     it('getUser fetches user data', async () => {
         const user = { email: 'test@test.com', full_name: 'Test' };
         mockFetch.mockResolvedValueOnce({
@@ -100,6 +139,18 @@ describe('API Service', () => {
         const result = await api.getUser();
         expect(result).toEqual(user);
     });
+
+    it('getBootstrap loads everything in one request', async () => {
+        const data = { user: { email: 'test@test.com' }, areas: [], tasks: [], notes: [], cursors: {} };
+        mockFetch.mockResolvedValueOnce({
+            ok: true,
+            json: async () => data,
+        });
+        const result = await api.getBootstrap();
+        expect(result).toEqual(data);
+        expect(mockFetch).toHaveBeenCalledTimes(1);
+        expect(mockFetch).toHaveBeenCalledWith(expect.stringContaining('/bootstrap'), expect.any(Object));
+    });
   });
 
   describe('Areas', () => {
@@ -210,6 +261,18 @@ describe('API Service', () => {
         expect(result).toEqual(searchResults);
     });
 
+    it('searchPage passes the cursor and returns the next one', async () => {
+        const searchResults = [{ title: 'Result' }];
+        mockFetch.mockResolvedValueOnce({
+            ok: true,
+            json: async () => searchResults,
+            headers: new Headers({ 'X-Next-Cursor': 'next' }),
+        });
+        const page = await api.searchPage('test', 'all', 'abc');
+        expect(mockFetch).toHaveBeenCalledWith(expect.stringContaining('/search/?query=test&item_type=all&cursor=abc'), expect.any(Object));
+        expect(page).toEqual({ results: searchResults, nextCursor: 'next' });
+    });
+
     it('search with only query', async () => {
         const searchResults = [{ title: 'Result' }];
         mockFetch.mockResolvedValueOnce({
@@ -0,0 +1,44 @@
+import { describe, it, expect } from 'vitest';
+import { applySync } from '../../services/sync';
+import { AppData, SyncChanges } from '../../types';
+
+const data = {
+  user: { id: 1, full_name: 'Test User', email: 'test@example.com' },
+  areas: [{ id: 1, name: 'Work' }, { id: 2, name: 'Home' }],
+  tasks: [{ id: 3, title: 'c' }, { id: 2, title: 'b' }, { id: 1, title: 'a' }],
+  notes: [{ id: 1, title: 'n' }],
+} as unknown as AppData;
+
+const noChanges: SyncChanges = {
+  areas: [], tasks: [], notes: [], deleted: { areas: [], tasks: [], notes: [] }, full: false, cursor: 'c',
+};
+
+describe('applySync', () => {
+  it('keeps everything when nothing changed', () => {
+    expect(applySync(data, noChanges)).toEqual(data);
+  });
+
+  it('puts changed rows first, newest first, and drops deleted ones', () => {
+    const changes = {
+      ...noChanges,
+      tasks: [{ id: 1, title: 'a2' }, { id: 4, title: 'd' }],
+      deleted: { areas: [2], tasks: [2], notes: [1] },
+    } as unknown as SyncChanges;
+
+    const result = applySync(data, changes);
+
+    expect(result.tasks.map(t => t.title)).toEqual(['d', 'a2', 'c']);
+    expect(result.areas.map(a => a.id)).toEqual([1]);
+    expect(result.notes).toEqual([]);
+    expect(result.user).toBe(data.user);
+  });
+
+  it('replaces everything on a full sync', () => {
+    const changes = { ...noChanges, full: true, tasks: [{ id: 9, title: 'z' }] } as unknown as SyncChanges;
+
+    const result = applySync(data, changes);
+
+    expect(result.tasks.map(t => t.id)).toEqual([9]);
+    expect(result.areas).toEqual([]);
+  });
+});
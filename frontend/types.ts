@@ -51,6 +51,22 @@ export interface AppData {
   areas: Area[];
 }
 
+// GET /bootstrap: AppData plus list cursors for the collections cut off by `limit`.
+export interface Bootstrap extends AppData {
+  cursors: Partial<Record<'areas' | 'tasks' | 'notes', string>>;
+  sync_cursor: string;
+}
+
+// GET /sync: what changed since a cursor. With `full`, everything the user has.
+export interface SyncChanges {
+  areas: Area[];
+  tasks: Task[];
+  notes: Note[];
+  deleted: { areas: number[]; tasks: number[]; notes: number[] };
+  full: boolean;
+  cursor: string;
+}
+
 export interface TaskSearchResult {
   id: number;
   title: string;
@@ -67,4 +83,9 @@ export interface NoteSearchResult {
   type: "note";
 }
 
-export type SearchResult = TaskSearchResult | NoteSearchResult;
\ No newline at end of file
+export type SearchResult = TaskSearchResult | NoteSearchResult;
+
+export interface SearchPage {
+  results: SearchResult[];
+  nextCursor: string | null;
+}